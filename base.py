@@ -17,6 +17,7 @@ limitations under the License.
 from __future__ import print_function
 
 import datetime
+import functools
 import re
 from civics_cdf_validator import loggers
 from civics_cdf_validator import stats
@@ -28,6 +29,11 @@ class SchemaHandler(object):
   _XSCHEMA_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
   _XSCHEMA_INSTANCE_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
   _TYPE_ATTRIB = "{%s}type" % (_XSCHEMA_INSTANCE_NAMESPACE)
+  # Descendants with a given xsi:type, compiled once for every type name.
+  _XSI_TYPE_XPATH = etree.XPath(
+      ".//*[@xsi:type = $element_name]",
+      namespaces={"xsi": _XSCHEMA_INSTANCE_NAMESPACE},
+  )
 
   def get_element_class(self, element):
     """Return the class of the element."""
@@ -52,9 +58,7 @@ class SchemaHandler(object):
     # find all the tags that match element_name
     elements = element.findall(".//" + element_name)
     # next find all elements where the type is element_name
-    elements += element.xpath(
-        ".//*[@xsi:type ='%s']" % (element_name),
-        namespaces={"xsi": self._XSCHEMA_INSTANCE_NAMESPACE})
+    elements += self._XSI_TYPE_XPATH(element, element_name=element_name)
     return elements
 
 
@@ -242,9 +246,22 @@ class PartialDate():
       r"^(?P<year>[0-9]{4})(?:-(?P<month>[0-9]{2}))?(?:-(?P<day>[0-9]{2}))?$")
 
   def __init__(self, year=None, month=None, day=None):
-    self.year = year
-    self.month = month
-    self.day = day
+    self._year = year
+    self._month = month
+    self._day = day
+
+  # Read-only, since init_partial_date shares cached instances between callers.
+  @property
+  def year(self):
+    return self._year
+
+  @property
+  def month(self):
+    return self._month
+
+  @property
+  def day(self):
+    return self._day
 
   def __str__(self):
     if self.is_only_year_date():
@@ -258,8 +275,13 @@ class PartialDate():
       return "Not defined"
 
   @classmethod
+  @functools.lru_cache(maxsize=4096)
   def init_partial_date(cls, date_string):
-    """Initializing partial date."""
+    """Initializing partial date.
+
+    Feeds repeat the same date strings many times, so results are cached and
+    shared between callers. PartialDate fields are read-only for that reason.
+    """
     match_object = re.match(cls.REGEX_PATTERN, date_string)
     if match_object is None:
       return None
@@ -465,10 +487,11 @@ class RulesRegistry(SchemaHandler):
     for _, element in etree.iterwalk(self.election_tree, events=("end",)):
       tag = self.get_element_class(element)
 
-      if not tag or tag not in self.registry:
+      element_rules = self.registry.get(tag) if tag else None
+      if not element_rules:
         continue
 
-      for element_rule in self.registry[tag]:
+      for element_rule in element_rules:
         try:
           element_rule.check(element)
         except loggers.ElectionException as e:
@@ -24,9 +24,12 @@ import re
 import shutil
 
 from civics_cdf_validator import loggers
-import github
 import pycountry
-import requests
+
+# Lowercase ISO 3166-1 alpha-2 codes, shared with rules.py.
+COUNTRY_CODES = frozenset(
+    country.alpha_2.lower() for country in pycountry.countries
+)
 
 
 class GpUnitOcdIdValidator(object):
@@ -59,7 +62,8 @@ class GpUnitOcdIdValidator(object):
       self.ocd_ids = frozenset(ocd_id_list)
     else:
       extractor = OcdIdsExtractor(country_code, local_file, check_github)
-      self.ocd_ids = extractor.extract()
+      self.ocd_ids = frozenset(extractor.extract())
+    self._ocd_id_validity = {}
 
   def is_valid_ocd_id(self, ocd_id):
     """Check whether the given OCD ID is valid.
@@ -76,26 +80,27 @@ class GpUnitOcdIdValidator(object):
       True if the OCD ID is valid. False otherwise.
     """
     ocd_id = str(ocd_id)
-    return (
-        ocd_id in self.ocd_ids
-        and self.OCD_MATCHER.match(ocd_id)
-        and self.is_valid_country_code(ocd_id)
-    )
+    # The same OCD IDs are referenced by many contests, so cache the result.
+    is_valid = self._ocd_id_validity.get(ocd_id)
+    if is_valid is None:
+      is_valid = bool(
+          ocd_id in self.ocd_ids
+          and self.OCD_MATCHER.match(ocd_id)
+          and self.is_valid_country_code(ocd_id)
+      )
+      self._ocd_id_validity[ocd_id] = is_valid
+    return is_valid
 
   @classmethod
   def is_valid_country_code(cls, ocd_id):
     """Check whether country code in the given OCD ID is valid."""
-    match_object = re.match(cls.OCD_PATTERN, ocd_id)
+    match_object = cls.OCD_MATCHER.match(ocd_id)
     if match_object is None:
       return False
-    country_code = match_object.groupdict().get("country_code")
+    country_code = match_object.group("country_code")
     if "region" in country_code:
       return True
-    code = country_code.split(":")[1]
-    for country in pycountry.countries:
-      if code == country.alpha_2.lower():
-        return True
-    return False
+    return country_code.split(":")[1] in COUNTRY_CODES
 
   @classmethod
   def is_country_or_region_ocd_id(cls, ocd_id):
@@ -147,8 +152,7 @@ class OcdIdsExtractor(object):
 
       if not os.path.exists(countries_filename):
         # Only initialize `github_repo` if there's no cached file.
-        github_api = github.Github()
-        self.github_repo = github_api.get_repo(self.GITHUB_REPO)
+        self.github_repo = self._get_github_repo()
         if not os.path.exists(cache_directory):
           os.makedirs(cache_directory)
         self._download_data(countries_filename)
@@ -162,8 +166,7 @@ class OcdIdsExtractor(object):
 
           # If 1 hour has elapsed, check GitHub for the last file update.
           if (seconds_since_mod / 3600) > 1:
-            github_api = github.Github()
-            self.github_repo = github_api.get_repo(self.GITHUB_REPO)
+            self.github_repo = self._get_github_repo()
             # Re-download the file if the file on GitHub was updated.
             if last_mod_date < self._get_latest_commit_date():
               self._download_data(countries_filename)
@@ -176,6 +179,13 @@ class OcdIdsExtractor(object):
 
     return ocd_id_codes
 
+  def _get_github_repo(self):
+    """Returns the GitHub repository hosting the OCD ID files."""
+    # PyGithub is slow to import and only needed when the OCD ID file has to
+    # be fetched or refreshed, so it is imported on first use.
+    import github  # pylint: disable=g-import-not-at-top
+    return github.Github().get_repo(self.GITHUB_REPO)
+
   def _get_latest_commit_date(self):
     """Returns the latest commit date to country-*.csv."""
     latest_commit = self.github_repo.get_commits(
@@ -187,6 +197,7 @@ class OcdIdsExtractor(object):
     """Makes a request to Github to download the file."""
     ocdid_url = "https://raw.github.com/{0}/master/{1}/{2}".format(
         self.GITHUB_REPO, self.GITHUB_DIR, self.github_file)
+    import requests  # pylint: disable=g-import-not-at-top
     r = requests.get(ocdid_url)
     with io.open("{0}.tmp".format(file_path), "wb") as fd:
       for chunk in r.iter_content():
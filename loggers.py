@@ -20,6 +20,8 @@ import copy
 class LogEntry(object):
   """This class contains needed information for user output."""
 
+  __slots__ = ("message", "elements", "lines")
+
   def __init__(self, message, elements=None, lines=None):
     self.message = message
     self.elements = elements
@@ -47,6 +49,9 @@ class ElectionException(Exception):
     else:
       self.log_entry = [log_entry]
 
+  def __str__(self):
+    return "\n".join(str(entry.message) for entry in self.log_entry)
+
   @classmethod
   def from_message(cls, message, elements=None, lines=None):
     return cls(LogEntry(message, elements, lines))
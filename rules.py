@@ -29,7 +29,6 @@ from frozendict import frozendict
 import language_tags
 from lxml import etree
 import networkx
-import pycountry
 from six.moves.urllib.parse import urlparse
 
 _PARTY_LEADERSHIP_TYPES = ["party-leader-id", "party-chair-id"]
@@ -77,6 +76,28 @@ _EXECUTIVE_OFFICE_ROLES = frozenset([
     "deputy head of government",
 ])
 
+# Direct ExternalIdentifier children of an entity, compiled once.
+_EXTERNAL_IDENTIFIER_XPATH = etree.XPath(
+    "./ExternalIdentifiers/ExternalIdentifier", smart_strings=False
+)
+
+# Names of the schema elements declared as IDREF or IDREFS.
+_IDREF_SCHEMA_ELEMENT_NAMES_XPATH = etree.XPath(
+    "//xs:element[@type='xs:IDREF' or @type='xs:IDREFS']/@name",
+    namespaces={"xs": "http://www.w3.org/2001/XMLSchema"},
+    smart_strings=False,
+)
+
+# The ISO 3166-1 alpha-2 codes plus "eu", which is not an ISO 3166-1 country
+# but is exceptionally reserved by ISO 3166/MA. OCD-IDs in gpunit_rules do not
+# accept it.
+_VALID_COUNTRY_CODES = gpunit_rules.COUNTRY_CODES | frozenset(["eu"])
+
+# Key identifying a Person by full name and birthday.
+_PersonDefinition = collections.namedtuple(
+    "PersonDefinition", ["fullname", "birthday"]
+)
+
 _VALID_FEED_LONGEVITY_BY_FEED_TYPE = frozendict({
     "committee": ["evergreen"],
     "election-dates": ["evergreen"],
@@ -101,7 +122,15 @@ def _get_government_body(element):
 
 def get_external_id_values(element, value_type, return_elements=False):
   """Helper to gather all Values of external ids for a given type."""
-  external_ids = element.findall(".//ExternalIdentifier")
+  return _get_values_of_external_ids(
+      element.iter("ExternalIdentifier"),
+      value_type,
+      return_elements,
+  )
+
+
+def _get_values_of_external_ids(external_ids, value_type, return_elements):
+  """Gathers the Values of the given ExternalIdentifiers for a given type."""
   values = []
   for extern_id in external_ids:
     id_type = extern_id.find("Type")
@@ -190,11 +219,7 @@ def element_has_text(element):
 
 
 def country_code_is_valid(country_code):
-  # EU is part of ISO 3166/MA
-  return (
-      country_code.lower() == "eu"
-      or pycountry.countries.get(alpha_2=country_code.upper()) is not None
-  )
+  return country_code.lower() in _VALID_COUNTRY_CODES
 
 
 class Schema(base.TreeRule):
@@ -464,10 +489,7 @@ class ValidIDREF(base.BaseRule):
 class ValidStableID(base.BaseRule):
   """Ensure stable-ids are in the correct format."""
 
-  def __init__(self, election_tree, schema_tree, **kwargs):
-    super(ValidStableID, self).__init__(election_tree, schema_tree, **kwargs)
-    regex = r"^[a-zA-Z0-9_-]+$"
-    self.stable_id_matcher = re.compile(regex, flags=re.U)
+  stable_id_matcher = re.compile(r"^[a-zA-Z0-9_-]+$", flags=re.U)
 
   def elements(self):
     return ["ExternalIdentifiers"]
@@ -494,11 +516,10 @@ class ElectoralDistrictOcdId(base.BaseRule):
     self._all_gpunits = {}
 
   def setup(self):
-    gp_units = self.election_tree.findall(".//GpUnit")
-    for gp_unit in gp_units:
-      if "objectId" not in gp_unit.attrib:
-        continue
-      self._all_gpunits[gp_unit.attrib["objectId"]] = gp_unit
+    for gp_unit in self.election_tree.iter("GpUnit"):
+      object_id = gp_unit.get("objectId")
+      if object_id is not None:
+        self._all_gpunits[object_id] = gp_unit
 
   def elements(self):
     return ["ElectoralDistrictId"]
@@ -586,7 +607,7 @@ class DuplicateGpUnits(base.BaseRule):
     children = {}
     object_ids = set()
     error_log = []
-    for gpunit in element.findall("GpUnit"):
+    for gpunit in element.iterchildren("GpUnit"):
       object_id = gpunit.get("objectId")
       if not object_id:
         continue
@@ -599,7 +620,7 @@ class DuplicateGpUnits(base.BaseRule):
       if composing_gpunits is None or not composing_gpunits.text:
         continue
       composing_ids = frozenset(composing_gpunits.text.split())
-      if children.get(composing_ids):
+      if composing_ids in children:
         error_log.append(
             loggers.LogEntry("GpUnits {} are duplicates".format(
                 str((children[composing_ids], object_id)))))
@@ -1091,6 +1112,8 @@ class PartiesHaveValidColors(base.BaseRule):
   within this class and returned to the user as a warning.
   """
 
+  hex_color_matcher = re.compile(r"^([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$")
+
   def elements(self):
     return ["Party"]
 
@@ -1113,7 +1136,7 @@ class PartiesHaveValidColors(base.BaseRule):
           "%s is not a valid hex color." % color_val,
           [colors[0]],
       )
-    if not re.match("^([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$", color_val):
+    if not self.hex_color_matcher.match(color_val):
       raise loggers.ElectionWarning.from_message(
           "%s should be a hexadecimal less than 16^6." % color_val, [colors[0]]
       )
@@ -1131,8 +1154,6 @@ class PersonHasUniqueFullName(base.BaseRule):
     return ["PersonCollection"]
 
   def check_specific(self, people):
-    person_def = collections.namedtuple("PersonDefinition",
-                                        ["fullname", "birthday"])
     person_id_to_object_id = {}
 
     info_log = []
@@ -1145,7 +1166,7 @@ class PersonHasUniqueFullName(base.BaseRule):
         birthday_val = date_of_birthday.text
 
       for full_name_val in full_name_list:
-        person_id = person_def(full_name_val, birthday_val)
+        person_id = _PersonDefinition(full_name_val, birthday_val)
         if person_id in person_id_to_object_id and person_id_to_object_id[
             person_id] != person_object_id:
           info_message = (
@@ -1172,6 +1193,7 @@ class BadCharactersInPersonFullName(base.BaseRule):
   """A person Fullname should not include bad characters."""
 
   regex = r"([()@$%*/]|\balias\b)"
+  bad_characters_matcher = re.compile(regex, flags=re.U)
 
   def elements(self):
     return ["Person"]
@@ -1180,10 +1202,9 @@ class BadCharactersInPersonFullName(base.BaseRule):
     warning_message = ("Person has known bad characters in FullName field."
                        " Aliases should be included in Nickname field.")
     fullname = extract_person_fullname(element)
-    person_fullname = re.compile(self.regex, flags=re.U)
     bad_characters_match = None
     for name in fullname:
-      bad_characters_match = re.search(person_fullname, name.lower())
+      bad_characters_match = self.bad_characters_matcher.search(name.lower())
     if bad_characters_match:
       if "alias" in bad_characters_match.group():
         raise loggers.ElectionWarning.from_message(warning_message, [element])
@@ -1544,10 +1565,9 @@ class MissingStableIds(base.BaseRule):
     ]
 
   def check(self, element):
-    stable_ids = []
-    external_identifiers = element.find("ExternalIdentifiers")
-    if external_identifiers is not None:
-      stable_ids = get_external_id_values(external_identifiers, "stable")
+    stable_ids = _get_values_of_external_ids(
+        _EXTERNAL_IDENTIFIER_XPATH(element), "stable", False
+    )
     if not stable_ids:
       raise loggers.ElectionError.from_message(
           "The element is missing a stable id", [element])
@@ -3586,25 +3606,22 @@ class AffiliationEndDateOccursAfterStartDate(base.DateRule):
 class EinMatchesFormat(base.BaseRule):
   """EIN id should be in the following format: XX-XXXXXXX."""
 
-  def __init__(self, election_tree, schema_tree, **kwargs):
-    super(EinMatchesFormat, self).__init__(election_tree, schema_tree, **kwargs)
-    regex = r"\d{2}(-\d{7})?"
-    self.ein_id_matcher = re.compile(regex, flags=re.U)
+  ein_id_matcher = re.compile(r"\d{2}(-\d{7})?", flags=re.U)
 
   def elements(self):
     return ["Committee"]
 
   def check(self, element):
-    external_identifiers = element.find("ExternalIdentifiers")
-    if external_identifiers is not None:
-      ein_ids = get_external_id_values(external_identifiers, "ein")
-      if ein_ids:
-        e_id = ein_ids.pop()
-        if not self.ein_id_matcher.match(e_id):
-          raise loggers.ElectionError.from_message(
-              "EIN id '{}' is not in the correct format.".format(e_id),
-              [element],
-          )
+    ein_ids = _get_values_of_external_ids(
+        _EXTERNAL_IDENTIFIER_XPATH(element), "ein", False
+    )
+    if ein_ids:
+      e_id = ein_ids.pop()
+      if not self.ein_id_matcher.match(e_id):
+        raise loggers.ElectionError.from_message(
+            "EIN id '{}' is not in the correct format.".format(e_id),
+            [element],
+        )
 
 
 class AffiliationHasEitherPartyOrPerson(base.BaseRule):
@@ -3661,12 +3678,15 @@ class FeedIdsAreUnique(base.BaseRule):
     return ["FeedCollection"]
 
   def check(self, element):
-    feed_ids = set()
+    # Maps each FeedId to the first Feed that declared it.
+    first_feed_by_id = {}
     error_log = []
-    for feed_element in element.findall("Feed"):
-      if element_has_text(feed_element.find("FeedId")):
-        feed_id = feed_element.find("FeedId").text
-        if feed_id in feed_ids:
+    for feed_element in element.iterchildren("Feed"):
+      feed_id_element = feed_element.find("FeedId")
+      if element_has_text(feed_id_element):
+        feed_id = feed_id_element.text
+        first_feed = first_feed_by_id.get(feed_id)
+        if first_feed is not None:
           msg = (
               "FeedId {} appears multiple times in the metadata feed. Feed ids"
               " must be unique.".format(feed_id)
@@ -3674,10 +3694,11 @@ class FeedIdsAreUnique(base.BaseRule):
           error_log.append(
               loggers.LogEntry(
                   msg,
-                  [feed_element],
+                  [feed_element, first_feed],
               )
           )
-        feed_ids.add(feed_id)
+        else:
+          first_feed_by_id[feed_id] = feed_element
 
     if error_log:
       raise loggers.ElectionError(error_log)
@@ -3690,12 +3711,15 @@ class SourceDirPathsAreUnique(base.BaseRule):
     return ["FeedCollection"]
 
   def check(self, element):
-    source_dir_paths = set()
+    # Maps each SourceDirPath to the first Feed that declared it.
+    first_feed_by_path = {}
     error_log = []
-    for feed_element in element.findall("Feed"):
-      if element_has_text(feed_element.find("SourceDirPath")):
-        source_dir_path = feed_element.find("SourceDirPath").text
-        if source_dir_path in source_dir_paths:
+    for feed_element in element.iterchildren("Feed"):
+      source_dir_path_element = feed_element.find("SourceDirPath")
+      if element_has_text(source_dir_path_element):
+        source_dir_path = source_dir_path_element.text
+        first_feed = first_feed_by_path.get(source_dir_path)
+        if first_feed is not None:
           msg = (
               "SourceDirPath {} appears multiple times in the metadata feed."
               " SourceDirPaths must be unique.".format(source_dir_path)
@@ -3703,10 +3727,11 @@ class SourceDirPathsAreUnique(base.BaseRule):
           error_log.append(
               loggers.LogEntry(
                   msg,
-                  [feed_element],
+                  [feed_element, first_feed],
               )
           )
-        source_dir_paths.add(source_dir_path)
+        else:
+          first_feed_by_path[source_dir_path] = feed_element
 
     if error_log:
       raise loggers.ElectionError(error_log)
@@ -3722,35 +3747,33 @@ class ElectionEventDatesAreSequential(base.DateRule):
     self.reset_instance_vars()
     self.gather_dates(element)
     self.check_end_after_start()
-    if element_has_text(element.find("FullDeliveryDate")) and self.start_date:
+    full_delivery_element = element.find("FullDeliveryDate")
+    if element_has_text(full_delivery_element):
       full_delivery_date = base.PartialDate.init_partial_date(
-          element.find("FullDeliveryDate").text
+          full_delivery_element.text
       )
-      date_delta = self.start_date.is_older_than(full_delivery_date)
-      if date_delta > 0:
-        self.error_log.append(
-            loggers.LogEntry(
-                "StartDate is older than FullDeliveryDate",
-                [element],
-            )
-        )
-    if element_has_text(
-        element.find("InitialDeliveryDate")
-    ) and element_has_text(element.find("FullDeliveryDate")):
-      initial_delivery_date = base.PartialDate.init_partial_date(
-          element.find("InitialDeliveryDate").text
-      )
-      full_delivery_date = base.PartialDate.init_partial_date(
-          element.find("FullDeliveryDate").text
-      )
-      date_delta = full_delivery_date.is_older_than(initial_delivery_date)
-      if date_delta > 0:
-        self.error_log.append(
-            loggers.LogEntry(
-                "FullDeliveryDate is older than InitialDeliveryDate",
-                [element],
-            )
+      if self.start_date:
+        date_delta = self.start_date.is_older_than(full_delivery_date)
+        if date_delta > 0:
+          self.error_log.append(
+              loggers.LogEntry(
+                  "StartDate is older than FullDeliveryDate",
+                  [element],
+              )
+          )
+      initial_delivery_element = element.find("InitialDeliveryDate")
+      if element_has_text(initial_delivery_element):
+        initial_delivery_date = base.PartialDate.init_partial_date(
+            initial_delivery_element.text
         )
+        date_delta = full_delivery_date.is_older_than(initial_delivery_date)
+        if date_delta > 0:
+          self.error_log.append(
+              loggers.LogEntry(
+                  "FullDeliveryDate is older than InitialDeliveryDate",
+                  [element],
+              )
+          )
 
     if self.error_log:
       raise loggers.ElectionError(self.error_log)
@@ -3770,7 +3793,7 @@ class NoSourceDirPathBeforeInitialDeliveryDate(base.BaseRule):
     today_partial_date = base.PartialDate(
         year=today.year, month=today.month, day=today.day
     )
-    initial_deliveries = element.findall(".//InitialDeliveryDate")
+    initial_deliveries = list(element.iter("InitialDeliveryDate"))
     if initial_deliveries:
       for initial_delivery in initial_deliveries:
         initial_delivery_date = (
@@ -3797,14 +3820,16 @@ class OfficeHolderSubFeedDatesAreSequential(base.DateRule):
     return ["OfficeHolderSubFeed"]
 
   def check(self, element):
-    if element_has_text(
-        element.find("InitialDeliveryDate")
-    ) and element_has_text(element.find("FullDeliveryDate")):
+    initial_delivery_element = element.find("InitialDeliveryDate")
+    full_delivery_element = element.find("FullDeliveryDate")
+    if element_has_text(initial_delivery_element) and element_has_text(
+        full_delivery_element
+    ):
       initial_delivery_date = base.PartialDate.init_partial_date(
-          element.find("InitialDeliveryDate").text
+          initial_delivery_element.text
       )
       full_delivery_date = base.PartialDate.init_partial_date(
-          element.find("FullDeliveryDate").text
+          full_delivery_element.text
       )
       date_delta = full_delivery_date.is_older_than(initial_delivery_date)
       if date_delta > 0:
@@ -3891,16 +3916,7 @@ class UnreferencedEntitiesBase(base.TreeRule):
   def _get_idref_elements(self):
     """Returns the names of all XML elements in the schema of type IDREF or IDREFS."""
 
-    idref_elements = set()
-    for _, element in etree.iterwalk(self.schema_tree):
-      tag = self.strip_schema_ns(element)
-      if (
-          tag
-          and tag == "element"
-          and element.get("type") in ("xs:IDREF", "xs:IDREFS")
-      ):
-        idref_elements.add(element.get("name"))
-    return idref_elements
+    return set(_IDREF_SCHEMA_ELEMENT_NAMES_XPATH(self.schema_tree))
 
   def _gather_referenced_entities(self):
     """Create a set of all entities referenced by either IDREF(S) elements or external identifiers."""
@@ -3911,19 +3927,19 @@ class UnreferencedEntitiesBase(base.TreeRule):
       referenced_entities.update(
           get_external_id_values(self.election_tree, external_id_type)
       )
-    for _, element in etree.iterwalk(self.election_tree):
-      tag = self.strip_schema_ns(element)
-      if tag and tag in idref_elements:
+    if idref_elements:
+      # Let lxml filter on the reference tags instead of visiting every node.
+      for element in self.election_tree.iter(*idref_elements):
         referenced_entities.update(element.text.split())
     return referenced_entities
 
   def check(self):
     for _, element in etree.iterwalk(self.election_tree):
-      element_name = element.tag
+      obj_id = element.get("objectId")
       # Skip anything without an object id.
-      if "objectId" not in element.attrib:
+      if obj_id is None:
         continue
-      obj_id = element.get("objectId")
+      element_name = element.tag
       if (
           obj_id not in self.referenced_entities
           and element_name not in self.top_level_entity_types
@@ -188,8 +188,10 @@ class DateRuleTest(absltest.TestCase):
   # check_end_after_start tests
   def testEndDateComesAfterStartDate(self):
     self.date_validator.start_date = self.today_partial_date
-    self.date_validator.end_date = self.date_validator.start_date
-    self.date_validator.end_date.day = self.date_validator.start_date.day + 1
+    start_date = self.date_validator.start_date
+    self.date_validator.end_date = base.PartialDate(
+        start_date.year, start_date.month, start_date.day + 1
+    )
     self.date_validator.check_end_after_start()
 
     self.assertEmpty(self.date_validator.error_log)
@@ -289,6 +291,20 @@ class PartialDateTest(absltest.TestCase):
     partial_date = base.PartialDate.init_partial_date("20313")
     self.assertIsNone(partial_date)
 
+  def testReturnsEqualDatesForRepeatedString(self):
+    first = base.PartialDate.init_partial_date("2021-10-19")
+    second = base.PartialDate.init_partial_date("2021-10-19")
+    self.assertEqual(
+        (first.year, first.month, first.day),
+        (second.year, second.month, second.day),
+    )
+
+  def testPartialDateFieldsAreReadOnly(self):
+    partial_date = base.PartialDate.init_partial_date("2021-10-19")
+    with self.assertRaises(AttributeError):
+      partial_date.day = 20
+    self.assertEqual(19, base.PartialDate.init_partial_date("2021-10-19").day)
+
 
 class MissingFieldRuleTest(absltest.TestCase):
 
@@ -15,6 +15,18 @@ from mock import MagicMock
 from mock import patch
 
 
+# Name of the builtins module, under which open() is patched. It is fixed for
+# the interpreter, so it is looked up once rather than in every setUp.
+_BUILTINS_NAME = inspect.getmodule(open).__builtins__["__name__"]
+
+_DOWNLOADED_OCDID_FILE = "id,name\nocd-division/country:ar,Argentina"
+
+
+def _open_downloaded_ocdid_file(*unused_args, **unused_kwargs):
+  """Stands in for open(), reading the downloaded OCD ID CSV data."""
+  return io.StringIO(_DOWNLOADED_OCDID_FILE)
+
+
 class GpUnitOcdIdValidatorTest(absltest.TestCase):
 
   def testIsValidCountryCodeWithInvalidCountry_returnsFalse(self):
@@ -106,6 +118,19 @@ class GpUnitOcdIdValidatorTest(absltest.TestCase):
     )
     self.assertTrue(ocd_id_validator.is_valid_ocd_id(ocd_value))
 
+  def testIsValidOcdIdCachesResult(self):
+    ocd_value = "ocd-division/country:us/state:la"
+    ocd_id_validator = gpunit_rules.GpUnitOcdIdValidator(
+        "us", None, False, set([ocd_value])
+    )
+    self.assertTrue(ocd_id_validator.is_valid_ocd_id(ocd_value))
+
+    with patch.object(
+        ocd_id_validator, "is_valid_country_code"
+    ) as mock_country_check:
+      self.assertTrue(ocd_id_validator.is_valid_ocd_id(ocd_value))
+    mock_country_check.assert_not_called()
+
   def testIsCountryOrRegionOcdIdWithNonString_returnsFalse(self):
     ocd_value = 1
     self.assertFalse(
@@ -163,6 +188,7 @@ class GpUnitOcdIdValidatorTest(absltest.TestCase):
         ocd_id_validator.ocd_ids,
         set(["ocd-division/country:la", "ocd-division/country:us"]),
     )
+    self.assertIsInstance(ocd_id_validator.ocd_ids, frozenset)
 
 
 class OcdIdsExtractorTest(absltest.TestCase):
@@ -170,15 +196,7 @@ class OcdIdsExtractorTest(absltest.TestCase):
   def setUp(self):
     super(OcdIdsExtractorTest, self).setUp()
     self.ocdid_extractor = gpunit_rules.OcdIdsExtractor()
-
-    open_mod = inspect.getmodule(open)
-    self.builtins_name = open_mod.__builtins__["__name__"]
-
-    # mock open function call to read provided csv data
-    downloaded_ocdid_file = "id,name\nocd-division/country:ar,Argentina"
-    self.mock_open_func = MagicMock(
-        return_value=io.StringIO(downloaded_ocdid_file)
-    )
+    self.builtins_name = _BUILTINS_NAME
 
   def testSetsDefaultValuesUponCreation(self):
     self.assertTrue(self.ocdid_extractor.check_github)
@@ -221,9 +239,7 @@ class OcdIdsExtractorTest(absltest.TestCase):
     commit = github.Commit.Commit(
         None,
         {},
-        dict({
-            "commit": dict({"committer": dict({"date": formatted_commit_date})})
-        }),
+        {"commit": {"committer": {"date": formatted_commit_date}}},
         None,
     )
 
@@ -238,18 +254,27 @@ class OcdIdsExtractorTest(absltest.TestCase):
     mock_get_commits.assert_called_with(path="identifiers/country-ar.csv")
 
   # _download_data tests
+  def _patch_download_calls(self):
+    """Patches the network and file calls made by _download_data.
+
+    The patches are undone when the test finishes.
+
+    Returns:
+      The mocks replacing requests.get, io.open and shutil.copy.
+    """
+    mocks = []
+    for target in ("requests.get", "io.open", "shutil.copy"):
+      patcher = patch(target)
+      mocks.append(patcher.start())
+      self.addCleanup(patcher.stop)
+    return mocks
+
   def testItCopiesDownloadedDataToCacheFileWhenValid(self):
     self.ocdid_extractor.github_file = "country-ar.csv"
     self.ocdid_extractor._verify_data = MagicMock(return_value=True)
-    mock_request = MagicMock()
-    mock_io_open = MagicMock()
-    mock_copy = MagicMock()
+    mock_request, mock_io_open, mock_copy = self._patch_download_calls()
 
-    # pylint: disable=g-backslash-continuation
-    with patch("requests.get", mock_request), patch(
-        "io.open", mock_io_open
-    ), patch("shutil.copy", mock_copy):
-      self.ocdid_extractor._download_data("/usr/cache")
+    self.ocdid_extractor._download_data("/usr/cache")
 
     request_url = "https://raw.github.com/{0}/master/{1}/country-ar.csv".format(
         self.ocdid_extractor.GITHUB_REPO, self.ocdid_extractor.GITHUB_DIR
@@ -261,14 +286,9 @@ class OcdIdsExtractorTest(absltest.TestCase):
   def testItRaisesAnErrorAndDoesNotCopyDataWhenTheDataIsInvalid(self):
     self.ocdid_extractor.github_file = "country-ar.csv"
     self.ocdid_extractor._verify_data = MagicMock(return_value=False)
-    mock_copy = MagicMock()
+    _, _, mock_copy = self._patch_download_calls()
 
-    # pylint: disable=g-backslash-continuation
-    with patch("requests.get", MagicMock()), patch(
-        "io.open", MagicMock()
-    ), patch("shutil.copy", mock_copy), self.assertRaises(
-        loggers.ElectionError
-    ):
+    with self.assertRaises(loggers.ElectionError):
       self.ocdid_extractor._download_data("/usr/cache")
 
     self.assertEqual(0, mock_copy.call_count)
@@ -277,7 +297,9 @@ class OcdIdsExtractorTest(absltest.TestCase):
   def testParsesLocalCSVFileIfProvidedAndReturnsOCDIDs(self):
     # set local file so that countries_file is set to local
 
-    with patch("{}.open".format(self.builtins_name), self.mock_open_func):
+    with patch(
+        "{}.open".format(self.builtins_name), _open_downloaded_ocdid_file
+    ):
       self.ocdid_extractor.local_file = open("/path/to/file")
 
     codes = self.ocdid_extractor._get_ocd_data()
@@ -304,7 +326,7 @@ class OcdIdsExtractorTest(absltest.TestCase):
     with patch("os.path.expanduser", mock_expanduser), patch(
         "os.path.exists", mock_exists
     ), patch("github.Github", mock_github), patch(
-        "{}.open".format(self.builtins_name), self.mock_open_func
+        "{}.open".format(self.builtins_name), _open_downloaded_ocdid_file
     ):
       codes = self.ocdid_extractor._get_ocd_data()
 
@@ -348,7 +370,7 @@ class OcdIdsExtractorTest(absltest.TestCase):
     with patch("os.path.expanduser", mock_expanduser), patch(
         "os.path.exists", mock_exists
     ), patch("github.Github", mock_github), patch(
-        "{}.open".format(self.builtins_name), self.mock_open_func
+        "{}.open".format(self.builtins_name), _open_downloaded_ocdid_file
     ), patch(
         "os.path.getmtime", mock_getmtime
     ), patch(
@@ -382,7 +404,7 @@ class OcdIdsExtractorTest(absltest.TestCase):
     )
     # pylint: disable=g-backslash-continuation
     with patch("os.stat", mock_stat), patch("hashlib.sha1", mock_sha1), patch(
-        "io.open", self.mock_open_func
+        "io.open", _open_downloaded_ocdid_file
     ):
       valid = self.ocdid_extractor._verify_data("/usr/cache/country-ar.tmp")
 
@@ -401,7 +423,7 @@ class OcdIdsExtractorTest(absltest.TestCase):
 
     # pylint: disable=g-backslash-continuation
     with patch("os.stat", mock_stat), patch("hashlib.sha1", mock_sha1), patch(
-        "io.open", self.mock_open_func
+        "io.open", _open_downloaded_ocdid_file
     ):
       valid = self.ocdid_extractor._verify_data("/usr/cache/country-ar.tmp")
 
@@ -411,7 +433,7 @@ class OcdIdsExtractorTest(absltest.TestCase):
   # _get_latest_file_blob_sha tests
   def testItReturnsTheBlobShaOfTheGithubFileWhenFound(self):
     content_file = github.ContentFile.ContentFile(
-        None, {}, dict({"name": "country-ar.csv", "sha": "abc123"}), None
+        None, {}, {"name": "country-ar.csv", "sha": "abc123"}, None
     )
     repo = github.Repository.Repository(None, {}, {}, None)
     repo.get_contents = MagicMock(return_value=[content_file])
@@ -423,7 +445,7 @@ class OcdIdsExtractorTest(absltest.TestCase):
 
   def testItReturnsNoneIfTheFileCantBeFound(self):
     content_file = github.ContentFile.ContentFile(
-        None, {}, dict({"name": "country-ar.csv", "sha": "abc123"}), None
+        None, {}, {"name": "country-ar.csv", "sha": "abc123"}, None
     )
     repo = github.Repository.Repository(None, {}, {}, None)
     repo.get_contents = MagicMock(return_value=[content_file])
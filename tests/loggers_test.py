@@ -53,5 +53,19 @@ class ParentHierarchyObjectIdStrTest(absltest.TestCase):
                      actual_value)
 
 
+class ElectionExceptionTest(absltest.TestCase):
+
+  def testStrJoinsLogEntryMessages(self):
+    exception = loggers.ElectionError([
+        loggers.LogEntry("First message."),
+        loggers.LogEntry("Second message."),
+    ])
+    self.assertEqual("First message.\nSecond message.", str(exception))
+
+  def testStrOfSingleMessage(self):
+    exception = loggers.ElectionWarning.from_message("Only message.")
+    self.assertEqual("Only message.", str(exception))
+
+
 if __name__ == "__main__":
   absltest.main()
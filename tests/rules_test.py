@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 """Unit test for rules.py."""
 
+import copy
 import datetime
 import hashlib
-import inspect
 import io
 
 from absl.testing import absltest
@@ -15,10 +15,76 @@ from civics_cdf_validator import rules
 import freezegun
 from lxml import etree
 from mock import MagicMock
+from mock import patch
 import networkx
 
 
-class HelpersTest(absltest.TestCase):
+# Shared parser for test fixtures. Fixtures never rely on xml:id lookups or
+# entities, and dropping indentation-only text leaves less for rules to walk.
+_FIXTURE_PARSER = etree.XMLParser(
+    collect_ids=False,
+    remove_blank_text=True,
+    resolve_entities=False,
+    no_network=True,
+)
+
+
+# Intermediate rule classes that are not meant to be run on their own.
+_ABSTRACT_RULES = frozenset([
+    base.TreeRule,
+    base.ValidReferenceRule,
+    rules.ValidatePartyCollection,
+    base.DateRule,
+    base.MissingFieldRule,
+    rules.UnreferencedEntitiesBase,
+])
+
+
+def _first_msg(cm):
+  """Returns the message of the first log entry of a caught exception."""
+  return cm.exception.log_entry[0].message
+
+
+def _first_tag(cm):
+  """Returns the tag of the first element in a caught exception's log."""
+  return cm.exception.log_entry[0].elements[0].tag
+
+
+class _SingleErrorMixin(object):
+  """Assertions shared by tests of rules that raise a single log entry."""
+
+  def _assert_single_error(self, ee, expected_message):
+    """Asserts the raised exception holds exactly one entry with the message."""
+    entries = ee.exception.log_entry
+    self.assertLen(entries, 1)
+    self.assertEqual(expected_message, entries[0].message)
+
+
+class _ParsedFixturesMixin(object):
+  """Parses the class-level _FIXTURES byte strings once per test class.
+
+  The parsed trees are shared by every test in the class, so the rules under
+  test must not mutate them.
+  """
+
+  _FIXTURES = {}
+
+  @classmethod
+  def setUpClass(cls):
+    super(_ParsedFixturesMixin, cls).setUpClass()
+    cls._trees = {
+        name: etree.fromstring(xml, _FIXTURE_PARSER)
+        for name, xml in cls._FIXTURES.items()
+    }
+
+
+class HelpersTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "first_name": b"<FirstName>Jerry</FirstName>",
+      "empty_first_name": b"<FirstName></FirstName>",
+      "space_first_name": b"<FirstName>   </FirstName>",
+  }
 
   # get_external_id_values tests
   def testReturnsTextValueOfExternalIdentifiersForGivenType(self):
@@ -51,6 +117,36 @@ class HelpersTest(absltest.TestCase):
     self.assertLen(actual_stable_ids, 1)
     self.assertEqual(expected_other_stable, actual_stable_ids[0])
 
+  def testReturnsExternalIdValuesOfWholeElectionTree(self):
+    election_report = """
+      <ElectionReport>
+        <GpUnitCollection>
+          <GpUnit objectId="gpu0">
+            <ExternalIdentifiers>
+              <ExternalIdentifier>
+                <Type>ocd-id</Type>
+                <Value>ocd-division/country:us</Value>
+              </ExternalIdentifier>
+            </ExternalIdentifiers>
+          </GpUnit>
+          <GpUnit objectId="gpu1">
+            <ExternalIdentifiers>
+              <ExternalIdentifier>
+                <Type>ocd-id</Type>
+                <Value>ocd-division/country:us/state:ma</Value>
+              </ExternalIdentifier>
+            </ExternalIdentifiers>
+          </GpUnit>
+        </GpUnitCollection>
+      </ElectionReport>
+    """
+    election_tree = etree.ElementTree(etree.fromstring(election_report))
+
+    self.assertEqual(
+        ["ocd-division/country:us", "ocd-division/country:us/state:ma"],
+        rules.get_external_id_values(election_tree, "ocd-id"),
+    )
+
   def testReturnsValueElementOfExternalIdIfReturnElementsSpecified(self):
     gp_unit = """
       <GpUnit objectId="gpu0">
@@ -198,8 +294,7 @@ class HelpersTest(absltest.TestCase):
 
   # element_has_text tests
   def testReturnsTrueIfElementHasText(self):
-    element_string = "<FirstName>Jerry</FirstName>"
-    elem_has_text = rules.element_has_text(etree.fromstring(element_string))
+    elem_has_text = rules.element_has_text(self._trees["first_name"])
     self.assertTrue(elem_has_text)
 
   def testReturnsFalseIfElementIsNone(self):
@@ -207,13 +302,11 @@ class HelpersTest(absltest.TestCase):
     self.assertFalse(elem_has_text)
 
   def testReturnsFalseIfElementHasNoText(self):
-    element_string = "<FirstName></FirstName>"
-    elem_has_text = rules.element_has_text(etree.fromstring(element_string))
+    elem_has_text = rules.element_has_text(self._trees["empty_first_name"])
     self.assertFalse(elem_has_text)
 
   def testReturnsFalseIfElementHasAllWhiteSpace(self):
-    element_string = "<FirstName>   </FirstName>"
-    elem_has_text = rules.element_has_text(etree.fromstring(element_string))
+    elem_has_text = rules.element_has_text(self._trees["space_first_name"])
     self.assertFalse(elem_has_text)
 
 
@@ -260,7 +353,7 @@ class SchemaTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       schema_validator.check()
     self.assertIn("The schema file could not be parsed correctly",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testRaisesErrorForInvalidTree(self):
     root_string = """
@@ -277,14 +370,28 @@ class SchemaTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ete:
       schema_validator.check()
     self.assertIn("The election file didn't validate against schema",
-                  ete.exception.log_entry[0].message)
+                  _first_msg(ete))
+
 
+class OptionalAndEmptyTest(_ParsedFixturesMixin, absltest.TestCase):
 
-class OptionalAndEmptyTest(absltest.TestCase):
+  _FIXTURES = {
+      "non_empty": b"<ThingOne>BoomShakalaka</ThingOne>",
+      "empty": b"<ThingOne></ThingOne>",
+      "space": b"<ThingOne>  </ThingOne>",
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(OptionalAndEmptyTest, cls).setUpClass()
+    cls._shared_validator = rules.OptionalAndEmpty(None, None)
 
   def setUp(self):
     super(OptionalAndEmptyTest, self).setUp()
-    self.optionality_validator = rules.OptionalAndEmpty(None, None)
+    # The validator remembers the last element it checked; start each test
+    # from a clean slate.
+    self.optionality_validator = self._shared_validator
+    self.optionality_validator.previous = None
 
   def testOnlyChecksOptionalElements(self):
     schema_tree = etree.fromstring(b"""
@@ -304,43 +411,20 @@ class OptionalAndEmptyTest(absltest.TestCase):
     self.assertEqual(eligible_elements[1], "ThingThree")
 
   def testIgnoresIfElementIsSameAsPrevious(self):
-    root_string = """
-      <ThingOne></ThingOne>
-    """
-
-    non_empty_element = etree.fromstring(root_string)
-    non_empty_element.sourceline = 7
-    self.optionality_validator.previous = non_empty_element
-    self.optionality_validator.check(non_empty_element)
+    empty_element = self._trees["empty"]
+    self.optionality_validator.previous = empty_element
+    self.optionality_validator.check(empty_element)
 
   def testIgnoresNonEmptyElements(self):
-    root_string = """
-      <ThingOne>BoomShakalaka</ThingOne>
-    """
-
-    non_empty_element = etree.fromstring(root_string)
-    non_empty_element.sourceline = 7
-    self.optionality_validator.check(non_empty_element)
+    self.optionality_validator.check(self._trees["non_empty"])
 
   def testThrowsWarningForEmptyElements_Null(self):
-    empty_string = """
-      <ThingOne></ThingOne>
-    """
-
-    empty_element = etree.fromstring(empty_string)
-    empty_element.sourceline = 7
     with self.assertRaises(loggers.ElectionWarning):
-      self.optionality_validator.check(empty_element)
+      self.optionality_validator.check(self._trees["empty"])
 
   def testThrowsWarningForEmptyElements_Space(self):
-    space_string = """
-      <ThingOne>  </ThingOne>
-    """
-
-    space_element = etree.fromstring(space_string)
-    space_element.sourceline = 7
     with self.assertRaises(loggers.ElectionWarning):
-      self.optionality_validator.check(space_element)
+      self.optionality_validator.check(self._trees["space"])
 
 
 class EncodingTest(absltest.TestCase):
@@ -364,79 +448,79 @@ class EncodingTest(absltest.TestCase):
 
     with self.assertRaises(loggers.ElectionError) as ee:
       encoding_validator.check()
-    self.assertEqual(ee.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(ee),
                      "Encoding on file is not UTF-8")
 
 
-class HungarianStyleNotationTest(absltest.TestCase):
-
-  def setUp(self):
-    super(HungarianStyleNotationTest, self).setUp()
-    self.notation_validator = rules.HungarianStyleNotation(None, None)
+class HungarianStyleNotationTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "no_object_id": b"<Party/>",
+      "invalid_prefix": b'<Party objectId="pax0"/>',
+      "unlisted_element": b'<Blamo objectId="pax0"/>',
+  }
+
+  # The expected objectId prefix of each element type.
+  _ELEMENTS_PREFIX = {
+      "BallotMeasureContest": "bmc",
+      "BallotMeasureSelection": "bms",
+      "BallotStyle": "bs",
+      "Candidate": "can",
+      "CandidateContest": "cc",
+      "CandidateSelection": "cs",
+      "Coalition": "coa",
+      "ContactInformation": "ci",
+      "Hours": "hours",
+      "Office": "off",
+      "OfficeGroup": "og",
+      "Party": "par",
+      "PartyContest": "pc",
+      "PartySelection": "ps",
+      "Person": "per",
+      "ReportingDevice": "rd",
+      "ReportingUnit": "ru",
+      "RetentionContest": "rc",
+      "Schedule": "sched",
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(HungarianStyleNotationTest, cls).setUpClass()
+    cls.notation_validator = rules.HungarianStyleNotation(None, None)
+    cls._prefixed_elements = [
+        etree.Element(elem, objectId=prefix + "0")
+        for elem, prefix in cls._ELEMENTS_PREFIX.items()
+    ]
 
   def testChecksAllElementsWithPrefixes(self):
     elements = self.notation_validator.elements()
     self.assertEqual(elements, self.notation_validator.elements_prefix.keys())
 
   def testIgnoresElementsWithNoObjectId(self):
-    element_string = """
-      <Party/>
-    """
-
-    party_element = etree.fromstring(element_string)
-    self.notation_validator.check(party_element)
+    self.notation_validator.check(self._trees["no_object_id"])
 
   def testObjectIdsUseAcceptedPrefix(self):
-    elements_prefix = {
-        "BallotMeasureContest": "bmc",
-        "BallotMeasureSelection": "bms",
-        "BallotStyle": "bs",
-        "Candidate": "can",
-        "CandidateContest": "cc",
-        "CandidateSelection": "cs",
-        "Coalition": "coa",
-        "ContactInformation": "ci",
-        "Hours": "hours",
-        "Office": "off",
-        "OfficeGroup": "og",
-        "Party": "par",
-        "PartyContest": "pc",
-        "PartySelection": "ps",
-        "Person": "per",
-        "ReportingDevice": "rd",
-        "ReportingUnit": "ru",
-        "RetentionContest": "rc",
-        "Schedule": "sched",
-    }
-
-    for elem in elements_prefix:
-      element_string = """
-        <{} objectId="{}0"/>
-      """.format(elem, elements_prefix[elem])
-
-      party_element = etree.fromstring(element_string)
-      self.notation_validator.check(party_element)
+    for element in self._prefixed_elements:
+      with self.subTest(elem=element.tag):
+        self.notation_validator.check(element)
 
   def testRaisesExceptionForInvalidPrefix(self):
-    element_string = """
-      <Party objectId="pax0"/>
-    """
-
-    party_element = etree.fromstring(element_string)
     with self.assertRaises(loggers.ElectionInfo):
-      self.notation_validator.check(party_element)
+      self.notation_validator.check(self._trees["invalid_prefix"])
 
   def testRaisesAnErrorForAnUnlistedElement(self):
-    element_string = """
-      <Blamo objectId="pax0"/>
-    """
-
-    party_element = etree.fromstring(element_string)
     with self.assertRaises(KeyError):
-      self.notation_validator.check(party_element)
+      self.notation_validator.check(self._trees["unlisted_element"])
 
 
-class LanguageCodeTest(absltest.TestCase):
+class LanguageCodeTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "no_language": b"<Text>BoomShakalaka</Text>",
+      "valid_language": b'<Text language="en">BoomShakalaka</Text>',
+      "invalid_language": b'<Text language="zzz">BoomShakalaka</Text>',
+      "empty_language": b'<Text language="">BoomShakalaka</Text>',
+  }
 
   def setUp(self):
     super(LanguageCodeTest, self).setUp()
@@ -446,136 +530,135 @@ class LanguageCodeTest(absltest.TestCase):
     self.assertEqual(self.language_code_validator.elements(), ["Text"])
 
   def testIgnoresElementsWithoutLanguageAttribute(self):
-    element_string = """
-      <Text>BoomShakalaka</Text>
-    """
-
-    text_element = etree.fromstring(element_string)
-    self.language_code_validator.check(text_element)
+    self.language_code_validator.check(self._trees["no_language"])
 
   def testLanguageAttributeIsValidTag(self):
-    element_string = """
-      <Text language="en">BoomShakalaka</Text>
-    """
-
-    text_element = etree.fromstring(element_string)
-    self.language_code_validator.check(text_element)
+    self.language_code_validator.check(self._trees["valid_language"])
 
   def testRaiseErrorForInvalidLanguageAttributes_Invalid(self):
-    invalid_string = """
-      <Text language="zzz">BoomShakalaka</Text>
-    """
-
-    invalid_element = etree.fromstring(invalid_string)
     with self.assertRaises(loggers.ElectionError):
-      self.language_code_validator.check(invalid_element)
+      self.language_code_validator.check(self._trees["invalid_language"])
 
   def testRaiseErrorForInvalidLanguageAttributes_Empty(self):
-    empty_string = """
-      <Text language="">BoomShakalaka</Text>
-    """
-
-    empty_element = etree.fromstring(empty_string)
     with self.assertRaises(loggers.ElectionError):
-      self.language_code_validator.check(empty_element)
+      self.language_code_validator.check(self._trees["empty_language"])
 
 
 class PercentSumTest(absltest.TestCase):
 
-  def setUp(self):
-    super(PercentSumTest, self).setUp()
-    self.percent_validator = rules.PercentSum(None, None)
-    self.root_string = """
-      <Contest>
-        <BallotSelection>
-          <VoteCountsCollection>
-            {}
-          </VoteCountsCollection>
-        </BallotSelection>
-      </Contest>
-    """
+  _CONTEST_SKELETON = b"""
+    <Contest>
+      <BallotSelection>
+        <VoteCountsCollection/>
+      </BallotSelection>
+    </Contest>
+  """
+
+  # The VoteCounts of each case, wrapped so sibling elements parse together.
+  _VOTE_COUNTS = {
+      "zero_percent_total": b"""
+        <VoteCountsCollection>
+          <VoteCounts>
+            <OtherType>total-percent</OtherType>
+            <Count>0.0</Count>
+          </VoteCounts>
+          <VoteCounts>
+            <OtherType>total-percent</OtherType>
+            <Count>0.0</Count>
+          </VoteCounts>
+        </VoteCountsCollection>
+        """,
+      "one_hundred_percent_total": b"""
+        <VoteCountsCollection>
+          <VoteCounts>
+            <OtherType>total-percent</OtherType>
+            <Count>60.0</Count>
+          </VoteCounts>
+          <VoteCounts>
+            <OtherType>total-percent</OtherType>
+            <Count>40.0</Count>
+          </VoteCounts>
+        </VoteCountsCollection>
+        """,
+      "invalid_percents": b"""
+        <VoteCountsCollection>
+          <VoteCounts>
+            <OtherType>total-percent</OtherType>
+            <Count>60.0</Count>
+          </VoteCounts>
+          <VoteCounts>
+            <OtherType>total-percent</OtherType>
+            <Count>20.0</Count>
+          </VoteCounts>
+        </VoteCountsCollection>
+        """,
+      "regular_type_percents": b"""
+        <VoteCountsCollection>
+          <VoteCounts>
+            <Type>total-percent</Type>
+            <Count>60.0</Count>
+          </VoteCounts>
+          <VoteCounts>
+            <Type>total-percent</Type>
+            <Count>20.0</Count>
+          </VoteCounts>
+        </VoteCountsCollection>
+        """,
+      "other_type_percent_sum": b"""
+        <VoteCountsCollection>
+          <VoteCounts>
+            <OtherType>percent-sum</OtherType>
+            <Count>60.0</Count>
+          </VoteCounts>
+          <VoteCounts>
+            <OtherType>percent-sum</OtherType>
+            <Count>20.0</Count>
+          </VoteCounts>
+        </VoteCountsCollection>
+        """,
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(PercentSumTest, cls).setUpClass()
+    cls.percent_validator = rules.PercentSum(None, None)
+    skeleton = etree.fromstring(cls._CONTEST_SKELETON, _FIXTURE_PARSER)
+    cls._contests = {}
+    for name, vote_counts in cls._VOTE_COUNTS.items():
+      contest = copy.deepcopy(skeleton)
+      contest.find("BallotSelection/VoteCountsCollection").extend(
+          etree.fromstring(vote_counts, _FIXTURE_PARSER)
+      )
+      cls._contests[name] = contest
 
   def testOnlyChecksContestElements(self):
     self.assertEqual(["Contest"], self.percent_validator.elements())
 
   def testZeroPercentTotalIsValid(self):
-    vote_counts = """
-      <VoteCounts>
-        <OtherType>total-percent</OtherType>
-        <Count>0.0</Count>
-      </VoteCounts>
-      <VoteCounts>
-        <OtherType>total-percent</OtherType>
-        <Count>0.0</Count>
-      </VoteCounts>
-    """
-    element_string = self.root_string.format(vote_counts)
-    element = etree.fromstring(element_string)
-    self.percent_validator.check(element)
+    self.percent_validator.check(self._contests["zero_percent_total"])
 
   def testOneHundredPercentTotalIsValid(self):
-    vote_counts = """
-      <VoteCounts>
-        <OtherType>total-percent</OtherType>
-        <Count>60.0</Count>
-      </VoteCounts>
-      <VoteCounts>
-        <OtherType>total-percent</OtherType>
-        <Count>40.0</Count>
-      </VoteCounts>
-    """
-    element_string = self.root_string.format(vote_counts)
-    element = etree.fromstring(element_string)
-    self.percent_validator.check(element)
+    self.percent_validator.check(self._contests["one_hundred_percent_total"])
 
   def testThrowsAnErrorForInvalidPercents(self):
-    vote_counts = """
-      <VoteCounts>
-        <OtherType>total-percent</OtherType>
-        <Count>60.0</Count>
-      </VoteCounts>
-      <VoteCounts>
-        <OtherType>total-percent</OtherType>
-        <Count>20.0</Count>
-      </VoteCounts>
-    """
-    element_string = self.root_string.format(vote_counts)
-    element = etree.fromstring(element_string)
     with self.assertRaises(loggers.ElectionError):
-      self.percent_validator.check(element)
+      self.percent_validator.check(self._contests["invalid_percents"])
 
   def testOnlyUseCountForOtherTypeTotalPercent_RegularType(self):
-    vote_counts = """
-      <VoteCounts>
-        <Type>total-percent</Type>
-        <Count>60.0</Count>
-      </VoteCounts>
-      <VoteCounts>
-        <Type>total-percent</Type>
-        <Count>20.0</Count>
-      </VoteCounts>
-    """
-    element_string = self.root_string.format(vote_counts)
-    element = etree.fromstring(element_string)
-    self.percent_validator.check(element)
+    self.percent_validator.check(self._contests["regular_type_percents"])
 
   def testOnlyUseCountForOtherTypeTotalPercent_Invalid(self):
-    vote_counts = """
-      <VoteCounts>
-        <OtherType>percent-sum</OtherType>
-        <Count>60.0</Count>
-      </VoteCounts>
-      <VoteCounts>
-        <OtherType>percent-sum</OtherType>
-        <Count>20.0</Count>
-      </VoteCounts>
-    """
-    element_string = self.root_string.format(vote_counts)
-    element = etree.fromstring(element_string)
-    self.percent_validator.check(element)
+    self.percent_validator.check(self._contests["other_type_percent_sum"])
+
 
+class EmptyTextTest(_ParsedFixturesMixin, absltest.TestCase):
 
-class EmptyTextTest(absltest.TestCase):
+  _FIXTURES = {
+      "non_empty": b"<Text>Boomshakalaka</Text>",
+      "empty": b"<Text></Text>",
+      "space_only": b"<Text>   </Text>",
+      "empty_with_language": b'<Text language="en" />',
+  }
 
   def setUp(self):
     super(EmptyTextTest, self).setUp()
@@ -585,71 +668,54 @@ class EmptyTextTest(absltest.TestCase):
     self.assertEqual(["Text"], self.empty_text_validator.elements())
 
   def testIgnoresNonEmptyElements(self):
-    element_string = """
-      <Text>Boomshakalaka</Text>
-    """
-
-    element = etree.fromstring(element_string)
-    self.empty_text_validator.check(element)
+    self.empty_text_validator.check(self._trees["non_empty"])
 
   def testThrowsWarningForEmptyElements(self):
-    element_string = """
-      <Text></Text>
-    """
-
-    element = etree.fromstring(element_string)
     with self.assertRaises(loggers.ElectionWarning):
-      self.empty_text_validator.check(element)
+      self.empty_text_validator.check(self._trees["empty"])
 
   def testThrowsWarningForSpaceOnlyElements(self):
-    empty_string = """
-      <Text>   </Text>
-    """
-
-    element = etree.fromstring(empty_string)
     with self.assertRaises(loggers.ElectionWarning):
-      self.empty_text_validator.check(element)
+      self.empty_text_validator.check(self._trees["space_only"])
 
   def testEmptyTextWithLanguage(self):
-    element_string = """
-      <Text language="en" />
-    """
-
-    element = etree.fromstring(element_string)
     with self.assertRaises(loggers.ElectionWarning):
-      self.empty_text_validator.check(element)
-
-
-class DuplicateIDTest(absltest.TestCase):
+      self.empty_text_validator.check(self._trees["empty_with_language"])
+
+
+class DuplicateIDTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "unique_object_ids": b"""
+        <Report objectId="1">
+          <Person>
+            <FirstName objectId="">Jerry</FirstName>
+            <LastName objectId="">Seinfeld</LastName>
+            <Age objectId="5">38</Age>
+          </Person>
+        </Report>
+        """,
+      "duplicate_object_ids": b"""
+        <Report objectId="1">
+          <Person objectId="2">
+            <FirstName objectId="3">Jerry</FirstName>
+            <LastName objectId="4">Seinfeld</LastName>
+            <Age objectId="4">38</Age>
+          </Person>
+        </Report>
+        """,
+  }
 
   def testValidIfNoObjectIDValuesAreTheSame(self):
-    root_string = """
-      <Report objectId="1">
-        <Person>
-          <FirstName objectId="">Jerry</FirstName>
-          <LastName objectId="">Seinfeld</LastName>
-          <Age objectId="5">38</Age>
-        </Person>
-      </Report>
-    """
-
-    election_tree = etree.fromstring(root_string)
-    duplicate_id_validator = rules.DuplicateID(election_tree, None)
+    duplicate_id_validator = rules.DuplicateID(
+        self._trees["unique_object_ids"], None
+    )
     duplicate_id_validator.check()
 
   def testThrowErrorIfObjectIDsAreTheSame(self):
-    root_string = """
-      <Report objectId="1">
-        <Person objectId="2">
-          <FirstName objectId="3">Jerry</FirstName>
-          <LastName objectId="4">Seinfeld</LastName>
-          <Age objectId="4">38</Age>
-        </Person>
-      </Report>
-    """
-
-    election_tree = etree.fromstring(root_string)
-    duplicate_id_validator = rules.DuplicateID(election_tree, None)
+    duplicate_id_validator = rules.DuplicateID(
+        self._trees["duplicate_object_ids"], None
+    )
     with self.assertRaises(loggers.ElectionError):
       duplicate_id_validator.check()
 
@@ -702,7 +768,7 @@ class DuplicatedGpUnitOcdIdTest(absltest.TestCase):
     self.assertEqual(
         "GpUnits ru25538 and ru25539 have the same ocd-id "
         "ocd-division/country:in/state:wb/cd:bardhaman-durgapur",
-        ee.exception.log_entry[0].message)
+        _first_msg(ee))
 
   def testGpUnitCollectionOcdidValid(self):
     ocdid_string = """
@@ -746,7 +812,7 @@ class DuplicatedGpUnitOcdIdTest(absltest.TestCase):
     self.valid_ocdid.check(elements)
 
 
-class ValidIDREFTest(absltest.TestCase):
+class ValidIDREFTest(parameterized.TestCase):
 
   _schema_tree = etree.fromstring(b"""<?xml version="1.0" encoding="UTF-8"?>
     <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
@@ -771,9 +837,9 @@ class ValidIDREFTest(absltest.TestCase):
         </xs:sequence>
       </xs:complexType>
     </xs:schema>
-  """)
+  """, _FIXTURE_PARSER)
 
-  _root_string = """
+  _root_string = b"""
     <Report>
       <PersonCollection>
         <Person objectId="per001">
@@ -799,6 +865,21 @@ class ValidIDREFTest(absltest.TestCase):
     </Report>
   """
 
+  @classmethod
+  def setUpClass(cls):
+    super(ValidIDREFTest, cls).setUpClass()
+    # Only read by _determine_reference_type, which never mutates it.
+    cls._reference_type_validator = rules.ValidIDREF(None, None)
+    cls._reference_type_validator.object_id_mapping = {
+        "GpUnit": ["gp001"],
+        "Party": ["par001"],
+        "Person": ["per001"],
+        "Office": ["off001"],
+        "Candidate": ["can001"],
+        "Contest": ["con001"],
+        "BallotSelection": ["bs001"],
+    }
+
   # setup test
   def testGeneratesTwoMappingsAndSetsThemAsInstanceVariables(self):
     expected_obj_id_mapping = {
@@ -826,7 +907,7 @@ class ValidIDREFTest(absltest.TestCase):
 
   # _gather_object_ids_by_type test
   def testReturnsMapOfElementTypesToSetOfObjectIds(self):
-    element_tree = etree.fromstring(self._root_string)
+    element_tree = etree.fromstring(self._root_string, _FIXTURE_PARSER)
     id_ref_validator = rules.ValidIDREF(element_tree, None)
     expected_id_mapping = {
         "Person": set(["per001", "per002"]),
@@ -854,53 +935,38 @@ class ValidIDREFTest(absltest.TestCase):
     self.assertEqual(expected_reference_mapping, actual_reference_mapping)
 
   # _determine_reference_type test
-  def testReturnsTheNameOfTheReferenceTypeForGivenElementName(self):
-    id_ref_validator = rules.ValidIDREF(None, None)
-
-    id_ref_validator.object_id_mapping = {
-        "GpUnit": ["gp001"],
-        "Party": ["par001"],
-        "Person": ["per001"],
-        "Office": ["off001"],
-        "Candidate": ["can001"],
-        "Contest": ["con001"],
-        "BallotSelection": ["bs001"],
-    }
-
-    ref_type_mappings = {
-        "GpUnitId": "GpUnit",
-        "GpUnitIds": "GpUnit",
-        "ElectoralDistrictId": "GpUnit",
-        "ElectionScopeId": "GpUnit",
-        "ComposingGpUnitIds": "GpUnit",
-        "PartyScopeGpUnitIds": "GpUnit",
-        "PartyId": "Party",
-        "PartyIds": "Party",
-        "PrimaryPartyIds": "Party",
-        "EndorsementPartyIds": "Party",
-        "PersonId": "Person",
-        "ElectionOfficialPersonIds": "Person",
-        "OfficeHolderPersonIds": "Person",
-        "AuthorityId": "Person",
-        "AuthorityIds": "Person",
-        "OfficeId": "Office",
-        "OfficeIds": "Office",
-        "CandidateId": "Candidate",
-        "CandidateIds": "Candidate",
-        "ContestId": "Contest",
-        "ContestIds": "Contest",
-        "OrderedBallotSelectionIds": "BallotSelection",
-        "ElementIsIncorrectlyIDREF": None,
-    }
-
-    for ref_elem, expected_ref_type in ref_type_mappings.items():
-      actual_ref_type = id_ref_validator._determine_reference_type(ref_elem)
-      try:
-        self.assertEqual(expected_ref_type, actual_ref_type)
-      except AssertionError:
-        self.fail(("Expected {} to have a reference type of "
-                   "{}. Instead got {}").format(ref_elem, expected_ref_type,
-                                                actual_ref_type))
+  @parameterized.named_parameters(
+      ("GpUnitId", "GpUnitId", "GpUnit"),
+      ("GpUnitIds", "GpUnitIds", "GpUnit"),
+      ("ElectoralDistrictId", "ElectoralDistrictId", "GpUnit"),
+      ("ElectionScopeId", "ElectionScopeId", "GpUnit"),
+      ("ComposingGpUnitIds", "ComposingGpUnitIds", "GpUnit"),
+      ("PartyScopeGpUnitIds", "PartyScopeGpUnitIds", "GpUnit"),
+      ("PartyId", "PartyId", "Party"),
+      ("PartyIds", "PartyIds", "Party"),
+      ("PrimaryPartyIds", "PrimaryPartyIds", "Party"),
+      ("EndorsementPartyIds", "EndorsementPartyIds", "Party"),
+      ("PersonId", "PersonId", "Person"),
+      ("ElectionOfficialPersonIds", "ElectionOfficialPersonIds", "Person"),
+      ("OfficeHolderPersonIds", "OfficeHolderPersonIds", "Person"),
+      ("AuthorityId", "AuthorityId", "Person"),
+      ("AuthorityIds", "AuthorityIds", "Person"),
+      ("OfficeId", "OfficeId", "Office"),
+      ("OfficeIds", "OfficeIds", "Office"),
+      ("CandidateId", "CandidateId", "Candidate"),
+      ("CandidateIds", "CandidateIds", "Candidate"),
+      ("ContestId", "ContestId", "Contest"),
+      ("ContestIds", "ContestIds", "Contest"),
+      ("OrderedBallotSelectionIds", "OrderedBallotSelectionIds", "BallotSelection"),
+      ("ElementIsIncorrectlyIDREF", "ElementIsIncorrectlyIDREF", None),
+  )
+  def testReturnsTheNameOfTheReferenceTypeForGivenElementName(
+      self, ref_elem, expected_ref_type
+  ):
+    self.assertEqual(
+        expected_ref_type,
+        self._reference_type_validator._determine_reference_type(ref_elem),
+    )
 
   # elements test
   def testReturnsListOfKeysFromElementReferenceMapping(self):
@@ -927,16 +993,16 @@ class ValidIDREFTest(absltest.TestCase):
 
     idref_element = etree.fromstring("""
       <ElectoralDistrictId>gp001</ElectoralDistrictId>
-    """)
+    """, _FIXTURE_PARSER)
     party_leader_id_element = etree.fromstring("""
       <PartyLeaderId>per001</PartyLeaderId>
-    """)
+    """, _FIXTURE_PARSER)
     idrefs_element = etree.fromstring("""
       <OfficeHolderPersonIds>per001 per002</OfficeHolderPersonIds>
-    """)
+    """, _FIXTURE_PARSER)
     empty_element = etree.fromstring("""
       <ElectoralDistrictId></ElectoralDistrictId>
-    """)
+    """, _FIXTURE_PARSER)
 
     id_ref_validator.check(idref_element)
     id_ref_validator.check(party_leader_id_element)
@@ -956,22 +1022,22 @@ class ValidIDREFTest(absltest.TestCase):
 
     idref_element = etree.fromstring("""
       <ElectoralDistrictId>gp004</ElectoralDistrictId>
-    """)
+    """, _FIXTURE_PARSER)
     idrefs_element = etree.fromstring("""
       <OfficeHolderPersonIds>per004 per005</OfficeHolderPersonIds>
-    """)
+    """, _FIXTURE_PARSER)
 
     with self.assertRaises(loggers.ElectionError) as ee:
       id_ref_validator.check(idref_element)
     self.assertIn(
         ("gp004 is not a valid IDREF. ElectoralDistrictId should contain an "
-         "objectId from a GpUnit element."), ee.exception.log_entry[0].message)
+         "objectId from a GpUnit element."), _first_msg(ee))
 
     with self.assertRaises(loggers.ElectionError) as ee:
       id_ref_validator.check(idrefs_element)
     self.assertIn(
         ("per004 is not a valid IDREF. OfficeHolderPersonIds should contain an "
-         "objectId from a Person element."), ee.exception.log_entry[0].message)
+         "objectId from a Person element."), _first_msg(ee))
     self.assertIn(
         ("per005 is not a valid IDREF. OfficeHolderPersonIds should contain an "
          "objectId from a Person element."), ee.exception.log_entry[1].message)
@@ -988,204 +1054,189 @@ class ValidIDREFTest(absltest.TestCase):
 
     idrefs_element = etree.fromstring("""
       <OfficeHolderPersonIds>per004 per005</OfficeHolderPersonIds>
-    """)
+    """, _FIXTURE_PARSER)
 
     with self.assertRaises(loggers.ElectionError) as ee:
       id_ref_validator.check(idrefs_element)
     self.assertIn(
         ("per004 is not a valid IDREF. OfficeHolderPersonIds should contain an "
-         "objectId from a Person element."), ee.exception.log_entry[0].message)
+         "objectId from a Person element."), _first_msg(ee))
     self.assertIn(
         ("per005 is not a valid IDREF. OfficeHolderPersonIds should contain an "
          "objectId from a Person element."), ee.exception.log_entry[1].message)
 
 
-class ElectoralDistrictOcdIdTest(absltest.TestCase):
-
-  def setUp(self):
-    super(ElectoralDistrictOcdIdTest, self).setUp()
-    self.root_string = """
-      <ElectionReport>
-        <GpUnitCollection>
-          {}
-        </GpUnitCollection>
-      </ElectionReport>
-    """
-
-    open_mod = inspect.getmodule(open)
-    self.builtins_name = open_mod.__builtins__["__name__"]
+class ElectoralDistrictOcdIdTest(_ParsedFixturesMixin, absltest.TestCase):
 
-    # mock open function call to read provided csv data
-    downloaded_ocdid_file = "id,name\nocd-division/country:ar,Argentina"
-    self.mock_open_func = MagicMock(
-        return_value=io.StringIO(downloaded_ocdid_file))
+  _FIXTURES = {
+      "district_id": b"<ElectoralDistrictId>ru0002</ElectoralDistrictId>",
+      "unknown_district_id": (
+          b"<ElectoralDistrictId>ru9999</ElectoralDistrictId>"
+      ),
+      "gp_unit_with_ocd_id": b"""
+        <ElectionReport>
+          <GpUnitCollection>
+            <GpUnit objectId="ru0002">
+              <ExternalIdentifiers>
+                <ExternalIdentifier>
+                  <Type>ocd-id</Type>
+                  <Value>ocd-division/country:us/state:va</Value>
+                </ExternalIdentifier>
+              </ExternalIdentifiers>
+            </GpUnit>
+          </GpUnitCollection>
+        </ElectionReport>
+        """,
+      "gp_unit_with_upper_case_ocd_id_label": b"""
+        <ElectionReport>
+          <GpUnitCollection>
+            <GpUnit objectId="ru0002">
+              <ExternalIdentifiers>
+                <ExternalIdentifier>
+                  <Type>oCd-id</Type>
+                  <Value>ocd-division/country:us/state:va</Value>
+                </ExternalIdentifier>
+              </ExternalIdentifiers>
+            </GpUnit>
+          </GpUnitCollection>
+        </ElectionReport>
+        """,
+      "gp_unit_without_ocd_id": b"""
+        <ElectionReport>
+          <GpUnitCollection>
+            <GpUnit objectId="ru0002">
+              <ExternalIdentifiers>
+              </ExternalIdentifiers>
+            </GpUnit>
+          </GpUnitCollection>
+        </ElectionReport>
+        """,
+      "gp_unit_with_ma_ocd_id": b"""
+        <ElectionReport>
+          <GpUnitCollection>
+            <GpUnit objectId="ru0002">
+              <ExternalIdentifiers>
+                <ExternalIdentifier>
+                  <Type>ocd-id</Type>
+                  <Value>ocd-division/country:us/state:ma</Value>
+                </ExternalIdentifier>
+              </ExternalIdentifiers>
+            </GpUnit>
+          </GpUnitCollection>
+        </ElectionReport>
+        """,
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(ElectoralDistrictOcdIdTest, cls).setUpClass()
+    # The rule only reads its tree once setup() has indexed the GpUnits, so
+    # each GpUnit fixture gets one validator shared by the tests using it.
+    cls._validators = {}
+    for name, ocd_id in (
+        ("gp_unit_with_ocd_id", "ocd-division/country:us/state:va"),
+        (
+            "gp_unit_with_upper_case_ocd_id_label",
+            "ocd-division/country:us/state:va",
+        ),
+        ("gp_unit_without_ocd_id", "ocd-division/country:us/state:va"),
+        ("gp_unit_with_ma_ocd_id", "ocd-division/country:us/state:ma"),
+    ):
+      gpunit_ocdid_validator = gpunit_rules.GpUnitOcdIdValidator(
+          "us", None, False, [ocd_id]
+      )
+      ocdid_validator = rules.ElectoralDistrictOcdId(
+          cls._trees[name], None, ocd_id_validator=gpunit_ocdid_validator
+      )
+      ocdid_validator.setup()
+      cls._validators[name] = ocdid_validator
 
   # check tests
   def testThatGivenElectoralDistrictIdReferencesGpUnitWithValidOCDID(self):
-    ocd_id = "ocd-division/country:us/state:va"
-    element = etree.fromstring(
-        "<ElectoralDistrictId>ru0002</ElectoralDistrictId>")
-    gp_unit = """
-      <GpUnit objectId="ru0002">
-        <ExternalIdentifiers>
-          <ExternalIdentifier>
-            <Type>ocd-id</Type>
-            <Value>ocd-division/country:us/state:va</Value>
-          </ExternalIdentifier>
-        </ExternalIdentifiers>
-      </GpUnit>
-    """
-    election_tree = etree.fromstring(self.root_string.format(gp_unit))
-    gpunit_ocdid_validator = gpunit_rules.GpUnitOcdIdValidator(
-        "us", None, False, [ocd_id]
-    )
-    ocdid_validator = rules.ElectoralDistrictOcdId(
-        election_tree, None, ocd_id_validator=gpunit_ocdid_validator
-    )
-    ocdid_validator.setup()
-    mock = MagicMock(return_value=True)
-    gpunit_rules.GpUnitOcdIdValidator.is_valid_ocd_id = mock
-
-    ocdid_validator.check(element)
+    ocdid_validator = self._validators["gp_unit_with_ocd_id"]
+    with patch.object(
+        ocdid_validator.ocd_id_validator, "is_valid_ocd_id", return_value=True
+    ):
+      ocdid_validator.check(self._trees["district_id"])
 
   def testItRaisesAnErrorIfTheOcdidLabelIsNotAllLowerCase(self):
-    ocd_id = "ocd-division/country:us/state:va"
-    element = etree.fromstring(
-        "<ElectoralDistrictId>ru0002</ElectoralDistrictId>")
-    gp_unit = """
-      <GpUnit objectId="ru0002">
-        <ExternalIdentifiers>
-          <ExternalIdentifier>
-            <Type>oCd-id</Type>
-            <Value>ocd-division/country:us/state:va</Value>
-          </ExternalIdentifier>
-        </ExternalIdentifiers>
-      </GpUnit>
-    """
-    election_tree = etree.fromstring(self.root_string.format(gp_unit))
-    gpunit_ocdid_validator = gpunit_rules.GpUnitOcdIdValidator(
-        "us", None, False, [ocd_id]
-    )
-    ocdid_validator = rules.ElectoralDistrictOcdId(
-        election_tree, None, ocd_id_validator=gpunit_ocdid_validator
-    )
-    ocdid_validator.setup()
+    ocdid_validator = self._validators["gp_unit_with_upper_case_ocd_id_label"]
 
     with self.assertRaises(loggers.ElectionError) as ee:
-      ocdid_validator.check(element)
-    self.assertEqual(ee.exception.log_entry[0].message,
+      ocdid_validator.check(self._trees["district_id"])
+    self.assertEqual(_first_msg(ee),
                      "The referenced GpUnit ru0002 does not have an ocd-id")
-    self.assertEqual(ee.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(ee),
                      "ElectoralDistrictId")
 
   def testItRaisesAnErrorIfTheReferencedGpUnitDoesNotExist(self):
-    ocd_id = "ocd-division/country:us/state:va"
-    element = etree.fromstring(
-        "<ElectoralDistrictId>ru9999</ElectoralDistrictId>")
-    gp_unit = """
-      <GpUnit objectId="ru0002">
-        <ExternalIdentifiers>
-          <ExternalIdentifier>
-            <Type>ocd-id</Type>
-            <Value>ocd-division/country:us/state:va</Value>
-          </ExternalIdentifier>
-        </ExternalIdentifiers>
-      </GpUnit>
-    """
-    election_tree = etree.fromstring(self.root_string.format(gp_unit))
-    gpunit_ocdid_validator = gpunit_rules.GpUnitOcdIdValidator(
-        "us", None, False, [ocd_id]
-    )
-    ocdid_validator = rules.ElectoralDistrictOcdId(
-        election_tree, None, ocd_id_validator=gpunit_ocdid_validator
-    )
-    ocdid_validator.setup()
+    ocdid_validator = self._validators["gp_unit_with_ocd_id"]
 
     with self.assertRaises(loggers.ElectionError) as ee:
-      ocdid_validator.check(element)
-    self.assertEqual(ee.exception.log_entry[0].message,
+      ocdid_validator.check(self._trees["unknown_district_id"])
+    self.assertEqual(_first_msg(ee),
                      ("The ElectoralDistrictId element not refer to a GpUnit. "
                       "Every ElectoralDistrictId MUST reference a GpUnit"))
-    self.assertEqual(ee.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(ee),
                      "ElectoralDistrictId")
 
   def testItRaisesAnErrorIfTheReferencedGpUnitHasNoOCDID(self):
-    other_ocdid = "ocd-division/country:us/state:va"
-    element = etree.fromstring(
-        "<ElectoralDistrictId>ru0002</ElectoralDistrictId>")
-
-    gp_unit = """
-      <GpUnit objectId="ru0002">
-        <ExternalIdentifiers>
-        </ExternalIdentifiers>
-      </GpUnit>
-    """
-    election_tree = etree.fromstring(self.root_string.format(gp_unit))
-    gpunit_ocdid_validator = gpunit_rules.GpUnitOcdIdValidator(
-        "us", None, False, [other_ocdid]
-    )
-    ocdid_validator = rules.ElectoralDistrictOcdId(
-        election_tree, None, ocd_id_validator=gpunit_ocdid_validator
-    )
-    ocdid_validator.setup()
+    ocdid_validator = self._validators["gp_unit_without_ocd_id"]
 
     with self.assertRaises(loggers.ElectionError) as ee:
-      ocdid_validator.check(element)
-    self.assertEqual(ee.exception.log_entry[0].message,
+      ocdid_validator.check(self._trees["district_id"])
+    self.assertEqual(_first_msg(ee),
                      "The referenced GpUnit ru0002 does not have an ocd-id")
-    self.assertEqual(ee.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(ee),
                      "ElectoralDistrictId")
 
   def testItRaisesAnErrorIfTheReferencedOcdidIsNotValid(self):
-    ocd_id = "ocd-division/country:us/state:ma"
-    element = etree.fromstring(
-        "<ElectoralDistrictId>ru0002</ElectoralDistrictId>")
-    gp_unit = """
-      <GpUnit objectId="ru0002">
-        <ExternalIdentifiers>
-          <ExternalIdentifier>
-            <Type>ocd-id</Type>
-            <Value>ocd-division/country:us/state:ma</Value>
-          </ExternalIdentifier>
-        </ExternalIdentifiers>
-      </GpUnit>
-    """
-    election_tree = etree.fromstring(self.root_string.format(gp_unit))
-    gpunit_ocdid_validator = gpunit_rules.GpUnitOcdIdValidator(
-        "us", None, False, [ocd_id]
-    )
-    ocdid_validator = rules.ElectoralDistrictOcdId(
-        election_tree, None, ocd_id_validator=gpunit_ocdid_validator
-    )
-    ocdid_validator.setup()
+    ocdid_validator = self._validators["gp_unit_with_ma_ocd_id"]
 
-    mock = MagicMock(return_value=False)
-    gpunit_rules.GpUnitOcdIdValidator.is_valid_ocd_id = mock
-
-    with self.assertRaises(loggers.ElectionError) as ee:
-      ocdid_validator.check(element)
-    self.assertEqual(ee.exception.log_entry[0].message,
+    with patch.object(
+        ocdid_validator.ocd_id_validator, "is_valid_ocd_id", return_value=False
+    ), self.assertRaises(loggers.ElectionError) as ee:
+      ocdid_validator.check(self._trees["district_id"])
+    self.assertEqual(_first_msg(ee),
                      ("The ElectoralDistrictId refers to GpUnit ru0002 that"
                       " does not have a valid OCD ID "
                       "(ocd-division/country:us/state:ma)"))
-    self.assertEqual(ee.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(ee),
                      "ElectoralDistrictId")
 
 
-class GpUnitOcdIdTest(absltest.TestCase):
+class GpUnitOcdIdTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "election_report": b"""
+        <ElectionReport>
+          <GpUnitCollection>
+            <GpUnit/>
+            <GpUnit/>
+            <GpUnit/>
+          </GpUnitCollection>
+        </ElectionReport>
+        """,
+      "reporting_unit": b"""
+        <ElectionReport xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+          <GpUnit objectId="ru0030" xsi:type="ReportingUnit">
+            <ExternalIdentifiers>
+              <ExternalIdentifier>
+                <Type>ocd-id</Type>
+                <Value/>
+              </ExternalIdentifier>
+            </ExternalIdentifiers>
+            <Name>Middlesex County</Name>
+            <Number>3</Number>
+            <Type/>
+          </GpUnit>
+        </ElectionReport>
+        """,
+  }
 
   def setUp(self):
     super(GpUnitOcdIdTest, self).setUp()
-    root_string = """
-      <ElectionReport>
-        <GpUnitCollection>
-          <GpUnit/>
-          <GpUnit/>
-          <GpUnit/>
-        </GpUnitCollection>
-      </ElectionReport>
-    """
-    election_tree = etree.fromstring(root_string)
+    election_tree = self._trees["election_report"]
     gpunit_ocdid_validator = gpunit_rules.GpUnitOcdIdValidator(
         "us", None, False, ["ocd-division/country:us/state:ma/county:middlesex"]
     )
@@ -1193,34 +1244,41 @@ class GpUnitOcdIdTest(absltest.TestCase):
         election_tree, None, ocd_id_validator=gpunit_ocdid_validator
     )
 
-    self.base_reporting_unit = """
-      <ElectionReport xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
-        <GpUnit objectId="ru0030" xsi:type="ReportingUnit">
-          <ExternalIdentifiers>
-            <ExternalIdentifier>
-              <Type>ocd-id</Type>
-              {}
-            </ExternalIdentifier>
-          </ExternalIdentifiers>
-          <Name>Middlesex County</Name>
-          <Number>3</Number>
-          <Type>{}</Type>
-        </GpUnit>
-      </ElectionReport>
-    """
+  def _reporting_unit(self, ocd_id, gp_unit_type):
+    """Returns a copy of the reporting unit fixture with the given values.
+
+    Args:
+      ocd_id: The ocd-id external identifier value, or None to omit it.
+      gp_unit_type: The text of the GpUnit Type element.
+    """
+    gp_unit = copy.deepcopy(self._trees["reporting_unit"]).find("GpUnit")
+    value = gp_unit.find(".//Value")
+    if ocd_id is None:
+      value.getparent().remove(value)
+    else:
+      value.text = ocd_id
+    gp_unit.find("Type").text = gp_unit_type
+    return gp_unit
+
+  def _patch_is_valid_ocd_id(self, is_valid):
+    patcher = patch.object(
+        self.gp_unit_validator.ocd_id_validator,
+        "is_valid_ocd_id",
+        return_value=is_valid,
+    )
+    patcher.start()
+    self.addCleanup(patcher.stop)
 
   def testItOnlyChecksReportingUnitElements(self):
     self.assertEqual(["ReportingUnit"], self.gp_unit_validator.elements())
 
   def testItChecksTheGivenReportingUnitHasAValidOcdid(self):
-    reporting_unit = self.base_reporting_unit.format(
-        "<Value>ocd-division/country:us/state:ma/county:middlesex</Value>",
-        "county")
-    report = etree.fromstring(reporting_unit)
+    gp_unit = self._reporting_unit(
+        "ocd-division/country:us/state:ma/county:middlesex", "county"
+    )
 
-    mock = MagicMock(return_value=True)
-    gpunit_rules.GpUnitOcdIdValidator.is_valid_ocd_id = mock
-    self.gp_unit_validator.check(report.find("GpUnit"))
+    self._patch_is_valid_ocd_id(True)
+    self.gp_unit_validator.check(gp_unit)
 
   def testItIgnoresElementsWithNoObjectId(self):
     reporting_unit = """
@@ -1233,35 +1291,27 @@ class GpUnitOcdIdTest(absltest.TestCase):
     self.gp_unit_validator.check(report.find("GpUnit"))
 
   def testItIgnoresElementsWithoutProperDistrictType(self):
-    reporting_unit = self.base_reporting_unit.format(
-        "<Value>ocd-division/country:us/state:ma/county:middlesex</Value>",
-        "county-council",
+    gp_unit = self._reporting_unit(
+        "ocd-division/country:us/state:ma/county:middlesex", "county-council"
     )
-    report = etree.fromstring(reporting_unit)
 
-    mock = MagicMock(return_value=True)
-    gpunit_rules.GpUnitOcdIdValidator.is_valid_ocd_id = mock
-    self.gp_unit_validator.check(report.find("GpUnit"))
+    self._patch_is_valid_ocd_id(True)
+    self.gp_unit_validator.check(gp_unit)
 
   def testItIgnoresElementsWithNoOcdIdValue(self):
-    reporting_unit = self.base_reporting_unit.format("", "county")
-    report = etree.fromstring(reporting_unit)
+    gp_unit = self._reporting_unit(None, "county")
 
-    mock = MagicMock(return_value=True)
-    gpunit_rules.GpUnitOcdIdValidator.is_valid_ocd_id = mock
-    self.gp_unit_validator.check(report.find("GpUnit"))
+    self._patch_is_valid_ocd_id(True)
+    self.gp_unit_validator.check(gp_unit)
 
   def testItRaisesAWarningIfOcdIdNotInListOfValidIds(self):
-    reporting_unit = self.base_reporting_unit.format(
-        "<Value>ocd-division/country:us/state:ny/county:nassau</Value>",
-        "county",
+    gp_unit = self._reporting_unit(
+        "ocd-division/country:us/state:ny/county:nassau", "county"
     )
-    report = etree.fromstring(reporting_unit)
 
-    mock = MagicMock(return_value=False)
-    gpunit_rules.GpUnitOcdIdValidator.is_valid_ocd_id = mock
+    self._patch_is_valid_ocd_id(False)
     with self.assertRaises(loggers.ElectionWarning):
-      self.gp_unit_validator.check(report.find("GpUnit"))
+      self.gp_unit_validator.check(gp_unit)
 
 
 class BadCharactersInPersonFullNameTest(absltest.TestCase):
@@ -1303,7 +1353,7 @@ class BadCharactersInPersonFullNameTest(absltest.TestCase):
     element = etree.fromstring(root_string)
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.person_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Person has known bad characters in FullName field.")
 
   def testPersonFullnameInValidAlias(self):
@@ -1317,7 +1367,7 @@ class BadCharactersInPersonFullNameTest(absltest.TestCase):
     element = etree.fromstring(root_string)
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.person_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Person has known bad characters in FullName field."
                      " Aliases should be included in Nickname field.")
 
@@ -1424,7 +1474,7 @@ class DuplicateGpUnitsTest(absltest.TestCase):
       self.gp_unit_validator.check(
           etree.fromstring(self.root_string.format(test_string)))
     self.assertEqual("GpUnits ('ru0002', 'ru0004') are duplicates",
-                     str(cm.exception.log_entry[0].message))
+                     str(_first_msg(cm)))
 
   def testItProcessesCollectionAndFindsDuplicateObjectIds(self):
     test_string = """
@@ -1448,7 +1498,7 @@ class DuplicateGpUnitsTest(absltest.TestCase):
       self.gp_unit_validator.check(
           etree.fromstring(self.root_string.format(test_string)))
     self.assertEqual("GpUnit is duplicated",
-                     str(cm.exception.log_entry[0].message))
+                     str(_first_msg(cm)))
     self.assertEqual("ru0002",
                      str(cm.exception.log_entry[0].elements[0].get("objectId")))
 
@@ -1474,7 +1524,7 @@ class DuplicateGpUnitsTest(absltest.TestCase):
       self.gp_unit_validator.check(
           etree.fromstring(self.root_string.format(test_string)))
     self.assertEqual("GpUnit is duplicated",
-                     str(cm.exception.log_entry[0].message))
+                     str(_first_msg(cm)))
     self.assertEqual("ru0002",
                      str(cm.exception.log_entry[0].elements[0].get("objectId")))
     self.assertIn("GpUnits ('ru0002', 'ru0004') are duplicates",
@@ -1604,7 +1654,6 @@ class PartisanPrimaryTest(absltest.TestCase):
     root = etree.fromstring(election_string)
 
     election = root.find("Election")
-    election.sourceline = 7
 
     with self.assertRaises(loggers.ElectionWarning):
       rules.PartisanPrimary(root, None).check(election)
@@ -1621,7 +1670,6 @@ class PartisanPrimaryTest(absltest.TestCase):
     root = etree.fromstring(election_string)
 
     election = root.find("Election")
-    election.sourceline = 7
 
     with self.assertRaises(loggers.ElectionWarning):
       rules.PartisanPrimary(root, None).check(election)
@@ -1638,7 +1686,6 @@ class PartisanPrimaryTest(absltest.TestCase):
     root = etree.fromstring(election_string)
 
     election = root.find("Election")
-    election.sourceline = 7
 
     with self.assertRaises(loggers.ElectionWarning):
       rules.PartisanPrimary(root, None).check(election)
@@ -1654,7 +1701,6 @@ class PartisanPrimaryTest(absltest.TestCase):
     root = etree.fromstring(election_string)
 
     election = root.find("Election")
-    election.sourceline = 7
 
     with self.assertRaises(loggers.ElectionWarning):
       rules.PartisanPrimary(root, None).check(election)
@@ -1670,7 +1716,6 @@ class PartisanPrimaryTest(absltest.TestCase):
     root = etree.fromstring(election_string)
 
     election = root.find("Election")
-    election.sourceline = 7
 
     rules.PartisanPrimary(root, None).check(election)
 
@@ -1685,7 +1730,6 @@ class PartisanPrimaryTest(absltest.TestCase):
     root = etree.fromstring(election_string)
 
     election = root.find("Election")
-    election.sourceline = 7
 
     rules.PartisanPrimary(root, None).check(election)
 
@@ -1699,7 +1743,6 @@ class PartisanPrimaryTest(absltest.TestCase):
     root = etree.fromstring(election_string)
 
     election = root.find("Election")
-    election.sourceline = 7
 
     rules.PartisanPrimary(root, None).check(election)
 
@@ -1726,11 +1769,12 @@ class PartisanPrimaryTest(absltest.TestCase):
     elections = root.findall("Election")
 
     for election in elections:
-      election.sourceline = 7
       rules.PartisanPrimary(root, None).check(election)
 
 
-class PartisanPrimaryHeuristicTest(absltest.TestCase):
+class PartisanPrimaryHeuristicTest(
+    _ParsedFixturesMixin, parameterized.TestCase
+):
 
   _base_election_report = """
     <ElectionReport xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
@@ -1750,164 +1794,139 @@ class PartisanPrimaryHeuristicTest(absltest.TestCase):
   _base_candidate_contest = _base_election_report.format(
       _general_candidate_contest)
 
-  def testChecksElections(self):
-    election_details = "<Name>2020 election</Name>"
-    election_string = self._base_election_report.format(election_details)
-    election_tree = etree.fromstring(election_string)
+  _primary_party_contest = """
+    <Name>{}</Name>
+    <PrimaryPartyIds>abc123</PrimaryPartyIds>
+  """
 
-    prim_part_validator = rules.PartisanPrimaryHeuristic(election_tree, None)
-    self.assertEqual(["Election"], prim_part_validator.elements())
+  _FIXTURES = {
+      "no_name": _base_candidate_contest.format("").encode(),
+      "empty_name": _base_candidate_contest.format(
+          _primary_party_contest.format("")).encode(),
+      "dem": _base_candidate_contest.format(
+          _primary_party_contest.format("Might Be Primary (dem)")).encode(),
+      "rep": _base_candidate_contest.format(
+          _primary_party_contest.format("Might Be Primary (rep)")).encode(),
+      "lib": _base_candidate_contest.format(
+          _primary_party_contest.format("Might Be Primary (lib)")).encode(),
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(PartisanPrimaryHeuristicTest, cls).setUpClass()
+    # The heuristic keeps no state between checks, so one instance is shared.
+    cls._heuristic_validator = rules.PartisanPrimaryHeuristic(None, None)
+
+  def _election(self, name):
+    return self._trees[name].find("Election")
 
-  def testIgnoresContestsThatDoNotSuggestPrimary_NoName(self):
-    root_string = self._base_candidate_contest
-    root = etree.fromstring(root_string)
+  def testChecksElections(self):
+    self.assertEqual(["Election"], self._heuristic_validator.elements())
 
-    election = root.find("Election")
-    rules.PartisanPrimaryHeuristic(root, None).check(election)
+  def testIgnoresContestsThatDoNotSuggestPrimary_NoName(self):
+    self._heuristic_validator.check(self._election("no_name"))
 
   def testIgnoresContestsThatDoNotSuggestPrimary_EmptyName(self):
-    contest_details = """
-      <Name></Name>
-      <PrimaryPartyIds>abc123</PrimaryPartyIds>
-    """
-    root_string = self._base_candidate_contest.format(contest_details)
-    root = etree.fromstring(root_string)
-
-    election = root.find("Election").find("Contest")
-    rules.PartisanPrimaryHeuristic(root, None).check(election)
-
-  def testThrowsWarningIfPossiblePrimaryDetected_Dem(self):
-    contest_details = """
-      <Name>Might Be Primary (dem)</Name>
-      <PrimaryPartyIds>abc123</PrimaryPartyIds>
-    """
-    root_string = self._base_candidate_contest.format(contest_details)
-    root = etree.fromstring(root_string)
-
-    election = root.find("Election")
-    election.find("Contest").sourceline = 7
-    with self.assertRaises(loggers.ElectionWarning):
-      rules.PartisanPrimaryHeuristic(root, None).check(election)
-
-  def testThrowsWarningIfPossiblePrimaryDetected_Rep(self):
-    contest_details = """
-      <Name>Might Be Primary (rep)</Name>
-      <PrimaryPartyIds>abc123</PrimaryPartyIds>
-    """
-    root_string = self._base_candidate_contest.format(contest_details)
-    root = etree.fromstring(root_string)
-
-    election = root.find("Election")
-    election.find("Contest").sourceline = 7
-    with self.assertRaises(loggers.ElectionWarning):
-      rules.PartisanPrimaryHeuristic(root, None).check(election)
-
-  def testThrowsWarningIfPossiblePrimaryDetected_Lib(self):
-    contest_details = """
-      <Name>Might Be Primary (lib)</Name>
-      <PrimaryPartyIds>abc123</PrimaryPartyIds>
-    """
-    root_string = self._base_candidate_contest.format(contest_details)
-    root = etree.fromstring(root_string)
+    self._heuristic_validator.check(self._election("empty_name"))
 
-    election = root.find("Election")
-    election.find("Contest").sourceline = 7
+  @parameterized.named_parameters(
+      ("_Dem", "dem"),
+      ("_Rep", "rep"),
+      ("_Lib", "lib"),
+  )
+  def testThrowsWarningIfPossiblePrimaryDetected(self, party):
     with self.assertRaises(loggers.ElectionWarning):
-      rules.PartisanPrimaryHeuristic(root, None).check(election)
+      self._heuristic_validator.check(self._election(party))
 
 
 class CoalitionPartiesTest(absltest.TestCase):
 
-  _base_election_coalition = """
+  _base_election_coalition = b"""
       <Coalition>
-        {}
+        %s
       </Coalition>
   """
 
+  @classmethod
+  def setUpClass(cls):
+    super(CoalitionPartiesTest, cls).setUpClass()
+    cls._coalition_validator = rules.CoalitionParties(None, None)
+
+  def _coalition(self, coalition_details):
+    return etree.fromstring(
+        self._base_election_coalition % coalition_details, _FIXTURE_PARSER
+    )
+
   def testEachCoalitionHasDefinedPartyId(self):
-    coalition_details = "<PartyIds>abc123</PartyIds>"
-    defined_party_string = self._base_election_coalition.format(
-        coalition_details)
-    element = etree.fromstring(defined_party_string)
-    rules.CoalitionParties(None, None).check(element)
+    element = self._coalition(b"<PartyIds>abc123</PartyIds>")
+    self._coalition_validator.check(element)
 
   def testRaisesErrorIfCoalitionDoesNotDefinePartyId_NoPartyId(self):
-    no_party_string = self._base_election_coalition.format("")
-    element = etree.fromstring(no_party_string)
+    element = self._coalition(b"")
 
     with self.assertRaises(loggers.ElectionError):
-      rules.CoalitionParties(None, None).check(element)
+      self._coalition_validator.check(element)
 
   def testRaisesErrorIfCoalitionDoesNotDefinePartyId_EmptyPartyId(self):
-    coalition_details = "<PartyIds></PartyIds>"
-    empty_party_string = self._base_election_coalition.format(coalition_details)
-    element = etree.fromstring(empty_party_string)
+    element = self._coalition(b"<PartyIds></PartyIds>")
 
     with self.assertRaises(loggers.ElectionError):
-      rules.CoalitionParties(None, None).check(element)
+      self._coalition_validator.check(element)
 
   def testRaisesErrorIfCoalitionDoesNotDefinePartyId_Whitespace(self):
-    coalition_details = "<PartyIds>     </PartyIds>"
-    all_space_party_string = self._base_election_coalition.format(
-        coalition_details)
-    element = etree.fromstring(all_space_party_string)
+    element = self._coalition(b"<PartyIds>     </PartyIds>")
 
     with self.assertRaises(loggers.ElectionError):
-      rules.CoalitionParties(None, None).check(element)
-
+      self._coalition_validator.check(element)
+
+
+class UniqueLabelTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "labeled_directions": b"""<Directions label="us-standard"/>""",
+      "unlabeled_directions": b"""<Directions/>""",
+      "schema": b"""<?xml version="1.0" encoding="UTF-8"?>
+        <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+          <xs:element name="Report" type="CoolNewType">
+            <xs:complexType name="ContactInformation">
+              <xs:sequence>
+                  <xs:element maxOccurs="unbounded" minOccurs="0" name="AddressLine" type="xs:string" />
+                  <xs:element maxOccurs="1" minOccurs="0" name="Directions" type="InternationalizedText" />
+              </xs:sequence>
+            </xs:complexType>
+            <xs:complexType name="PollingInformation">
+              <xs:sequence>
+                  <xs:element maxOccurs="unbounded" minOccurs="0" name="AddressLine" type="xs:string" />
+                  <xs:element maxOccurs="1" minOccurs="0" name="Directions" type="InternationalizedText" />
+              </xs:sequence>
+            </xs:complexType>
+          </xs:element>
+        </xs:schema>
+        """,
+  }
 
-class UniqueLabelTest(absltest.TestCase):
+  def setUp(self):
+    super(UniqueLabelTest, self).setUp()
+    # UniqueLabel remembers every label it has seen, so each test gets its own.
+    self.label_validator = rules.UniqueLabel(None, None)
 
   def testChecksElementsWithTypeInternationalizedText(self):
-    schema_tree = etree.fromstring(b"""<?xml version="1.0" encoding="UTF-8"?>
-      <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-        <xs:element name="Report" type="CoolNewType">
-          <xs:complexType name="ContactInformation">
-            <xs:sequence>
-                <xs:element maxOccurs="unbounded" minOccurs="0" name="AddressLine" type="xs:string" />
-                <xs:element maxOccurs="1" minOccurs="0" name="Directions" type="InternationalizedText" />
-            </xs:sequence>
-          </xs:complexType>
-          <xs:complexType name="PollingInformation">
-            <xs:sequence>
-                <xs:element maxOccurs="unbounded" minOccurs="0" name="AddressLine" type="xs:string" />
-                <xs:element maxOccurs="1" minOccurs="0" name="Directions" type="InternationalizedText" />
-            </xs:sequence>
-          </xs:complexType>
-        </xs:element>
-      </xs:schema>
-    """)
-
-    label_validator = rules.UniqueLabel(None, schema_tree)
+    label_validator = rules.UniqueLabel(None, self._trees["schema"])
     self.assertEqual(["Directions"], label_validator.elements())
 
   def testMakesSureAllLabelsAreUnique(self):
-    unique_element_label_string = """
-      <Directions label="us-standard"/>
-    """
-    element = etree.fromstring(unique_element_label_string)
-    label_validator = rules.UniqueLabel(None, None)
-    label_validator.check(element)
-
-    no_element_label_string = """
-      <Directions/>
-    """
-    element = etree.fromstring(no_element_label_string)
-    label_validator = rules.UniqueLabel(None, None)
-    label_validator.check(element)
+    self.label_validator.check(self._trees["labeled_directions"])
+    self.label_validator.check(self._trees["unlabeled_directions"])
 
   def testRaisesErrorIfNotAllLabelsAreUnique(self):
-    unique_element_label_string = """
-      <Directions label="us-standard"/>
-    """
-    element = etree.fromstring(unique_element_label_string)
-    label_validator = rules.UniqueLabel(None, None)
-    label_validator.labels = set(["us-standard"])
+    self.label_validator.labels = {"us-standard"}
     with self.assertRaises(loggers.ElectionError):
-      label_validator.check(element)
+      self.label_validator.check(self._trees["labeled_directions"])
 
 
-class CandidatesReferencedInRelatedContestsTest(absltest.TestCase):
+class CandidatesReferencedInRelatedContestsTest(
+    _SingleErrorMixin, absltest.TestCase
+):
 
   def setUp(self):
     super(CandidatesReferencedInRelatedContestsTest, self).setUp()
@@ -1997,7 +2016,7 @@ class CandidatesReferencedInRelatedContestsTest(absltest.TestCase):
       self.cand_validator._register_person_to_candidate_to_contests(report_elem)
     self.assertEqual(("A Candidate should be referenced in a Contest. "
                       "Candidate can004 is not referenced."),
-                     ee.exception.log_entry[0].message)
+                     _first_msg(ee))
 
   # _construct_contest_graph tests
   def testCreatesNodeForEachContest_NoRelationships(self):
@@ -2060,7 +2079,7 @@ class CandidatesReferencedInRelatedContestsTest(absltest.TestCase):
       self.cand_validator._construct_contest_graph(report_elem)
     self.assertEqual(("Contest con001 contains a subsequent Contest Id "
                       "(con004) that does not exist."),
-                     ee.exception.log_entry[0].message)
+                     _first_msg(ee))
 
   def testReturnsFalseIfAnyContestInGivenListNotRelated_ParentChild(self):
     election_report = """
@@ -2460,10 +2479,11 @@ class CandidatesReferencedInRelatedContestsTest(absltest.TestCase):
     report_elem = etree.fromstring(election_report)
     with self.assertRaises(loggers.ElectionError) as ee:
       self.cand_validator.check(report_elem)
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(("Candidate can001 appears in the following contests"
-                      " which are not all related: con001, con002"),
-                     ee.exception.log_entry[0].message)
+    self._assert_single_error(
+        ee,
+        ("Candidate can001 appears in the following contests"
+         " which are not all related: con001, con002"),
+    )
 
   def testRaisesErrorIfRepeatCandidatesInComposingContests(self):
     election_report = """
@@ -2497,7 +2517,7 @@ class CandidatesReferencedInRelatedContestsTest(absltest.TestCase):
     self.assertLen(ee.exception.log_entry, 2)
     self.assertEqual(("Candidate can001 appears in the following contests"
                       " which are not all related: con001, con002"),
-                     ee.exception.log_entry[0].message)
+                     _first_msg(ee))
     self.assertEqual(("Candidate can002 appears in the following contests"
                       " which are not all related: con001, con002"),
                      ee.exception.log_entry[1].message)
@@ -2539,7 +2559,7 @@ class CandidatesReferencedInRelatedContestsTest(absltest.TestCase):
       self.cand_validator.check(report_elem)
     self.assertLen(ee.exception.log_entry, 2)
     self.assertEqual(("Person per001 has separate candidates in contests "
-                      "that are related."), ee.exception.log_entry[0].message)
+                      "that are related."), _first_msg(ee))
     self.assertEqual(("Person per002 has separate candidates in contests "
                       "that are related."), ee.exception.log_entry[1].message)
 
@@ -2569,7 +2589,7 @@ class ProperBallotSelectionTest(absltest.TestCase):
         </Contest>
       </ElectionReport>
     """
-    element = etree.fromstring(contest_string)
+    element = etree.fromstring(contest_string, _FIXTURE_PARSER)
     self.ballot_selection_validator.check(element.find("Contest"))
 
   def testRaisesAnErrorIfAllSelectionsInContestAreNotOfMatchingType(self):
@@ -2582,12 +2602,12 @@ class ProperBallotSelectionTest(absltest.TestCase):
         </Contest>
       </ElectionReport>
     """
-    element = etree.fromstring(contest_string)
+    element = etree.fromstring(contest_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionError):
       self.ballot_selection_validator.check(element.find("Contest"))
 
 
-class CorrectCandidateSelectionCountTest(absltest.TestCase):
+class CorrectCandidateSelectionCountTest(_SingleErrorMixin, absltest.TestCase):
 
   def setUp(self):
     super(CorrectCandidateSelectionCountTest, self).setUp()
@@ -2606,10 +2626,9 @@ class CorrectCandidateSelectionCountTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as ew:
       self.candidate_selection_validator.check(element.find("BallotSelection"))
 
-    self.assertLen(ew.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ew,
         "The CandidateSelection bs-1 does not reference any candidates.",
-        ew.exception.log_entry[0].message,
     )
 
   def testCandidateSelectionWithMultipleCandidateIds(self):
@@ -2626,11 +2645,10 @@ class CorrectCandidateSelectionCountTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as ew:
       self.candidate_selection_validator.check(element.find("BallotSelection"))
 
-    self.assertLen(ew.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ew,
         "The CandidateSelection bs-1 is expected to have one CandidateIds but 2"
         " were found.",
-        ew.exception.log_entry[0].message,
     )
 
   def testCandidateSelectionWithSingleCandidateIdsAndMultipleCandidates(self):
@@ -2646,12 +2664,11 @@ class CorrectCandidateSelectionCountTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as ew:
       self.candidate_selection_validator.check(element.find("BallotSelection"))
 
-    self.assertLen(ew.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ew,
         "CandidateIds for CandidateSelection bs-1 is expected to reference one"
         " candidate but 3 candidates were found. This warning can be ignored"
         " for party list elections.",
-        ew.exception.log_entry[0].message,
     )
 
   def testCandidateSelectionWithCorrectCandidateIds(self):
@@ -2692,7 +2709,7 @@ class SingularPartySelectionTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.party_selection_validator.check(element)
     self.assertEqual("PartySelection has more than one associated party.",
-                     str(cm.exception.log_entry[0].message))
+                     str(_first_msg(cm)))
     self.assertEqual("ps-456-789",
                      str(cm.exception.log_entry[0].elements[0].get("objectId")))
 
@@ -2707,7 +2724,7 @@ class SingularPartySelectionTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.party_selection_validator.check(element)
     self.assertEqual("PartySelection has no associated parties.",
-                     str(cm.exception.log_entry[0].message))
+                     str(_first_msg(cm)))
     self.assertEqual("ps-none",
                      str(cm.exception.log_entry[0].elements[0].get("objectId")))
 
@@ -2721,73 +2738,71 @@ class SingularPartySelectionTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.party_selection_validator.check(element)
     self.assertEqual("PartySelection has no associated parties.",
-                     str(cm.exception.log_entry[0].message))
+                     str(_first_msg(cm)))
     self.assertEqual("ps-blank",
                      str(cm.exception.log_entry[0].elements[0].get("objectId")))
 
 
-class PartiesHaveValidColorsTest(absltest.TestCase):
+class PartiesHaveValidColorsTest(_ParsedFixturesMixin, absltest.TestCase):
 
-  def setUp(self):
-    super(PartiesHaveValidColorsTest, self).setUp()
-    self._base_string = """
+  _FIXTURES = {
+      "party": b"""
         <Party objectId="par0001">
           <Name>
             <Text language="en">Republican</Text>
           </Name>
-          {}
         </Party>
-    """
-    self._color_str = "<Color>{}</Color>"
+        """,
+  }
+
+  def setUp(self):
+    super(PartiesHaveValidColorsTest, self).setUp()
     self.color_validator = rules.PartiesHaveValidColors(None, None)
 
+  def _party_with_color(self, color):
+    party = copy.deepcopy(self._trees["party"])
+    etree.SubElement(party, "Color").text = color
+    return party
+
   def testPartiesHaveValidColorsLowercase(self):
-    root_string = self._base_string.format(self._color_str.format("ff0000"))
-    element = etree.fromstring(root_string)
-    self.color_validator.check(element)
+    self.color_validator.check(self._party_with_color("ff0000"))
 
   def testPartiesHaveValidColorsUppercase(self):
-    root_string = self._base_string.format(self._color_str.format("FF0000"))
-    element = etree.fromstring(root_string)
-    self.color_validator.check(element)
+    self.color_validator.check(self._party_with_color("FF0000"))
 
   def testColorHasPoundSign(self):
-    root_string = self._base_string.format(self._color_str.format("#0000ff"))
-    element = etree.fromstring(root_string)
+    element = self._party_with_color("#0000ff")
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.color_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "#0000ff is not a valid hex color.")
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Color")
+    self.assertEqual(_first_tag(cm), "Color")
 
   def testColorTagMissingValue(self):
-    root_string = self._base_string.format(self._color_str.format(""))
-    element = etree.fromstring(root_string)
+    element = self._party_with_color(None)
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.color_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Color tag is missing a value.")
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Color")
+    self.assertEqual(_first_tag(cm), "Color")
 
   def testPartiesHaveNonHex(self):
-    root_string = self._base_string.format(self._color_str.format("green"))
-    element = etree.fromstring(root_string)
+    element = self._party_with_color("green")
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.color_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "green is not a valid hex color.")
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Color")
+    self.assertEqual(_first_tag(cm), "Color")
 
   def testPartiesHaveTooLargeHex(self):
-    root_string = self._base_string.format(self._color_str.format("c295757"))
-    element = etree.fromstring(root_string)
+    element = self._party_with_color("c295757")
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.color_validator.check(element)
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "c295757 should be a hexadecimal less than 16^6.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Color")
+    self.assertEqual(_first_tag(cm), "Color")
 
   def testPartyHasMoreThanOneColor(self):
     root_string = """
@@ -2802,70 +2817,69 @@ class PartiesHaveValidColorsTest(absltest.TestCase):
     element = etree.fromstring(root_string)
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.color_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "The Party has more than one color.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "par0001")
 
 
-class ValidateDuplicateColorsTest(absltest.TestCase):
-
-  def setUp(self):
-    super(ValidateDuplicateColorsTest, self).setUp()
-    self.root_string = """
-      <ElectionReport xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
-        <Election>
-          <ContestCollection>
-            <Contest objectId="con1" xsi:type="PartyContest">
-              <BallotSelection objectId="ps1" xsi:type="PartySelection">
-                <PartyIds>par0001</PartyIds>
-              </BallotSelection>
-              <BallotSelection objectId="ps2" xsi:type="PartySelection">
-                <PartyIds>par0002</PartyIds>
-              </BallotSelection>
-            </Contest>
-            <Contest objectId="con2" xsi:type="PartyContest">
-              <BallotSelection objectId="ps3" xsi:type="PartySelection">
-                <PartyIds>par0003</PartyIds>
-              </BallotSelection>
-            </Contest>
-          </ContestCollection>
-        </Election>
-        <PartyCollection>
-          <Party objectId="par0001">
-            <Name>
-              <Text language="en">Republican</Text>
-            </Name>
-            {0}
-          </Party>
-          <Party objectId="par0002">
-            <Name>
-              <Text language="en">Democratic</Text>
-            </Name>
-            {1}
-          </Party>
-          <Party objectId="par0003">
-            <Name>
-              <Text language="en">Green</Text>
-            </Name>
-            {2}
-          </Party>
-        </PartyCollection>
-      </ElectionReport>
-    """
-    self._color_str = "<Color>{}</Color>"
+class ValidateDuplicateColorsTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "election_report": b"""
+        <ElectionReport xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+          <Election>
+            <ContestCollection>
+              <Contest objectId="con1" xsi:type="PartyContest">
+                <BallotSelection objectId="ps1" xsi:type="PartySelection">
+                  <PartyIds>par0001</PartyIds>
+                </BallotSelection>
+                <BallotSelection objectId="ps2" xsi:type="PartySelection">
+                  <PartyIds>par0002</PartyIds>
+                </BallotSelection>
+              </Contest>
+              <Contest objectId="con2" xsi:type="PartyContest">
+                <BallotSelection objectId="ps3" xsi:type="PartySelection">
+                  <PartyIds>par0003</PartyIds>
+                </BallotSelection>
+              </Contest>
+            </ContestCollection>
+          </Election>
+          <PartyCollection>
+            <Party objectId="par0001">
+              <Name>
+                <Text language="en">Republican</Text>
+              </Name>
+            </Party>
+            <Party objectId="par0002">
+              <Name>
+                <Text language="en">Democratic</Text>
+              </Name>
+            </Party>
+            <Party objectId="par0003">
+              <Name>
+                <Text language="en">Green</Text>
+              </Name>
+            </Party>
+          </PartyCollection>
+        </ElectionReport>
+        """,
+  }
+
+  def _election_with_colors(self, *colors):
+    """Returns a copy of the report with the given colors, one per Party."""
+    election_tree = copy.deepcopy(self._trees["election_report"])
+    parties = election_tree.find("PartyCollection").iterchildren("Party")
+    for party, color in zip(parties, colors):
+      etree.SubElement(party, "Color").text = color
+    return election_tree
 
   def testContestWithPartiesHaveDuplicateColors(self):
-    test_string = self.root_string.format(
-        self._color_str.format("ff0000"),
-        self._color_str.format("ff0000"),
-        self._color_str.format("ff0000"),
-    )
-    election_tree = etree.fromstring(test_string)
+    election_tree = self._election_with_colors("ff0000", "ff0000", "ff0000")
     with self.assertRaises(loggers.ElectionWarning) as cm:
       rules.ValidateDuplicateColors(election_tree, None).check()
     self.assertEqual(
-        cm.exception.log_entry[0].message, "Parties have the same color ff0000."
+        _first_msg(cm), "Parties have the same color ff0000."
     )
     self.assertLen(cm.exception.log_entry[0].elements, 2)
     duplicated_parties = [
@@ -2876,12 +2890,7 @@ class ValidateDuplicateColorsTest(absltest.TestCase):
     self.assertIn("par0002", duplicated_parties)
 
   def testPartiesHaveUniqueColorsPerContest(self):
-    test_string = self.root_string.format(
-        self._color_str.format("ff0000"),
-        self._color_str.format("0000ff"),
-        self._color_str.format("ff0000"),
-    )
-    election_tree = etree.fromstring(test_string)
+    election_tree = self._election_with_colors("ff0000", "0000ff", "ff0000")
     rules.ValidateDuplicateColors(election_tree, None).check()
 
 
@@ -2960,7 +2969,7 @@ class MultipleCandidatesPointToTheSamePersonInTheSameContestTest(
             "Multiple candidates in Contest contest2 reference the same Person"
             " per3. Candidates: ['can3', 'can4']"
         ),
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
   def testValidMultipleCandidatesDifferentPersonInDifferentContest(self):
@@ -2993,7 +3002,7 @@ class MultipleCandidatesPointToTheSamePersonInTheSameContestTest(
             "Multiple candidates in Contest contest1 reference the same Person"
             " per1. Candidates: ['can1', 'can3']"
         ),
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
     self.assertIn(
         (
@@ -3090,7 +3099,7 @@ class SelfDeclaredCandidateMethodTest(absltest.TestCase):
     self.assertIn(
         "A self declared candidate cannot have an electoral-commission id."
         " Please update the candidate Pre election Status.",
-        str(ew.exception.log_entry[0].message))
+        str(_first_msg(ew)))
 
 
 class DuplicatedPartyAbbreviationTest(absltest.TestCase):
@@ -3104,11 +3113,11 @@ class DuplicatedPartyAbbreviationTest(absltest.TestCase):
       <PartyCollection>
       </PartyCollection>
     """
-    element = etree.fromstring(root_string)
+    element = etree.fromstring(root_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
     self.assertEqual("<PartyCollection> does not have <Party> objects",
-                     cm.exception.log_entry[0].message)
+                     _first_msg(cm))
 
   def testPartyWithoutInternationalizedAbbreviation(self):
     root_string = """
@@ -3129,11 +3138,11 @@ class DuplicatedPartyAbbreviationTest(absltest.TestCase):
         </Party>
       </PartyCollection>
     """
-    element = etree.fromstring(root_string)
+    element = etree.fromstring(root_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
     self.assertEqual(
-        str(cm.exception.log_entry[0].message),
+        str(_first_msg(cm)),
         ("<Party> does not have <InternationalizedAbbreviation> "
          "objects"))
     self.assertEqual(
@@ -3162,10 +3171,10 @@ class DuplicatedPartyAbbreviationTest(absltest.TestCase):
         </Party>
       </PartyCollection>
     """
-    element = etree.fromstring(root_string)
+    element = etree.fromstring(root_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Parties have the same abbreviation in en.")
     self.assertLen(cm.exception.log_entry[0].elements, 2)
     duplicated_parties = [
@@ -3195,10 +3204,28 @@ class DuplicatedPartyAbbreviationTest(absltest.TestCase):
         </Party>
       </PartyCollection>
     """
-    element = etree.fromstring(root_string)
+    element = etree.fromstring(root_string, _FIXTURE_PARSER)
     self.parties_validator.check(element)
 
 
+def _person(object_id, full_name, date_of_birth=None):
+  """Builds a Person with an English FullName and an optional birthday."""
+  person = etree.Element("Person", objectId=object_id)
+  full_name_element = etree.SubElement(person, "FullName")
+  etree.SubElement(full_name_element, "Text", language="en").text = full_name
+  etree.SubElement(person, "Gender").text = "M"
+  if date_of_birth is not None:
+    etree.SubElement(person, "DateOfBirth").text = date_of_birth
+  return person
+
+
+def _person_collection(*people):
+  """Builds a PersonCollection holding the given Person elements."""
+  person_collection = etree.Element("PersonCollection")
+  person_collection.extend(people)
+  return person_collection
+
+
 class PersonHasUniqueFullNameTest(absltest.TestCase):
 
   def setUp(self):
@@ -3206,130 +3233,50 @@ class PersonHasUniqueFullNameTest(absltest.TestCase):
     self.people_validator = rules.PersonHasUniqueFullName(None, None)
 
   def testEmptyPersonCollection(self):
-    root_string = """
-      <PersonCollection>
-      </PersonCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _person_collection()
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.people_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "<PersonCollection> does not have <Person> objects")
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(cm),
                      "PersonCollection")
 
   def testPersonCollectionWithDuplicatedFullNameWithoutBirthday(self):
-    root_string = """
-      <PersonCollection>
-        <Person objectId="per_gb_6459172">
-          <FullName>
-            <Text language="en">Jamie David Adams</Text>
-          </FullName>
-          <Gender>M</Gender>
-        </Person>
-        <Person objectId="per_gb_6436252">
-          <FullName>
-            <Text language="en">Jamie David Adams</Text>
-          </FullName>
-          <Gender>M</Gender>
-        </Person>
-      </PersonCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _person_collection(
+        _person("per_gb_6459172", "Jamie David Adams"),
+        _person("per_gb_6436252", "Jamie David Adams"),
+    )
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.people_validator.check(element)
     self.assertIn("Person has same full name",
-                  cm.exception.log_entry[0].message)
+                  _first_msg(cm))
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "per_gb_6436252")
 
   def testPersonCollectionWithDuplicatedFullNameWithBirthday(self):
-    root_string = """
-      <PersonCollection>
-        <Person objectId="per_gb_6456562">
-          <FirstName>Jamie</FirstName>
-          <FullName>
-            <Text language="en">Jamie David Adams</Text>
-          </FullName>
-          <Gender>M</Gender>
-          <LastName>Adams</LastName>
-          <MiddleName>David</MiddleName>
-          <DateOfBirth>1944-12-11</DateOfBirth>
-        </Person>
-        <Person objectId="per_gb_64201052">
-          <FirstName>Jamie</FirstName>
-          <FullName>
-            <Text language="en">Jamie David Adams</Text>
-          </FullName>
-          <Gender>M</Gender>
-          <LastName>Adams</LastName>
-          <MiddleName>David</MiddleName>
-          <DateOfBirth>1944-12-11</DateOfBirth>
-        </Person>
-      </PersonCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _person_collection(
+        _person("per_gb_6456562", "Jamie David Adams", "1944-12-11"),
+        _person("per_gb_64201052", "Jamie David Adams", "1944-12-11"),
+    )
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.people_validator.check(element)
     self.assertIn("Person has same full name",
-                  cm.exception.log_entry[0].message)
+                  _first_msg(cm))
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "per_gb_64201052")
 
   def testPersonCollectionWithDuplicatedFullNameButDifferentBirthday(self):
-    root_string = """
-      <PersonCollection>
-        <Person objectId="per_gb_600452">
-          <FirstName>Jamie</FirstName>
-          <FullName>
-            <Text language="en">Jamie David Adams</Text>
-          </FullName>
-          <Gender>M</Gender>
-          <LastName>Adams</LastName>
-          <MiddleName>David</MiddleName>
-          <DateOfBirth>1944-12-11</DateOfBirth>
-        </Person>
-        <Person objectId="per_gb_6456322">
-          <FirstName>Jamie</FirstName>
-          <FullName>
-            <Text language="en">Jamie David Adams</Text>
-          </FullName>
-          <Gender>M</Gender>
-          <LastName>Adams</LastName>
-          <MiddleName>David</MiddleName>
-          <DateOfBirth>1972-11-20</DateOfBirth>
-        </Person>
-      </PersonCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _person_collection(
+        _person("per_gb_600452", "Jamie David Adams", "1944-12-11"),
+        _person("per_gb_6456322", "Jamie David Adams", "1972-11-20"),
+    )
     self.people_validator.check(element)
 
   def testPersonCollectionWithoutAnyWarning(self):
-    root_string = """
-      <PersonCollection>
-        <Person objectId="per_gb_64532">
-          <FirstName>Jamie</FirstName>
-          <FullName>
-            <Text language="en">Jamie David Adams</Text>
-          </FullName>
-          <Gender>M</Gender>
-          <LastName>Adams</LastName>
-          <MiddleName>David</MiddleName>
-          <DateOfBirth>1992-12-20</DateOfBirth>
-        </Person>
-        <Person objectId="per_gb_647752">
-          <FirstName>Arthur</FirstName>
-          <FullName>
-            <Text language="en">Arthur Maupassant Maurice</Text>
-          </FullName>
-          <Gender>M</Gender>
-          <LastName>Maurice</LastName>
-          <MiddleName>Maupassant</MiddleName>
-          <DateOfBirth>1972-11-20</DateOfBirth>
-        </Person>
-      </PersonCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _person_collection(
+        _person("per_gb_64532", "Jamie David Adams", "1992-12-20"),
+        _person("per_gb_647752", "Arthur Maupassant Maurice", "1972-11-20"),
+    )
     self.people_validator.check(element)
 
 
@@ -3344,11 +3291,11 @@ class DuplicatedPartyNameTest(absltest.TestCase):
       <PartyCollection>
       </PartyCollection>
     """
-    element = etree.fromstring(root_string)
+    element = etree.fromstring(root_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
     self.assertEqual(
-        str(cm.exception.log_entry[0].message),
+        str(_first_msg(cm)),
         "<PartyCollection> does not have <Party> objects")
 
   def testPartyWithoutName(self):
@@ -3370,11 +3317,11 @@ class DuplicatedPartyNameTest(absltest.TestCase):
         </Party>
       </PartyCollection>
     """
-    element = etree.fromstring(root_string)
+    element = etree.fromstring(root_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
     self.assertEqual(
-        str(cm.exception.log_entry[0].message),
+        str(_first_msg(cm)),
         "<Party> does not have <Name> objects")
     self.assertEqual(
         str(cm.exception.log_entry[0].elements[0].get("objectId")), "par0001")
@@ -3402,10 +3349,10 @@ class DuplicatedPartyNameTest(absltest.TestCase):
         </Party>
       </PartyCollection>
     """
-    element = etree.fromstring(root_string)
+    element = etree.fromstring(root_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Parties have the same name in en.")
     self.assertLen(cm.exception.log_entry[0].elements, 2)
     duplicated_parties = [
@@ -3435,261 +3382,155 @@ class DuplicatedPartyNameTest(absltest.TestCase):
         </Party>
       </PartyCollection>
     """
-    element = etree.fromstring(root_string)
+    element = etree.fromstring(root_string, _FIXTURE_PARSER)
     self.parties_validator.check(element)
 
 
+def _party_collection(text_tag, parties):
+  """Builds a PartyCollection from (objectId, texts) pairs.
+
+  Args:
+    text_tag: The internationalized text element to add to each Party, e.g.
+      "Name" or "InternationalizedAbbreviation".
+    parties: (objectId, texts) pairs where texts is a list of (language, text)
+      pairs, or None to leave the Party without a text_tag element.
+
+  Returns:
+    The PartyCollection element.
+  """
+  party_collection = etree.Element("PartyCollection")
+  for object_id, texts in parties:
+    party = etree.SubElement(party_collection, "Party", objectId=object_id)
+    if texts is not None:
+      text_element = etree.SubElement(party, text_tag)
+      for language, text in texts:
+        etree.SubElement(text_element, "Text", language=language).text = text
+  return party_collection
+
+
 class MissingPartyNameTranslationTest(absltest.TestCase):
 
-  def setUp(self):
-    super(MissingPartyNameTranslationTest, self).setUp()
-    self.parties_validator = rules.MissingPartyNameTranslation(None, None)
+  @classmethod
+  def setUpClass(cls):
+    super(MissingPartyNameTranslationTest, cls).setUpClass()
+    cls.parties_validator = rules.MissingPartyNameTranslation(None, None)
 
   def testPartyCollectionWithoutParty(self):
-    root_string = """
-      <PartyCollection>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("Name", [])
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "<PartyCollection> does not have <Party> objects")
 
   def testPartyWithoutName(self):
-    root_string = """
-      <PartyCollection>
-        <Party objectId="par0001">
-        </Party>
-        <Party objectId="par0002">
-          <Name>
-            <Text language="en">Democratic</Text>
-            <Text language="ro">Democratic</Text>
-          </Name>
-        </Party>
-        <Party objectId="par0003">
-          <Name>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Others</Text>
-          </Name>
-        </Party>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("Name", [
+        ("par0001", None),
+        ("par0002", [("en", "Democratic"), ("ro", "Democratic")]),
+        ("par0003", [("en", "Republican"), ("ro", "Others")]),
+    ])
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "<Party> does not have <Name> objects")
 
   def testMissingTranslationAtTheBeginning(self):
-    root_string = """
-      <PartyCollection>
-        <Party objectId="par0001">
-          <Name>
-            <Text language="en">Republican</Text>
-          </Name>
-        </Party>
-        <Party objectId="par0002">
-          <Name>
-            <Text language="en">Democratic</Text>
-            <Text language="ro">Democratico</Text>
-          </Name>
-        </Party>
-        <Party objectId="par0003">
-          <Name>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Others</Text>
-          </Name>
-        </Party>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("Name", [
+        ("par0001", [("en", "Republican")]),
+        ("par0002", [("en", "Democratic"), ("ro", "Democratico")]),
+        ("par0003", [("en", "Republican"), ("ro", "Others")]),
+    ])
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
     self.assertEqual(("The feed is missing names translation to ro for parties "
-                      ": {'par0001'}."), cm.exception.log_entry[0].message)
+                      ": {'par0001'}."), _first_msg(cm))
 
   def testMissingTranslationInTheMiddle(self):
-    root_string = """
-      <PartyCollection>
-        <Party objectId="par0001">
-          <Name>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Republican</Text>
-          </Name>
-        </Party>
-        <Party objectId="par0002">
-          <Name>
-            <Text language="en">Democratic</Text>
-          </Name>
-        </Party>
-        <Party objectId="par0003">
-          <Name>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Others</Text>
-          </Name>
-        </Party>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("Name", [
+        ("par0001", [("en", "Republican"), ("ro", "Republican")]),
+        ("par0002", [("en", "Democratic")]),
+        ("par0003", [("en", "Republican"), ("ro", "Others")]),
+    ])
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
     self.assertIn("The party name is not translated to all feed languages",
-                  cm.exception.log_entry[0].message)
-    self.assertIn("en", cm.exception.log_entry[0].message)
-    self.assertIn("ro", cm.exception.log_entry[0].message)
+                  _first_msg(cm))
+    self.assertIn("en", _first_msg(cm))
+    self.assertIn("ro", _first_msg(cm))
     self.assertIn("You did it only for the following languages : {'en'}.",
-                  cm.exception.log_entry[0].message)
+                  _first_msg(cm))
 
   def testWithAllGoodTranslation(self):
-    root_string = """
-      <PartyCollection>
-        <Party objectId="par0001">
-          <Name>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Republican</Text>
-          </Name>
-        </Party>
-        <Party objectId="par0003">
-          <Name>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Others</Text>
-          </Name>
-        </Party>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("Name", [
+        ("par0001", [("en", "Republican"), ("ro", "Republican")]),
+        ("par0003", [("en", "Republican"), ("ro", "Others")]),
+    ])
     self.parties_validator.check(element)
 
 
 class MissingPartyAbbreviationTranslationTest(absltest.TestCase):
 
-  def setUp(self):
-    super(MissingPartyAbbreviationTranslationTest, self).setUp()
-    self.parties_validator = rules.MissingPartyAbbreviationTranslation(
+  @classmethod
+  def setUpClass(cls):
+    super(MissingPartyAbbreviationTranslationTest, cls).setUpClass()
+    cls.parties_validator = rules.MissingPartyAbbreviationTranslation(
         None, None)
 
   def testPartyCollectionWithoutParty(self):
-    root_string = """
-      <PartyCollection>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("InternationalizedAbbreviation", [])
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "<PartyCollection> does not have <Party> objects")
 
   def testPartyWithoutInternationalizedAbbreviation(self):
-    root_string = """
-      <PartyCollection>
-        <Party objectId="par0001">
-        </Party>
-        <Party objectId="par0002">
-          <InternationalizedAbbreviation>
-            <Text language="en">Democratic</Text>
-            <Text language="ro">Democratic</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-        <Party objectId="par0003">
-          <InternationalizedAbbreviation>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Others</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("InternationalizedAbbreviation", [
+        ("par0001", None),
+        ("par0002", [("en", "Democratic"), ("ro", "Democratic")]),
+        ("par0003", [("en", "Republican"), ("ro", "Others")]),
+    ])
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("<Party> does not have <InternationalizedAbbreviation> "
                       "objects"))
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "par0001")
 
   def testMissingTranslationAtTheBeginning(self):
-    root_string = """
-      <PartyCollection>
-        <Party objectId="par0001">
-          <InternationalizedAbbreviation>
-            <Text language="en">Republican</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-        <Party objectId="par0002">
-          <InternationalizedAbbreviation>
-            <Text language="en">Democratic</Text>
-            <Text language="ro">Democratico</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-        <Party objectId="par0003">
-          <InternationalizedAbbreviation>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Others</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("InternationalizedAbbreviation", [
+        ("par0001", [("en", "Republican")]),
+        ("par0002", [("en", "Democratic"), ("ro", "Democratico")]),
+        ("par0003", [("en", "Republican"), ("ro", "Others")]),
+    ])
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("The feed is missing abbreviation translation to ro for "
                       "parties : {'par0001'}."))
 
   def testMissingTranslationInTheMiddle(self):
-    root_string = """
-      <PartyCollection>
-        <Party objectId="par0001">
-          <InternationalizedAbbreviation>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Republican</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-        <Party objectId="par0002">
-          <InternationalizedAbbreviation>
-            <Text language="en">Democratic</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-        <Party objectId="par0003">
-          <InternationalizedAbbreviation>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Others</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("InternationalizedAbbreviation", [
+        ("par0001", [("en", "Republican"), ("ro", "Republican")]),
+        ("par0002", [("en", "Democratic")]),
+        ("par0003", [("en", "Republican"), ("ro", "Others")]),
+    ])
     with self.assertRaises(loggers.ElectionInfo) as cm:
       self.parties_validator.check(element)
     self.assertIn(
         "The party abbreviation is not translated to all feed "
-        "languages ", cm.exception.log_entry[0].message)
-    self.assertIn("en", cm.exception.log_entry[0].message)
-    self.assertIn("ro", cm.exception.log_entry[0].message)
+        "languages ", _first_msg(cm))
+    self.assertIn("en", _first_msg(cm))
+    self.assertIn("ro", _first_msg(cm))
     self.assertIn("You only did it for the following languages : {'en'}.",
-                  cm.exception.log_entry[0].message)
+                  _first_msg(cm))
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "par0002")
 
   def testWithAllGoodTranslation(self):
-    root_string = """
-      <PartyCollection>
-        <Party objectId="par0001">
-          <InternationalizedAbbreviation>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Republican</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-        <Party objectId="par0003">
-          <InternationalizedAbbreviation>
-            <Text language="en">Republican</Text>
-            <Text language="ro">Others</Text>
-          </InternationalizedAbbreviation>
-        </Party>
-      </PartyCollection>
-    """
-    element = etree.fromstring(root_string)
+    element = _party_collection("InternationalizedAbbreviation", [
+        ("par0001", [("en", "Republican"), ("ro", "Republican")]),
+        ("par0003", [("en", "Republican"), ("ro", "Others")]),
+    ])
     self.parties_validator.check(element)
 
 
@@ -3707,7 +3548,7 @@ class IndependentPartyNameTest(absltest.TestCase):
           </Name>
         </Party>
         """
-    party_elem = etree.fromstring(party)
+    party_elem = etree.fromstring(party, _FIXTURE_PARSER)
 
     with self.assertRaises(loggers.ElectionWarning):
       self.parties_validator.check(party_elem)
@@ -3720,7 +3561,7 @@ class IndependentPartyNameTest(absltest.TestCase):
           </Name>
         </Party>
         """
-    party_elem = etree.fromstring(party)
+    party_elem = etree.fromstring(party, _FIXTURE_PARSER)
 
     with self.assertRaises(loggers.ElectionWarning):
       self.parties_validator.check(party_elem)
@@ -3734,70 +3575,58 @@ class IndependentPartyNameTest(absltest.TestCase):
           <IsIndependent>true</IsIndependent>
         </Party>
         """
-    party_elem = etree.fromstring(party)
+    party_elem = etree.fromstring(party, _FIXTURE_PARSER)
 
     self.parties_validator.check(party_elem)
 
 
-class DuplicateContestNamesTest(absltest.TestCase):
+class DuplicateContestNamesTest(_ParsedFixturesMixin, absltest.TestCase):
 
-  def setUp(self):
-    super(DuplicateContestNamesTest, self).setUp()
-    self.duplicate_validator = rules.DuplicateContestNames(None, None)
-    self._base_report = """
-          <ContestCollection>
-            <Contest objectId="cc11111">
-              {}
-            </Contest>
-            <Contest objectId="cc22222">
-              {}
-            </Contest>
-            <Contest objectId="cc33333">
-              {}
-            </Contest>
-          </ContestCollection>
-    """
+  _base_report = """
+        <ContestCollection>
+          <Contest objectId="cc11111">
+            <Name>President</Name>
+          </Contest>
+          <Contest objectId="cc22222">
+            {}
+          </Contest>
+        </ContestCollection>
+  """
+
+  _FIXTURES = {
+      "unique": _base_report.format("<Name>Treasurer</Name>").encode(),
+      "missing": _base_report.format("").encode(),
+      "empty": _base_report.format("<Name></Name>").encode(),
+      "duplicate": _base_report.format("<Name>President</Name>").encode(),
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(DuplicateContestNamesTest, cls).setUpClass()
+    cls.duplicate_validator = rules.DuplicateContestNames(None, None)
 
   def testEveryContestHasAUniqueName(self):
-    pres = "<Name>President</Name>"
-    sec = "<Name>Secretary</Name>"
-    tres = "<Name>Treasurer</Name>"
-    root_string = self._base_report.format(pres, sec, tres)
-    election_tree = etree.fromstring(root_string)
-    self.duplicate_validator.check(election_tree)
+    self.duplicate_validator.check(self._trees["unique"])
 
   def testRaisesAnErrorIfContestIsMissingNameOrNameIsEmpty_Missing(self):
-    pres = "<Name>President</Name>"
-    sec = "<Name>Secretary</Name>"
-    root_string = self._base_report.format(pres, sec, "")
-    election_tree = etree.fromstring(root_string)
     with self.assertRaises(loggers.ElectionError):
-      self.duplicate_validator.check(election_tree)
+      self.duplicate_validator.check(self._trees["missing"])
 
   def testRaisesAnErrorIfContestIsMissingNameOrNameIsEmpty_Empty(self):
-    pres = "<Name>President</Name>"
-    sec = "<Name>Secretary</Name>"
-    empty = "<Name></Name>"
-    root_string = self._base_report.format(pres, sec, empty)
-    election_tree = etree.fromstring(root_string)
     with self.assertRaises(loggers.ElectionError):
-      self.duplicate_validator.check(election_tree)
+      self.duplicate_validator.check(self._trees["empty"])
 
   def testRaisesAnErrorIfNameIsNotUnique(self):
-    pres = "<Name>President</Name>"
-    sec = "<Name>Secretary</Name>"
-    duplicate = "<Name>President</Name>"
-    root_string = self._base_report.format(pres, sec, duplicate)
-    election_tree = etree.fromstring(root_string)
     with self.assertRaises(loggers.ElectionError):
-      self.duplicate_validator.check(election_tree)
+      self.duplicate_validator.check(self._trees["duplicate"])
 
 
 class ValidStableIDTest(absltest.TestCase):
 
-  def setUp(self):
-    super(ValidStableIDTest, self).setUp()
-    self.root_string = """
+  @classmethod
+  def setUpClass(cls):
+    super(ValidStableIDTest, cls).setUpClass()
+    cls.root_string = """
       <ExternalIdentifiers>
         <ExternalIdentifier>
           <Type>{}</Type>
@@ -3806,47 +3635,52 @@ class ValidStableIDTest(absltest.TestCase):
         </ExternalIdentifier>
       </ExternalIdentifiers>
     """
-    self.stable_string = "<OtherType>stable</OtherType>"
-    self.stable_id_validator = rules.ValidStableID(None, None)
+    cls.stable_string = "<OtherType>stable</OtherType>"
+    cls.stable_id_validator = rules.ValidStableID(None, None)
 
   def testValidStableID(self):
 
     test_string = self.root_string.format("other", self.stable_string,
                                           "vageneral-cand-2013-va-obama")
-    self.stable_id_validator.check(etree.fromstring(test_string))
+    self.stable_id_validator.check(
+        etree.fromstring(test_string, _FIXTURE_PARSER))
 
   def testNonStableIDOtherTypesDontThrowError(self):
 
     test_string = self.root_string.format("other",
                                           "<OtherType>anothertype</OtherType>",
                                           "vageneral-cand-2013-va-obama")
-    self.stable_id_validator.check(etree.fromstring(test_string))
+    self.stable_id_validator.check(
+        etree.fromstring(test_string, _FIXTURE_PARSER))
 
   def testNonStableIDTypesDontThrowError(self):
     test_string = self.root_string.format("ocd-id", "",
                                           "ocd-id/country/state/thing")
-    self.stable_id_validator.check(etree.fromstring(test_string))
+    self.stable_id_validator.check(
+        etree.fromstring(test_string, _FIXTURE_PARSER))
 
   def testInvalidStableID(self):
 
     test_string = self.root_string.format("other", self.stable_string,
                                           "cand-2013-va-obama!")
     with self.assertRaises(loggers.ElectionError) as cm:
-      self.stable_id_validator.check(etree.fromstring(test_string))
+      self.stable_id_validator.check(
+          etree.fromstring(test_string, _FIXTURE_PARSER))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Stable id 'cand-2013-va-obama!' is not in the correct format.")
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(cm),
                      "ExternalIdentifiers")
 
   def testEmptyStableIDFails(self):
 
     test_string = self.root_string.format("other", self.stable_string, "   ")
     with self.assertRaises(loggers.ElectionError) as cm:
-      self.stable_id_validator.check(etree.fromstring(test_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+      self.stable_id_validator.check(
+          etree.fromstring(test_string, _FIXTURE_PARSER))
+    self.assertEqual(_first_msg(cm),
                      "Stable id '   ' is not in the correct format.")
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(cm),
                      "ExternalIdentifiers")
 
 
@@ -3912,30 +3746,30 @@ class UniqueStableIDTest(absltest.TestCase):
 
     test_string = self.root_string.format("04_AS", "04_A", "stable-can-1",
                                           "stable-can-2", "stable-can-3")
-    election_tree = etree.fromstring(test_string)
+    election_tree = etree.fromstring(test_string, _FIXTURE_PARSER)
     rules.UniqueStableID(election_tree, None).check()
 
   def testUniqueStableIDFail(self):
 
     test_string = self.root_string.format("04_AS", "04_A", "04_AS",
                                           "stable-can-2", "stable-can-3")
-    election_tree = etree.fromstring(test_string)
+    election_tree = etree.fromstring(test_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionError) as ee:
       rules.UniqueStableID(election_tree, None).check()
     self.assertEqual(
         "Stable ID 04_AS is not unique as it is mapped in ['off04_AS', 'can1']",
-        ee.exception.log_entry[0].message)
+        _first_msg(ee))
 
   def testUniqueStableIDFailMultipleElements(self):
 
     test_string = self.root_string.format("04_AS", "04_A", "04_AS", "04_A",
                                           "stable-can-3")
-    election_tree = etree.fromstring(test_string)
+    election_tree = etree.fromstring(test_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionError) as ee:
       rules.UniqueStableID(election_tree, None).check()
     self.assertEqual(
         "Stable ID 04_AS is not unique as it is mapped in ['off04_AS', 'can1']",
-        ee.exception.log_entry[0].message)
+        _first_msg(ee))
     self.assertEqual(
         "Stable ID 04_A is not unique as it is mapped in ['off04_A', 'can2']",
         ee.exception.log_entry[1].message)
@@ -3943,23 +3777,20 @@ class UniqueStableIDTest(absltest.TestCase):
   def testUniqueStableIDFailThreeElements(self):
     test_string = self.root_string.format("04_AS", "04_A", "04_AS", "04_A",
                                           "04_A")
-    election_tree = etree.fromstring(test_string)
+    election_tree = etree.fromstring(test_string, _FIXTURE_PARSER)
     with self.assertRaises(loggers.ElectionError) as ee:
       rules.UniqueStableID(election_tree, None).check()
     self.assertEqual(
         "Stable ID 04_AS is not unique as it is mapped in ['off04_AS', 'can1']",
-        ee.exception.log_entry[0].message)
+        _first_msg(ee))
     self.assertEqual(
         "Stable ID 04_A is not unique as it is mapped in ['off04_A', 'can2', 'can3']",
         ee.exception.log_entry[1].message)
 
 
-class MissingStableIdsTest(absltest.TestCase):
+class MissingStableIdsTest(_ParsedFixturesMixin, parameterized.TestCase):
 
-  def setUp(self):
-    super(MissingStableIdsTest, self).setUp()
-    self.missing_ids_validator = rules.MissingStableIds(None, None)
-    self.root_string = """
+  _root_string = """
       {}
       <ExternalIdentifiers>
         <ExternalIdentifier>
@@ -3969,7 +3800,29 @@ class MissingStableIdsTest(absltest.TestCase):
         </ExternalIdentifier>
       </ExternalIdentifiers>
       {}
-    """
+  """
+
+  _FIXTURES = {
+      "office_with_stable_id": _root_string.format(
+          "<Office objectId='off1'>", "stable", "stable-off0", "</Office>"
+      ).encode(),
+      "candidate_with_other_id": _root_string.format(
+          "<Candidate objectId='can1'>", "some-other-id", "some-other-value",
+          "</Candidate>"
+      ).encode(),
+      "contest_with_empty_stable_id": _root_string.format(
+          "<Contest objectId='con1'>", "stable", "", "</Contest>"
+      ).encode(),
+      "party_without_identifiers": b"""
+        <Party objectId="par1">
+        </Party>
+        """,
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(MissingStableIdsTest, cls).setUpClass()
+    cls.missing_ids_validator = rules.MissingStableIds(None, None)
 
   def testItShouldCheckAllElementsListedInReturnStatement(self):
     elements = self.missing_ids_validator.elements()
@@ -3989,47 +3842,26 @@ class MissingStableIdsTest(absltest.TestCase):
     self.assertIn("PartyLeadership", elements)
 
   def testStableIdPresentForOffice(self):
-    test_string = self.root_string.format("<Office objectId='off1'>", "stable",
-                                          "stable-off0", "</Office>")
-    element = etree.fromstring(test_string)
-    self.missing_ids_validator.check(element)
-
-  def testStableIdMissingForCandidate(self):
-    test_string = self.root_string.format("<Candidate objectId='can1'>",
-                                          "some-other-id", "some-other-value",
-                                          "</Candidate>")
-    element = etree.fromstring(test_string)
-    with self.assertRaises(loggers.ElectionError) as ee:
-      self.missing_ids_validator.check(element)
-    self.assertEqual(ee.exception.log_entry[0].message,
-                     "The element is missing a stable id")
-
-  def testStableIdEmptyTextForContest(self):
-    test_string = self.root_string.format("<Contest objectId='con1'>", "stable",
-                                          "", "</Contest>")
-    element = etree.fromstring(test_string)
-    with self.assertRaises(loggers.ElectionError) as ee:
-      self.missing_ids_validator.check(element)
-    self.assertEqual(ee.exception.log_entry[0].message,
-                     "The element is missing a stable id")
+    self.missing_ids_validator.check(self._trees["office_with_stable_id"])
 
-  def testMissingIdentifierBlockForParty(self):
-    test_string = """
-      <Party objectId="par1">
-      </Party>
-    """
-    element = etree.fromstring(test_string)
+  @parameterized.named_parameters(
+      ("_StableIdMissingForCandidate", "candidate_with_other_id"),
+      ("_StableIdEmptyTextForContest", "contest_with_empty_stable_id"),
+      ("_MissingIdentifierBlockForParty", "party_without_identifiers"),
+  )
+  def testMissingStableId(self, fixture):
     with self.assertRaises(loggers.ElectionError) as ee:
-      self.missing_ids_validator.check(element)
-    self.assertEqual(ee.exception.log_entry[0].message,
+      self.missing_ids_validator.check(self._trees[fixture])
+    self.assertEqual(_first_msg(ee),
                      "The element is missing a stable id")
 
 
 class PersonsMissingPartyDataTest(absltest.TestCase):
 
-  def setUp(self):
-    super(PersonsMissingPartyDataTest, self).setUp()
-    self.party_validator = rules.PersonsMissingPartyData(None, None)
+  @classmethod
+  def setUpClass(cls):
+    super(PersonsMissingPartyDataTest, cls).setUpClass()
+    cls.party_validator = rules.PersonsMissingPartyData(None, None)
 
   def testChecksPersonElements(self):
     self.assertEqual(["Person"], self.party_validator.elements())
@@ -4040,7 +3872,8 @@ class PersonsMissingPartyDataTest(absltest.TestCase):
         <PartyId>par1</PartyId>
       </Person>
     """
-    self.party_validator.check(etree.fromstring(element_string))
+    self.party_validator.check(
+        etree.fromstring(element_string, _FIXTURE_PARSER))
 
   def testRaisesErrorForMissingOrEmptyPartyId(self):
     element_string = """
@@ -4050,14 +3883,16 @@ class PersonsMissingPartyDataTest(absltest.TestCase):
     """
 
     with self.assertRaises(loggers.ElectionWarning):
-      self.party_validator.check(etree.fromstring(element_string))
+      self.party_validator.check(
+          etree.fromstring(element_string, _FIXTURE_PARSER))
 
 
 class AllCapsTest(absltest.TestCase):
 
-  def setUp(self):
-    super(AllCapsTest, self).setUp()
-    self.caps_validator = rules.AllCaps(None, None)
+  @classmethod
+  def setUpClass(cls):
+    super(AllCapsTest, cls).setUpClass()
+    cls.caps_validator = rules.AllCaps(None, None)
 
   def testOnlyChecksListedElements(self):
     expected_elements = [
@@ -4074,7 +3909,7 @@ class AllCapsTest(absltest.TestCase):
         </BallotName>
       </Candidate>
     """
-    element = etree.fromstring(candidate_string)
+    element = etree.fromstring(candidate_string, _FIXTURE_PARSER)
 
     self.caps_validator.check(element)
 
@@ -4082,7 +3917,7 @@ class AllCapsTest(absltest.TestCase):
     no_ballot_name_string = """
       <Candidate/>
     """
-    element = etree.fromstring(no_ballot_name_string)
+    element = etree.fromstring(no_ballot_name_string, _FIXTURE_PARSER)
 
     self.caps_validator.check(element)
 
@@ -4092,7 +3927,7 @@ class AllCapsTest(absltest.TestCase):
         <BallotName/>
       </Candidate>
     """
-    element = etree.fromstring(no_text_string)
+    element = etree.fromstring(no_text_string, _FIXTURE_PARSER)
 
     self.caps_validator.check(element)
 
@@ -4104,7 +3939,7 @@ class AllCapsTest(absltest.TestCase):
         </BallotName>
       </Candidate>
     """
-    element = etree.fromstring(candidate_string)
+    element = etree.fromstring(candidate_string, _FIXTURE_PARSER)
 
     with self.assertRaises(loggers.ElectionWarning):
       self.caps_validator.check(element)
@@ -4121,7 +3956,7 @@ class AllCapsTest(absltest.TestCase):
         </Election>
       </ElectionReport>
     """
-    root_element = etree.fromstring(contest_string)
+    root_element = etree.fromstring(contest_string, _FIXTURE_PARSER)
     self.caps_validator.check(
         root_element.find("Election//ContestCollection//Contest"))
 
@@ -4136,7 +3971,7 @@ class AllCapsTest(absltest.TestCase):
         </Election>
       </ElectionReport>
     """
-    root_element = etree.fromstring(contest_string)
+    root_element = etree.fromstring(contest_string, _FIXTURE_PARSER)
     self.caps_validator.check(
         root_element.find("Election//ContestCollection//Contest"))
 
@@ -4152,7 +3987,7 @@ class AllCapsTest(absltest.TestCase):
         </Election>
       </ElectionReport>
     """
-    root_element = etree.fromstring(contest_string)
+    root_element = etree.fromstring(contest_string, _FIXTURE_PARSER)
 
     with self.assertRaises(loggers.ElectionWarning):
       self.caps_validator.check(
@@ -4170,7 +4005,7 @@ class AllCapsTest(absltest.TestCase):
         </Election>
       </ElectionReport>
     """
-    root_element = etree.fromstring(contest_string)
+    root_element = etree.fromstring(contest_string, _FIXTURE_PARSER)
     self.caps_validator.check(
         root_element.find("Election//ContestCollection//Contest"))
 
@@ -4185,7 +4020,7 @@ class AllCapsTest(absltest.TestCase):
         </Election>
       </ElectionReport>
     """
-    root_element = etree.fromstring(contest_string)
+    root_element = etree.fromstring(contest_string, _FIXTURE_PARSER)
     self.caps_validator.check(
         root_element.find("Election//ContestCollection//Contest"))
 
@@ -4201,7 +4036,7 @@ class AllCapsTest(absltest.TestCase):
         </Election>
       </ElectionReport>
     """
-    root_element = etree.fromstring(contest_string)
+    root_element = etree.fromstring(contest_string, _FIXTURE_PARSER)
 
     with self.assertRaises(loggers.ElectionWarning):
       self.caps_validator.check(
@@ -4211,7 +4046,7 @@ class AllCapsTest(absltest.TestCase):
     no_full_name_string = """
       <Person/>
     """
-    element = etree.fromstring(no_full_name_string)
+    element = etree.fromstring(no_full_name_string, _FIXTURE_PARSER)
 
     self.caps_validator.check(element)
 
@@ -4221,7 +4056,7 @@ class AllCapsTest(absltest.TestCase):
         <FullName/>
       </Person>
     """
-    element = etree.fromstring(no_text_string)
+    element = etree.fromstring(no_text_string, _FIXTURE_PARSER)
 
     self.caps_validator.check(element)
 
@@ -4233,13 +4068,30 @@ class AllCapsTest(absltest.TestCase):
         </FullName>
       </Person>
     """
-    element = etree.fromstring(person_string)
+    element = etree.fromstring(person_string, _FIXTURE_PARSER)
 
     with self.assertRaises(loggers.ElectionWarning):
       self.caps_validator.check(element)
 
 
-class AllLanguagesTest(absltest.TestCase):
+class AllLanguagesTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "full_name_en_es_nl": b"""
+        <FullName>
+          <Text language="en">Name</Text>
+          <Text language="es">Nombre</Text>
+          <Text language="nl">Naam</Text>
+        </FullName>
+        """,
+      "full_name_en_es": b"""
+        <FullName>
+          <Text language="en">Name</Text>
+          <Text language="es">Nombre</Text>
+        </FullName>
+        """,
+      "empty_ballot_name": b"<BallotName/>",
+  }
 
   def setUp(self):
     super(AllLanguagesTest, self).setUp()
@@ -4250,43 +4102,20 @@ class AllLanguagesTest(absltest.TestCase):
     self.assertEqual(expected_elements, self.language_validator.elements())
 
   def testGivenElementHasTextForEachRequiredLanguage(self):
-    root_string = """
-      <FullName>
-        <Text language="en">Name</Text>
-        <Text language="es">Nombre</Text>
-        <Text language="nl">Naam</Text>
-      </FullName>
-    """
     self.language_validator.required_languages = ["en", "es", "nl"]
-    self.language_validator.check(etree.fromstring(root_string))
+    self.language_validator.check(self._trees["full_name_en_es_nl"])
 
   def testGivenElementCanSupportMoreThanRequiredLanguages(self):
-    root_string = """
-      <FullName>
-        <Text language="en">Name</Text>
-        <Text language="es">Nombre</Text>
-        <Text language="nl">Naam</Text>
-      </FullName>
-    """
     self.language_validator.required_languages = ["en"]
-    self.language_validator.check(etree.fromstring(root_string))
+    self.language_validator.check(self._trees["full_name_en_es_nl"])
 
   def testRaisesAnErrorIfRequiredLanguageIsMissing(self):
-    root_string = """
-      <FullName>
-        <Text language="en">Name</Text>
-        <Text language="es">Nombre</Text>
-      </FullName>
-    """
     self.language_validator.required_languages = ["en", "es", "nl"]
     with self.assertRaises(loggers.ElectionError):
-      self.language_validator.check(etree.fromstring(root_string))
+      self.language_validator.check(self._trees["full_name_en_es"])
 
   def testIgnoresElementsWithoutTextElements(self):
-    empty_element_string = """
-      <BallotName/>
-    """
-    self.language_validator.check(etree.fromstring(empty_element_string))
+    self.language_validator.check(self._trees["empty_ballot_name"])
 
 
 class ValidEnumerationsTest(absltest.TestCase):
@@ -4394,12 +4223,9 @@ class ValidEnumerationsTest(absltest.TestCase):
     self.enum_validator.check(element)
 
 
-class ValidateOcdidLowerCaseTest(absltest.TestCase):
+class ValidateOcdidLowerCaseTest(_ParsedFixturesMixin, absltest.TestCase):
 
-  def setUp(self):
-    super(ValidateOcdidLowerCaseTest, self).setUp()
-    self.ocdid_validator = rules.ValidateOcdidLowerCase(None, None)
-    self.ext_ids_str = """
+  _ext_ids_str = """
     <ExternalIdentifiers>
       <ExternalIdentifier>
        {}
@@ -4408,42 +4234,47 @@ class ValidateOcdidLowerCaseTest(absltest.TestCase):
     </ExternalIdentifiers>
     """
 
+  _FIXTURES = {
+      "valid": _ext_ids_str.format(
+          "<Type>ocd-id</Type>",
+          "<Value>ocd-division/country:us/state:va</Value>").encode(),
+      "uppercase": _ext_ids_str.format(
+          "<Type>ocd-id</Type>",
+          "<Value>ocd-division/country:us/state:VA</Value>").encode(),
+      "no_type": _ext_ids_str.format("", "").encode(),
+      "non_ocdid": _ext_ids_str.format("<Type>not-ocdid</Type>", "").encode(),
+      "ocdid_missing_value": _ext_ids_str.format(
+          "<Type>ocd-id</Type>", "").encode(),
+      "empty_value": _ext_ids_str.format(
+          "<Type>ocd-id</Type>", "<Value></Value>").encode(),
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(ValidateOcdidLowerCaseTest, cls).setUpClass()
+    cls.ocdid_validator = rules.ValidateOcdidLowerCase(None, None)
+
   def testItChecksExternalIdentifiersElements(self):
     self.assertEqual(["ExternalIdentifiers"], self.ocdid_validator.elements())
 
   def testItMakesSureOcdidsAreAllLowerCase(self):
-    valid_id_string = self.ext_ids_str.format(
-        "<Type>ocd-id</Type>",
-        "<Value>ocd-division/country:us/state:va</Value>")
-    self.ocdid_validator.check(etree.fromstring(valid_id_string))
+    self.ocdid_validator.check(self._trees["valid"])
 
   def testRaisesWarningIfOcdidHasUpperCaseLetter(self):
-    uppercase_string = self.ext_ids_str.format(
-        "<Type>ocd-id</Type>",
-        "<Value>ocd-division/country:us/state:VA</Value>")
     with self.assertRaises(loggers.ElectionWarning) as ew:
-      self.ocdid_validator.check(etree.fromstring(uppercase_string))
-    self.assertEqual(ew.exception.log_entry[0].message,
+      self.ocdid_validator.check(self._trees["uppercase"])
+    self.assertEqual(_first_msg(ew),
                      ("OCD-ID ocd-division/country:us/state:VA is not in all "
                       "lower case letters. Valid OCD-IDs should be all "
                       "lowercase."))
-    self.assertEqual(ew.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(ew),
                      "ExternalIdentifiers")
 
   def testIgnoresElementsWithoutValidOcdidXml(self):
-    no_type_string = self.ext_ids_str.format("", "")
-    self.ocdid_validator.check(etree.fromstring(no_type_string))
-
-    non_ocdid_string = self.ext_ids_str.format("<Type>not-ocdid</Type>", "")
-    self.ocdid_validator.check(etree.fromstring(non_ocdid_string))
-
-    ocdid_missing_value_string = self.ext_ids_str.format(
-        "<Type>ocd-id</Type>", "")
-    self.ocdid_validator.check(etree.fromstring(ocdid_missing_value_string))
-
-    empty_value_string = self.ext_ids_str.format("<Type>ocd-id</Type>",
-                                                 "<Value></Value>")
-    self.ocdid_validator.check(etree.fromstring(empty_value_string))
+    self.ocdid_validator.check(self._trees["no_type"])
+    self.ocdid_validator.check(self._trees["non_ocdid"])
+    self.ocdid_validator.check(self._trees["ocdid_missing_value"])
+    self.ocdid_validator.check(self._trees["empty_value"])
 
 
 class ContestHasMultipleOfficesTest(absltest.TestCase):
@@ -4479,7 +4310,7 @@ class ContestHasMultipleOfficesTest(absltest.TestCase):
       self.contest_offices_validator.check(
           element.find("Election//ContestCollection//Contest"))
     self.assertEqual("Contest has more than one associated office.",
-                     str(cm.exception.log_entry[0].message))
+                     str(_first_msg(cm)))
     self.assertEqual("con123",
                      str(cm.exception.log_entry[0].elements[0].get("objectId")))
 
@@ -4491,7 +4322,7 @@ class ContestHasMultipleOfficesTest(absltest.TestCase):
       self.contest_offices_validator.check(
           element.find("Election//ContestCollection//Contest"))
     self.assertEqual("Contest has no associated offices.",
-                     str(cm.exception.log_entry[0].message))
+                     str(_first_msg(cm)))
     self.assertEqual("con123",
                      str(cm.exception.log_entry[0].elements[0].get("objectId")))
 
@@ -4509,10 +4340,13 @@ class PersonHasOfficeTest(absltest.TestCase):
     </xml>
   """
 
+  def _election_tree(self, xml_string):
+    return etree.ElementTree(etree.fromstring(xml_string, _FIXTURE_PARSER))
+
   # _gather_reference_values tests
   def testReturnsPersonIdsFromPersonCollection(self):
     root_string = self._base_xml.format("")
-    election_tree = etree.ElementTree(etree.fromstring(root_string))
+    election_tree = self._election_tree(root_string)
     office_validator = rules.PersonHasOffice(election_tree, None)
 
     reference_values = office_validator._gather_reference_values()
@@ -4550,7 +4384,7 @@ class PersonHasOfficeTest(absltest.TestCase):
       </PartyCollection>
     """
     root_string = self._base_xml.format(defined_collections)
-    election_tree = etree.ElementTree(etree.fromstring(root_string))
+    election_tree = self._election_tree(root_string)
     office_validator = rules.PersonHasOffice(election_tree, None)
 
     defined_values = office_validator._gather_defined_values()
@@ -4566,25 +4400,22 @@ class PersonHasOfficeTest(absltest.TestCase):
         <Office><OfficeHolderPersonIds>p3</OfficeHolderPersonIds></Office>
       </OfficeCollection>
     """
-    root_string = io.BytesIO(
-        bytes(self._base_xml.format(office_collection).encode()))
-    election_tree = etree.parse(root_string)
+    election_tree = self._election_tree(
+        self._base_xml.format(office_collection))
     office_validator = rules.PersonHasOffice(election_tree, None)
     office_validator.check()
 
   def testIgnoresTreesWithNoRoots(self):
-    no_root_string = io.BytesIO(b"<OfficeCollection/>")
-    election_tree = etree.parse(no_root_string)
+    election_tree = self._election_tree("<OfficeCollection/>")
     office_validator = rules.PersonHasOffice(election_tree, None)
     office_validator.check()
 
   def testIgnoresRootsWithNoPersonCollection(self):
-    no_collection_string = io.BytesIO(b"""
+    election_tree = self._election_tree("""
       <xml>
         <OfficeCollection/>
       </xml>
     """)
-    election_tree = etree.parse(no_collection_string)
     office_validator = rules.PersonHasOffice(election_tree, None)
     office_validator.check()
 
@@ -4596,16 +4427,14 @@ class PersonHasOfficeTest(absltest.TestCase):
         <Office/>
       </OfficeCollection>
     """
-    root_string = io.BytesIO(
-        bytes(self._base_xml.format(office_collection).encode()))
-    election_tree = etree.parse(root_string)
+    election_tree = self._election_tree(
+        self._base_xml.format(office_collection))
     office_validator = rules.PersonHasOffice(election_tree, None)
     with self.assertRaises(loggers.ElectionError):
       office_validator.check()
 
   def testRaisesErrorIfTheresAPersonCollectionButNoOfficeCollection(self):
-    root_string = io.BytesIO(bytes(self._base_xml.encode()))
-    election_tree = etree.parse(root_string)
+    election_tree = self._election_tree(self._base_xml)
     office_validator = rules.PersonHasOffice(election_tree, None)
     with self.assertRaises(loggers.ElectionError):
       office_validator.check()
@@ -4633,9 +4462,8 @@ class PersonHasOfficeTest(absltest.TestCase):
           </Party>
         </PartyCollection>
     """
-    root_string = io.BytesIO(
-        bytes(self._base_xml.format(office_party_collections).encode()))
-    election_tree = etree.parse(root_string)
+    election_tree = self._election_tree(
+        self._base_xml.format(office_party_collections))
     office_validator = rules.PersonHasOffice(election_tree, None)
     office_validator.check()
 
@@ -4658,9 +4486,8 @@ class PersonHasOfficeTest(absltest.TestCase):
         </Office>
       </OfficeCollection>
     """
-    root_string = io.BytesIO(
-        bytes(self._base_xml.format(office_collection).encode()))
-    election_tree = etree.parse(root_string)
+    election_tree = self._election_tree(
+        self._base_xml.format(office_collection))
     rules.PersonHasOffice(election_tree, None).check()
 
   def testPersonHasOneOffice_fails(self):
@@ -4674,15 +4501,14 @@ class PersonHasOfficeTest(absltest.TestCase):
         </Office>
       </OfficeCollection>
     """
-    root_string = io.BytesIO(
-        bytes(self._base_xml.format(office_collection).encode()))
-    election_tree = etree.parse(root_string)
+    election_tree = self._election_tree(
+        self._base_xml.format(office_collection))
 
     with self.assertRaises(loggers.ElectionError) as cm:
       rules.PersonHasOffice(election_tree, None).check()
 
     self.assertIn("No defined data for p3 found in the feed.",
-                  cm.exception.log_entry[0].message)
+                  _first_msg(cm))
 
   def testOfficeHasOnePerson_fails(self):
     office_collection = """
@@ -4695,20 +4521,19 @@ class PersonHasOfficeTest(absltest.TestCase):
         </Office>
       </OfficeCollection>
     """
-    root_string = io.BytesIO(
-        bytes(self._base_xml.format(office_collection).encode()))
-    election_tree = etree.parse(root_string)
+    election_tree = self._election_tree(
+        self._base_xml.format(office_collection))
 
     with self.assertRaises(loggers.ElectionError) as cm:
       rules.PersonHasOffice(election_tree, None).check()
 
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office has 2 OfficeHolders. Must have exactly one.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "o2")
 
 
-class PartyLeadershipMustExistTest(absltest.TestCase):
+class PartyLeadershipMustExistTest(_ParsedFixturesMixin, absltest.TestCase):
 
   _party_collection = """
     <PartyCollection>
@@ -4733,19 +4558,39 @@ class PartyLeadershipMustExistTest(absltest.TestCase):
     </PartyCollection>
   """
 
+  _FIXTURES = {
+      "leaders_defined": """
+        <xml>
+          <PersonCollection>
+            <Person objectId="p2" />
+            <Person objectId="p3" />
+          </PersonCollection>
+          {}
+        </xml>
+      """.format(_party_collection).encode(),
+      "other_people_defined": """
+        <xml>
+          <PersonCollection>
+            <Person objectId="p4" />
+            <Person objectId="p5" />
+          </PersonCollection>
+          {}
+        </xml>
+      """.format(_party_collection).encode(),
+      "no_people": """
+        <xml>
+          {}
+        </xml>
+      """.format(_party_collection).encode(),
+  }
+
+  def _validator(self, fixture):
+    election_tree = etree.ElementTree(self._trees[fixture])
+    return rules.PartyLeadershipMustExist(election_tree, None)
+
   # _gather_reference_values tests
   def testReturnsSetOfPartyLeaderIds(self):
-    root_string = """
-      <xml>
-        <PersonCollection>
-          <Person objectId="p2" />
-          <Person objectId="p3" />
-        </PersonCollection>
-        {}
-      </xml>
-    """.format(self._party_collection)
-    election_tree = etree.ElementTree(etree.fromstring(root_string))
-    leadership_validator = rules.PartyLeadershipMustExist(election_tree, None)
+    leadership_validator = self._validator("leaders_defined")
 
     reference_values = leadership_validator._gather_reference_values()
     expected_reference_values = set(["p2", "p3"])
@@ -4753,17 +4598,7 @@ class PartyLeadershipMustExistTest(absltest.TestCase):
 
   # _gather_defined_values tests
   def testReturnsSetOfPersonObjectIds(self):
-    root_string = """
-      <xml>
-        <PersonCollection>
-          <Person objectId="p4" />
-          <Person objectId="p5" />
-        </PersonCollection>
-        {}
-      </xml>
-    """.format(self._party_collection)
-    election_tree = etree.ElementTree(etree.fromstring(root_string))
-    leadership_validator = rules.PartyLeadershipMustExist(election_tree, None)
+    leadership_validator = self._validator("other_people_defined")
 
     defined_values = leadership_validator._gather_defined_values()
     expected_defined_values = set(["p4", "p5"])
@@ -4771,29 +4606,11 @@ class PartyLeadershipMustExistTest(absltest.TestCase):
 
   # check tests
   def testPartyLeadershipExists(self):
-    xml_string = """
-      <xml>
-        <PersonCollection>
-          <Person objectId="p2" />
-          <Person objectId="p3" />
-        </PersonCollection>
-        {}
-      </xml>
-    """.format(self._party_collection)
-    root_string = io.BytesIO(bytes(xml_string.encode()))
-    election_tree = etree.parse(root_string)
-    rules.PartyLeadershipMustExist(election_tree, None).check()
+    self._validator("leaders_defined").check()
 
   def testPartyLeadershipExists_fails(self):
-    xml_string = """
-      <xml>
-        {}
-      </xml>
-    """.format(self._party_collection)
-    root_string = io.BytesIO(bytes(xml_string.encode()))
     with self.assertRaises(loggers.ElectionError):
-      election_tree = etree.parse(root_string)
-      rules.PartyLeadershipMustExist(election_tree, None).check()
+      self._validator("no_people").check()
 
 
 class ProhibitElectionDataTest(absltest.TestCase):
@@ -4817,7 +4634,7 @@ class ProhibitElectionDataTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       rules.ProhibitElectionData(election_tree, None).check()
     self.assertIn("Election data is prohibited",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
 
 class PersonsHaveValidGenderTest(absltest.TestCase):
@@ -4902,7 +4719,7 @@ class VoteCountTypesCoherencyTest(absltest.TestCase):
       self.vc_coherency.check(etree.fromstring(contest))
 
     for vc_type in rules.VoteCountTypesCoherency.CAND_VC_TYPES:
-      self.assertIn(vc_type, str(cm.exception.log_entry[0].message))
+      self.assertIn(vc_type, str(_first_msg(cm)))
 
   def testInvalidNotInCandidateContest(self):
     vote_counts = """
@@ -4959,7 +4776,7 @@ class VoteCountTypesCoherencyTest(absltest.TestCase):
       self.vc_coherency.check(etree.fromstring(contest))
 
     for vc_type in rules.VoteCountTypesCoherency.PARTY_VC_TYPES:
-      self.assertIn(vc_type, cm.exception.log_entry[0].message)
+      self.assertIn(vc_type, _first_msg(cm))
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "pc1")
 
@@ -4992,31 +4809,31 @@ class URIValidatorTest(absltest.TestCase):
     invalid_scheme = self.uri_element.format("")
     with self.assertRaises(loggers.ElectionError) as ee:
       self.uri_validator.check(etree.fromstring(invalid_scheme))
-    self.assertIn("Missing URI value.", ee.exception.log_entry[0].message)
+    self.assertIn("Missing URI value.", _first_msg(ee))
 
   def testRaisesAnErrorIfNoSchemeProvided(self):
     missing_scheme = self.uri_element.format("www.whitehouse.gov")
     with self.assertRaises(loggers.ElectionError) as ee:
       self.uri_validator.check(etree.fromstring(missing_scheme))
-    self.assertIn("protocol - invalid", ee.exception.log_entry[0].message)
+    self.assertIn("protocol - invalid", _first_msg(ee))
 
   def testRaisesAnErrorIfSchemeIsNotInApprovedList(self):
     invalid_scheme = self.uri_element.format("tps://www.whitehouse.gov")
     with self.assertRaises(loggers.ElectionError) as ee:
       self.uri_validator.check(etree.fromstring(invalid_scheme))
-    self.assertIn("protocol - invalid", ee.exception.log_entry[0].message)
+    self.assertIn("protocol - invalid", _first_msg(ee))
 
   def testRaisesAnErrorIfNetLocationNotProvided(self):
     missing_netloc = self.uri_element.format("missing/loc.md")
     with self.assertRaises(loggers.ElectionError) as ee:
       self.uri_validator.check(etree.fromstring(missing_netloc))
-    self.assertIn("domain - missing", ee.exception.log_entry[0].message)
+    self.assertIn("domain - missing", _first_msg(ee))
 
   def testRaisesAnErrorIfUriNotAscii(self):
     unicode_url = self.uri_element.format(u"https://nahnah.com/nopê")
     with self.assertRaises(loggers.ElectionError) as ee:
       self.uri_validator.check(etree.fromstring(unicode_url))
-    self.assertIn("not ascii encoded", ee.exception.log_entry[0].message)
+    self.assertIn("not ascii encoded", _first_msg(ee))
 
   def testAllowsQueryParamsToBeIncluded(self):
     contains_query = self.uri_element.format(
@@ -5027,8 +4844,8 @@ class URIValidatorTest(absltest.TestCase):
     multiple_issues = self.uri_element.format("missing/loc.md?filter=yesplease")
     with self.assertRaises(loggers.ElectionError) as ee:
       self.uri_validator.check(etree.fromstring(multiple_issues))
-    self.assertIn("protocol - invalid", ee.exception.log_entry[0].message)
-    self.assertIn("domain - missing", ee.exception.log_entry[0].message)
+    self.assertIn("protocol - invalid", _first_msg(ee))
+    self.assertIn("domain - missing", _first_msg(ee))
 
   def testChecksForValidUriHttpsFace(self):
     valid_url = self.uri_element.format("https://www.facebook.com")
@@ -5076,7 +4893,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.facebook.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testChecksForValidUriHttpWikiInvalid(self):
     invalid_url = self.uri_element.format("http://www.wikipedia.com")
@@ -5084,7 +4901,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.wikipedia.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testChecksForValidUriHttpTwitInvalid(self):
     invalid_url = self.uri_element.format("http://www.twitter.com")
@@ -5092,7 +4909,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.twitter.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testChecksForValidUriHttpInsInvalid(self):
     invalid_url = self.uri_element.format("http://www.instagram.com")
@@ -5100,7 +4917,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.instagram.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testChecksForValidUriHttpYouInvalid(self):
     invalid_url = self.uri_element.format("http://www.youtube.com")
@@ -5108,7 +4925,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.youtube.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testChecksForValidUriHttpWebInvalid(self):
     invalid_url = self.uri_element.format("http://www.website.com")
@@ -5116,7 +4933,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.website.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testChecksForValidUriHttpLinInvalid(self):
     invalid_url = self.uri_element.format("http://www.linkedin.com")
@@ -5124,7 +4941,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.linkedin.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testChecksForValidUriHttpLineInvalid(self):
     invalid_url = self.uri_element.format("http://www.line.com")
@@ -5132,7 +4949,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.line.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testChecksForValidUriHttpBallInvalid(self):
     invalid_url = self.uri_element.format("http://www.ballotpedia.com")
@@ -5140,7 +4957,7 @@ class URIValidatorTest(absltest.TestCase):
       self.uri_validator.check(etree.fromstring(invalid_url))
     self.assertIn("It is recommended to use https instead of http. "
                   "The provided URI, 'http://www.ballotpedia.com'.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
 
 class UniqueURIPerAnnotationCategoryTest(absltest.TestCase):
@@ -5379,7 +5196,7 @@ class UniqueURIPerAnnotationCategoryTest(absltest.TestCase):
       uri_validator.check()
     self.assertEqual(("The Uris contain the annotation type 'wikipedia' with "
                       "the same value 'https://wikipedia.com/dunder_mifflin'."),
-                     ew.exception.log_entry[0].message)
+                     _first_msg(ew))
     self.assertLen(ew.exception.log_entry[0].elements, 4)
 
   def testOfficeURIsAreNotIncludedInCheck(self):
@@ -5417,11 +5234,11 @@ class ValidYoutubeURLTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.valid_yt_url.check(etree.fromstring(root_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "'https://www.youtube.com/watch?v=k-F_qYKkqaVxbA' is not an expected"
         " value for a youtube channel.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testYTPlaylistUrlReturnError(self):
     root_string = """
@@ -5432,11 +5249,11 @@ class ValidYoutubeURLTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.valid_yt_url.check(etree.fromstring(root_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "'https://www.youtube.com/playlist?list=PLCvVBOK6lIHsfkBVt0oCFMSRz_grSwC4N'"
         " is not an expected value for a youtube channel.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testYTHashtagUrlReturnError(self):
     root_string = """
@@ -5447,11 +5264,11 @@ class ValidYoutubeURLTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.valid_yt_url.check(etree.fromstring(root_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "'https://www.youtube.com/hashtag/xyz' is not an expected value for a"
         " youtube channel.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testBasicYTUrlReturnError(self):
     root_string = """
@@ -5462,11 +5279,11 @@ class ValidYoutubeURLTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.valid_yt_url.check(etree.fromstring(root_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "'https://www.youtube.com/' is not an expected value for a youtube"
         " channel.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
 
 class ValidTikTokURLTest(parameterized.TestCase):
@@ -5501,10 +5318,10 @@ class ValidTikTokURLTest(parameterized.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.validator.check(etree.fromstring(root_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         f"'{url}' is not an expected value for a tiktok account.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
 
 class ValidURIAnnotationTest(absltest.TestCase):
@@ -5596,10 +5413,10 @@ class ValidURIAnnotationTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.valid_annotation.check(etree.fromstring(root_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "URI {0} is missing annotation.".format("https://twitter.com".encode(
             "ascii", "ignore")))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testNoTypeWhenTypePlatformWarning(self):
     root_string = """
@@ -5614,9 +5431,9 @@ class ValidURIAnnotationTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.valid_annotation.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Annotation 'website' missing usage type.")
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testNoPlatformHasUsageTypeWarning(self):
     root_string = """
@@ -5631,9 +5448,9 @@ class ValidURIAnnotationTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionError) as cm:
       self.valid_annotation.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Annotation 'campaign' has usage type, missing platform.")
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testIncorrectPlatformFails(self):
     root_string = """
@@ -5649,10 +5466,10 @@ class ValidURIAnnotationTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.valid_annotation.check(etree.fromstring(root_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         ("Annotation 'personal-twitter' is incorrect for URI {0}.".format(
             "https://www.youtube.com/SmithForGov".encode("ascii", "ignore"))))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testNonExistentPlatformFails(self):
     root_string = """
@@ -5667,9 +5484,9 @@ class ValidURIAnnotationTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.valid_annotation.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("'campaign-netsite' is not a valid annotation."))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testFBAnnotation(self):
     root_string = """
@@ -5694,9 +5511,9 @@ class ValidURIAnnotationTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.valid_annotation.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("'official-fb' is not a valid annotation."))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
   def testXAnnotation(self):
     root_string = """
@@ -5721,9 +5538,9 @@ class ValidURIAnnotationTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionWarning) as cm:
       self.valid_annotation.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("'official-x' is not a valid annotation."))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Uri")
+    self.assertEqual(_first_tag(cm), "Uri")
 
 
 class OfficesHaveJurisdictionIDTest(absltest.TestCase):
@@ -5763,7 +5580,7 @@ class OfficesHaveJurisdictionIDTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing a jurisdiction-id.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -5777,7 +5594,7 @@ class OfficesHaveJurisdictionIDTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing a jurisdiction-id.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -5792,7 +5609,7 @@ class OfficesHaveJurisdictionIDTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office has more than one jurisdiction-id.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off1")
@@ -5809,7 +5626,7 @@ class OfficesHaveJurisdictionIDTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing a jurisdiction-id.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -5827,7 +5644,7 @@ class OfficesHaveJurisdictionIDTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing a jurisdiction-id.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -5850,7 +5667,7 @@ class OfficesHaveJurisdictionIDTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office has more than one jurisdiction-id.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off1")
@@ -5868,7 +5685,7 @@ class OfficesHaveJurisdictionIDTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing a jurisdiction-id.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -5882,7 +5699,7 @@ class OfficesHaveJurisdictionIDTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing a jurisdiction-id.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6034,7 +5851,7 @@ class ValidJurisdictionIDTest(absltest.TestCase):
     election_tree = etree.ElementTree(etree.fromstring(root_string))
     with self.assertRaises(loggers.ElectionError) as ee:
       rules.ValidJurisdictionID(election_tree, None).check()
-    self.assertIn("ru-gpu99", ee.exception.log_entry[0].message)
+    self.assertIn("ru-gpu99", _first_msg(ee))
 
 
 class OfficesHaveValidOfficeLevelTest(absltest.TestCase):
@@ -6075,7 +5892,7 @@ class OfficesHaveValidOfficeLevelTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing an office-level.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6093,7 +5910,7 @@ class OfficesHaveValidOfficeLevelTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing an office-level.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6116,7 +5933,7 @@ class OfficesHaveValidOfficeLevelTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office has more than one office-level.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off1")
@@ -6134,7 +5951,7 @@ class OfficesHaveValidOfficeLevelTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office is missing an office-level.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6152,7 +5969,7 @@ class OfficesHaveValidOfficeLevelTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "Office has invalid office-level invalidvalue.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6189,7 +6006,7 @@ class OfficesHaveValidOfficeRoleTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "The office is missing an office-role.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6207,7 +6024,7 @@ class OfficesHaveValidOfficeRoleTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "The office is missing an office-role.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6230,7 +6047,7 @@ class OfficesHaveValidOfficeRoleTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "The office has more than one office-role.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off1")
@@ -6248,7 +6065,7 @@ class OfficesHaveValidOfficeRoleTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "The office has invalid office-role ''.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6266,7 +6083,7 @@ class OfficesHaveValidOfficeRoleTest(absltest.TestCase):
     element = etree.fromstring(test_string)
     with self.assertRaises(loggers.ElectionError) as cm:
       self.offices_validator.check(element)
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      "The office has invalid office-role 'invalidvalue'.")
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
                      "off2")
@@ -6303,7 +6120,7 @@ class ContestHasValidContestStageTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(etree.fromstring(root_string))
     self.assertEqual(
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
         "The contest has invalid contest-stage 'invalidconteststage'.")
     self.assertEqual(ee.exception.log_entry[0].elements[0].get("objectId"),
                      "con-2")
@@ -6475,7 +6292,7 @@ class GpUnitsHaveSingleRootTest(absltest.TestCase):
     self.assertIn(
         "GpUnits tree roots needs to be either a country or the EU region, "
         "please check the value ocd-division/country:abc.",
-        cm.exception.log_entry[0].message)
+        _first_msg(cm))
 
   def testNoRootsTreeFails(self):
     root_string = """
@@ -6498,7 +6315,7 @@ class GpUnitsHaveSingleRootTest(absltest.TestCase):
           etree.fromstring(root_string))
       self.gpunits_tree_validator.check()
     self.assertIn("GpUnits have no geo district root.",
-                  cm.exception.log_entry[0].message)
+                  _first_msg(cm))
 
 
 class GpUnitsCyclesRefsValidationTest(absltest.TestCase):
@@ -6528,7 +6345,7 @@ class GpUnitsCyclesRefsValidationTest(absltest.TestCase):
           etree.fromstring(root_string))
       self.gpunits_tree_validator.check()
     self.assertIn("Cycle detected at node",
-                  str(cm.exception.log_entry[0].message))
+                  str(_first_msg(cm)))
 
   def testValidationForValidTree(self):
     root_string = """
@@ -6586,10 +6403,12 @@ class DateOfBirthIsInPastTest(absltest.TestCase):
       self.date_of_birth_validator.check(element)
     self.assertLen(ee.exception.log_entry, 1)
     self.assertIn("The date 2100-11-11 is not in the past.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
 
-class ElectionContainsStartAndEndDatesTest(absltest.TestCase):
+class ElectionContainsStartAndEndDatesTest(
+    _SingleErrorMixin, absltest.TestCase
+):
 
   def setUp(self):
     super(ElectionContainsStartAndEndDatesTest, self).setUp()
@@ -6612,10 +6431,9 @@ class ElectionContainsStartAndEndDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.date_validator.check(etree.fromstring(election_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Election election-1 is missing a start date.",
-        ee.exception.log_entry[0].message,
     )
 
   def testElectionWithMissingEndDate(self):
@@ -6635,10 +6453,9 @@ class ElectionContainsStartAndEndDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.date_validator.check(etree.fromstring(election_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Election election-1 is missing an end date.",
-        ee.exception.log_entry[0].message,
     )
 
   def testElectionWithStartAndEndDates(self):
@@ -6738,7 +6555,7 @@ class ElectionEndDatesInThePastTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as ew:
       self.date_validator.check(etree.fromstring(election_string))
     self.assertIn(
-        "The date 2018-01-01 is in the past", ew.exception.log_entry[0].message)
+        "The date 2018-01-01 is in the past", _first_msg(ew))
 
   def testSubsequentContestIdIsPresentEndDateInPast(self):
     election_string = """
@@ -6920,7 +6737,7 @@ class ValidPartyLeadershipDatesTest(absltest.TestCase):
     """))
 
 
-class ElectionDatesSpanContestDatesTest(absltest.TestCase):
+class ElectionDatesSpanContestDatesTest(_SingleErrorMixin, absltest.TestCase):
 
   def setUp(self):
     super(ElectionDatesSpanContestDatesTest, self).setUp()
@@ -7012,12 +6829,11 @@ class ElectionDatesSpanContestDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.date_validator.check(etree.fromstring(election_report_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Contest contest-1 with start date 2023-05-19 occurs before Election"
         " election-1 with start date 2023-05-20. Election start date should be"
         " on or before any Contest start date.",
-        ee.exception.log_entry[0].message,
     )
 
   def testElectionWithContestMissingStartDate(self):
@@ -7040,12 +6856,11 @@ class ElectionDatesSpanContestDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.date_validator.check(etree.fromstring(election_report_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Contest contest-1 with end date 2023-05-31 occurs after Election"
         " election-1 with end date 2023-05-30. Election end date should be on"
         " or after any Contest end date.",
-        ee.exception.log_entry[0].message,
     )
 
   def testElectionWithInvalidContestStartDate(self):
@@ -7069,12 +6884,11 @@ class ElectionDatesSpanContestDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.date_validator.check(etree.fromstring(election_report_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Contest contest-1 with start date 2023-05-19 occurs before Election"
         " election-1 with start date 2023-05-20. Election start date should be"
         " on or before any Contest start date.",
-        ee.exception.log_entry[0].message,
     )
 
   def testElectionWithInvalidContestEndDate(self):
@@ -7098,12 +6912,11 @@ class ElectionDatesSpanContestDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.date_validator.check(etree.fromstring(election_report_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Contest contest-1 with end date 2023-05-31 occurs after Election"
         " election-1 with end date 2023-05-30. Election end date should be on"
         " or after any Contest end date.",
-        ee.exception.log_entry[0].message,
     )
 
   def testElectionWithCanceledContestEndDateAfterThanElectionEndDate(self):
@@ -7167,7 +6980,7 @@ class ElectionTypesTest(absltest.TestCase):
       )
     self.assertIn(
         "Election element has incompatible election-type values.",
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
   def testRaisesErrorIfElectionTypesIncompatiblePartisanPrimaryOpen(self):
@@ -7183,7 +6996,7 @@ class ElectionTypesTest(absltest.TestCase):
       )
     self.assertIn(
         "Election element has incompatible election-type values.",
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
   def testRaisesErrorIfElectionTypesIncompatiblePartisanPrimaryClosed(self):
@@ -7199,7 +7012,7 @@ class ElectionTypesTest(absltest.TestCase):
       )
     self.assertIn(
         "Election element has incompatible election-type values.",
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
   def testAllowsIfElectionTypesCompatible(self):
@@ -7214,7 +7027,9 @@ class ElectionTypesTest(absltest.TestCase):
     )
 
 
-class ElectionTypesAndCandidateContestTypesAreCompatibleTest(absltest.TestCase):
+class ElectionTypesAndCandidateContestTypesAreCompatibleTest(
+    _SingleErrorMixin, absltest.TestCase
+):
 
   def setUp(self):
     super(ElectionTypesAndCandidateContestTypesAreCompatibleTest, self).setUp()
@@ -7271,12 +7086,11 @@ class ElectionTypesAndCandidateContestTypesAreCompatibleTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(election)
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Election election-1 includes CandidateContest contest-1 with"
         " incompatible type(s). General elections cannot include primary"
         " contests.",
-        ee.exception.log_entry[0].message,
     )
 
   def testPrimaryElectionWithGeneralContest(self):
@@ -7320,12 +7134,11 @@ class ElectionTypesAndCandidateContestTypesAreCompatibleTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(election)
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Election election-1 includes CandidateContest contest-1 with"
         " incompatible type(s). Primary elections cannot include general"
         " contests.",
-        ee.exception.log_entry[0].message,
     )
 
   def testPrimaryElectionWithPrimaryContests(self):
@@ -7448,7 +7261,7 @@ class DateStatusTest(absltest.TestCase):
     self.assertIn(
         "All contests on election el_1 have a date status of confirmed, but "
         "the election has a date status of postponed.",
-        ew.exception.log_entry[0].message)
+        _first_msg(ew))
 
   def testConfirmedElectionWithCanceledContests(self):
     contest_collection = self.contest_collection.format("canceled", "canceled")
@@ -7458,7 +7271,7 @@ class DateStatusTest(absltest.TestCase):
     self.assertIn(
         "All contests on election el_1 have a date status of canceled, but "
         "the election has a date status of confirmed.",
-        ew.exception.log_entry[0].message)
+        _first_msg(ew))
 
   def testContestsWithDifferentStatuses(self):
     contest_collection = self.contest_collection.format("confirmed", "canceled")
@@ -7468,7 +7281,7 @@ class DateStatusTest(absltest.TestCase):
     self.assertIn(
         "There are multiple date statuses present for the contests on "
         "election el_1.  This may be correct, but is an unusal case.  Please "
-        "confirm.", ei.exception.log_entry[0].message)
+        "confirm.", _first_msg(ei))
 
 
 class OfficeTermDatesTest(absltest.TestCase):
@@ -7505,7 +7318,7 @@ class OfficeTermDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as ew:
       self.date_validator.check(etree.fromstring(empty_office))
     self.assertEqual("The Office is missing a Term.",
-                     ew.exception.log_entry[0].message)
+                     _first_msg(ew))
     self.assertEqual("off1",
                      ew.exception.log_entry[0].elements[0].get("objectId"))
 
@@ -7518,9 +7331,9 @@ class OfficeTermDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.date_validator.check(etree.fromstring(office_string))
     self.assertIn("The dates (start: 2020-01-03, end: 2020-01-02) are invalid",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
     self.assertIn("The end date must be the same or after the start date.",
-                  ee.exception.log_entry[0].message)
+                  _first_msg(ee))
 
   def testRaisesWarningIfStartDateNotAssigned(self):
     office_string = """
@@ -7533,7 +7346,7 @@ class OfficeTermDatesTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as ee:
       self.date_validator.check(etree.fromstring(office_string))
     self.assertEqual("The Office is missing a Term > StartDate.",
-                     ee.exception.log_entry[0].message)
+                     _first_msg(ee))
     self.assertEqual("off1",
                      ee.exception.log_entry[0].elements[0].get("objectId"))
 
@@ -7606,7 +7419,7 @@ class RemovePersonAndOfficeHolderId60DaysAfterEndDateTest(absltest.TestCase):
         "The officeholder mandates ended more than 60 days ago. "
         "Therefore, you can remove the person and the related offices "
         "from the feed.",
-        ei.exception.log_entry[0].message)
+        _first_msg(ei))
     self.assertEqual("per0",
                      ei.exception.log_entry[0].elements[0].get("objectId"))
 
@@ -7623,7 +7436,7 @@ class RemovePersonAndOfficeHolderId60DaysAfterEndDateTest(absltest.TestCase):
         "The officeholder mandates ended more than 60 days ago. "
         "Therefore, you can remove the person and the related offices "
         "from the feed.",
-        ei.exception.log_entry[0].message)
+        _first_msg(ei))
     self.assertEqual(
         "The officeholder mandates ended more than 60 days ago. "
         "Therefore, you can remove the person and the related offices "
@@ -8015,7 +7828,7 @@ class UniqueStartDatesForOfficeRoleAndJurisdictionTest(absltest.TestCase):
     self.assertEqual(("Only one unique StartDate found for each "
                       "jurisdiction-id: ru-gpu2 and office-role: Lower house. "
                       "2020-01-02 appears 2 times."),
-                     ew.exception.log_entry[0].message)
+                     _first_msg(ew))
 
   def testAllowsDuplicatesAsLongAsDuplicatedDateIsNotOnlyDate(self):
     start_counts = {
@@ -8089,7 +7902,7 @@ class GpUnitsHaveInternationalizedNameTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionError) as cm:
       self.gpunits_intl_name_validator.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("GpUnit is required to have exactly one "
                       "InterationalizedName element."))
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
@@ -8104,10 +7917,10 @@ class GpUnitsHaveInternationalizedNameTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionError) as cm:
       self.gpunits_intl_name_validator.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("GpUnit InternationalizedName is required to have one or "
                       "more Text elements."))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag,
+    self.assertEqual(_first_tag(cm),
                      "InternationalizedName")
 
   def testInternationalizedNameNoText(self):
@@ -8121,10 +7934,10 @@ class GpUnitsHaveInternationalizedNameTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionError) as cm:
       self.gpunits_intl_name_validator.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("GpUnit InternationalizedName does not have a text "
                       "value."))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Text")
+    self.assertEqual(_first_tag(cm), "Text")
 
   def testInternationalizedNameTextValueIsWhitespace(self):
     root_string = """
@@ -8137,10 +7950,10 @@ class GpUnitsHaveInternationalizedNameTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionError) as cm:
       self.gpunits_intl_name_validator.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("GpUnit InternationalizedName does not have a text "
                       "value."))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Text")
+    self.assertEqual(_first_tag(cm), "Text")
 
   def testOneTextElementDoesNotHaveValue(self):
     root_string = """
@@ -8154,10 +7967,10 @@ class GpUnitsHaveInternationalizedNameTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionError) as cm:
       self.gpunits_intl_name_validator.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("GpUnit InternationalizedName does not have a text "
                       "value."))
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Text")
+    self.assertEqual(_first_tag(cm), "Text")
 
   def testMoreThanOneInternationalizedNameFails(self):
     root_string = """
@@ -8173,7 +7986,7 @@ class GpUnitsHaveInternationalizedNameTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionError) as cm:
       self.gpunits_intl_name_validator.check(etree.fromstring(root_string))
-    self.assertEqual(cm.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(cm),
                      ("GpUnit is required to have exactly one "
                       "InterationalizedName element."))
     self.assertEqual(cm.exception.log_entry[0].elements[0].get("objectId"),
@@ -8569,7 +8382,7 @@ class ValidateInfoUriAnnotationTest(absltest.TestCase):
       self.valid_info.check(etree.fromstring(contest_string))
     self.assertEqual(
         "logo is an invalid annotation.",
-        str(ei.exception.log_entry[0].message))
+        str(_first_msg(ei)))
 
 
 class FullTextMaxLengthTest(absltest.TestCase):
@@ -8905,7 +8718,7 @@ class ImproperCandidateContestTest(absltest.TestCase):
                       "BallotMeasureSelection elements. Similarly, Contest "
                       "con987 should be changed to a BallotMeasureContest "
                       "instead of a CandidateContest."),
-                     ew.exception.log_entry[0].message)
+                     _first_msg(ew))
 
 
 class MissingFieldsErrorTest(absltest.TestCase):
@@ -8936,7 +8749,7 @@ class MissingFieldsErrorTest(absltest.TestCase):
 
     with self.assertRaises(loggers.ElectionError) as ee:
       self.field_validator.check(etree.fromstring(person))
-    self.assertEqual(ee.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(ee),
                      "The element Person is missing field FullName//Text.")
     self.assertEqual(ee.exception.log_entry[0].elements[0].get("objectId"),
                      "123")
@@ -8958,7 +8771,7 @@ class MissingFieldsErrorTest(absltest.TestCase):
 
     with self.assertRaises(loggers.ElectionError) as ee:
       self.field_validator.check(etree.fromstring(candidate))
-    self.assertEqual(ee.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(ee),
                      "The element Candidate is missing field PersonId.")
     self.assertEqual(ee.exception.log_entry[0].elements[0].get("objectId"),
                      "123")
@@ -8978,7 +8791,7 @@ class MissingFieldsErrorTest(absltest.TestCase):
     """
     with self.assertRaises(loggers.ElectionError) as ee:
       self.field_validator.check(etree.fromstring(party))
-    self.assertEqual(ee.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(ee),
                      "The element Party is missing field PartyScopeGpUnitIds.")
 
   def testRequiredFieldIsPresent_Election(self):
@@ -8999,7 +8812,7 @@ class MissingFieldsErrorTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.field_validator.check(etree.fromstring(election))
 
-    self.assertEqual(ee.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(ee),
                      "The element Election is missing field StartDate.")
     self.assertEqual(ee.exception.log_entry[0].elements[0].get("objectId"),
                      "123")
@@ -9036,7 +8849,7 @@ class MissingFieldsWarningTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as ew:
       self.field_validator.check(etree.fromstring(candidate))
 
-    self.assertEqual(ew.exception.log_entry[0].message,
+    self.assertEqual(_first_msg(ew),
                      "The element Candidate is missing field PartyId.")
     self.assertEqual(ew.exception.log_entry[0].elements[0].get("objectId"),
                      "123")
@@ -9070,7 +8883,7 @@ class MissingFieldsInfoTest(absltest.TestCase):
       self.field_validator.check(etree.fromstring(office))
 
     self.assertEqual(
-        ew.exception.log_entry[0].message,
+        _first_msg(ew),
         "The element Office is missing field ElectoralDistrictId.")
     self.assertEqual(ew.exception.log_entry[0].elements[0].get("objectId"),
                      "123")
@@ -9169,8 +8982,8 @@ class PartySpanMultipleCountriesTest(absltest.TestCase):
         "Election//PartyCollection//Party//PartyScopeGpUnitIds")
     with self.assertRaises(loggers.ElectionWarning) as ee:
       party_validator.check(element)
-    self.assertIn("ru0001", ee.exception.log_entry[0].message)
-    self.assertIn("ru0003", ee.exception.log_entry[0].message)
+    self.assertIn("ru0001", _first_msg(ee))
+    self.assertIn("ru0003", _first_msg(ee))
 
   def testThrowWarningIfMultipleCountriesAreReferencedWithComposition(self):
     referenced_gpunits = "ru0002 ru0003"
@@ -9181,8 +8994,8 @@ class PartySpanMultipleCountriesTest(absltest.TestCase):
         "Election//PartyCollection//Party//PartyScopeGpUnitIds")
     with self.assertRaises(loggers.ElectionWarning) as ee:
       party_validator.check(element)
-    self.assertIn("ru0002", ee.exception.log_entry[0].message)
-    self.assertIn("ru0003", ee.exception.log_entry[0].message)
+    self.assertIn("ru0002", _first_msg(ee))
+    self.assertIn("ru0003", _first_msg(ee))
 
 
 class NonExecutiveOfficeShouldHaveGovernmentBodyTest(absltest.TestCase):
@@ -9215,7 +9028,7 @@ class NonExecutiveOfficeShouldHaveGovernmentBodyTest(absltest.TestCase):
     self.assertEqual(
         "Non-executive Office element is missing an ExternalIdentifier of "
         "OtherType government(al)-body.",
-        str(ei.exception.log_entry[0].message),
+        str(_first_msg(ei)),
     )
 
   def testNonExecOfficeWithGovernmentBodyIsValid(self):
@@ -9274,7 +9087,7 @@ class ExecutiveOfficeShouldNotHaveGovernmentBodyTest(absltest.TestCase):
             f"Executive Office element (roles: {office_role}) has an "
             "ExternalIdentifier of OtherType government(al)-body. Executive "
             "offices should not have government bodies.",
-            str(ee.exception.log_entry[0].message),
+            str(_first_msg(ee)),
         )
 
   def testExecutiveOfficeWithoutGovernmentBodyIsValid(self):
@@ -9316,7 +9129,7 @@ class OfficeSelectionMethodTest(absltest.TestCase):
       self.selection_validator.check(etree.fromstring(office_string))
     self.assertEqual(
         "Office element is missing its SelectionMethod.",
-        str(ew.exception.log_entry[0].message))
+        str(_first_msg(ew)))
 
 
 class SubsequentContestIdIsValidRelatedContestTest(absltest.TestCase):
@@ -9388,7 +9201,7 @@ class SubsequentContestIdIsValidRelatedContestTest(absltest.TestCase):
     self.assertIn(
         "Contest cc_123 references a subsequent contest with a different "
         "office id",
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
   def testSubsequentContestWithMismatchedPrimaryPartyIds(self):
@@ -9411,7 +9224,7 @@ class SubsequentContestIdIsValidRelatedContestTest(absltest.TestCase):
     self.assertIn(
         "Contest cc_123 references a subsequent contest with different primary "
         "party ids",
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
   def testSubsequentContestWithNoPrimaryPartyIds(self):
@@ -9442,7 +9255,7 @@ class SubsequentContestIdIsValidRelatedContestTest(absltest.TestCase):
     self.assertIn(
         "Contest cc_123 references a subsequent contest with an earlier end "
         "date.",
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
   def testSubsequentContestWithEarlierEndDateFromContest(self):
@@ -9467,7 +9280,7 @@ class SubsequentContestIdIsValidRelatedContestTest(absltest.TestCase):
     self.assertIn(
         "Contest cc_123 references a subsequent contest with an earlier end "
         "date.",
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
   def testSubsequentContestContainsOriginalInComposingContestIds(self):
@@ -9492,7 +9305,7 @@ class SubsequentContestIdIsValidRelatedContestTest(absltest.TestCase):
         "Contest cc_123 is listed as a composing contest for its subsequent "
         "contest. Two contests can be linked by SubsequentContestId or "
         "ComposingContestId, but not both.",
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
     )
 
 
@@ -9560,7 +9373,7 @@ class ComposingContestIdsTest(absltest.TestCase):
     self.assertIn(
         "Contest cc_456 is listed as a ComposingContest for more than one "
         "parent contest.  ComposingContests should be a strict hierarchy",
-        str(ee.exception.log_entry[0].message))
+        str(_first_msg(ee)))
 
   def testComposingContestWithMismatchedOfficeIds(self):
     contest_string = """
@@ -9579,7 +9392,7 @@ class ComposingContestIdsTest(absltest.TestCase):
       composing_validator.check(election_tree)
     self.assertIn(
         "Contest cc_123 and composing contest cc_456 have different office ids",
-        str(ee.exception.log_entry[0].message))
+        str(_first_msg(ee)))
 
   def testComposingContestWithMismatchedPrimaryPartyIds(self):
     contest_string = """
@@ -9598,7 +9411,7 @@ class ComposingContestIdsTest(absltest.TestCase):
       composing_validator.check(election_tree)
     self.assertIn(
         "Contest cc_123 and composing contest cc_456 have different primary "
-        "party ids", str(ee.exception.log_entry[0].message))
+        "party ids", str(_first_msg(ee)))
 
   def testComposingContestsReferenceEachOther(self):
     contest_string = """
@@ -9618,7 +9431,7 @@ class ComposingContestIdsTest(absltest.TestCase):
       composing_validator.check(election_tree)
     self.assertIn(
         "Contest cc_456 and contest cc_123 reference each other as composing "
-        "contests", str(ee.exception.log_entry[0].message))
+        "contests", str(_first_msg(ee)))
 
 
 class MultipleInternationalizedTextWithSameLanguageCodeTest(absltest.TestCase):
@@ -9646,7 +9459,7 @@ class MultipleInternationalizedTextWithSameLanguageCodeTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.election_validator.check(etree.fromstring(election_string))
     self.assertEqual(
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
         "Multiple \"en\" texts found for \"Jamaica General Election, 2022\"")
 
   def testOneTextPerLanguageCode(self):
@@ -9684,7 +9497,7 @@ class AllInternationalizedTextHaveEnVersionTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionInfo) as ee:
       self.election_validator.check(etree.fromstring(election_string))
     self.assertEqual(
-        ee.exception.log_entry[0].message,
+        _first_msg(ee),
         "No \"english\" version found for the InternationalizedText.")
 
   def testInternationalizedTextWithENVersion(self):
@@ -9702,7 +9515,7 @@ class AllInternationalizedTextHaveEnVersionTest(absltest.TestCase):
     self.election_validator.check(etree.fromstring(election_string))
 
 
-class ContestContainsValidStartDateTest(absltest.TestCase):
+class ContestContainsValidStartDateTest(_SingleErrorMixin, absltest.TestCase):
 
   def setUp(self):
     super(ContestContainsValidStartDateTest, self).setUp()
@@ -9737,10 +9550,9 @@ class ContestContainsValidStartDateTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as warning:
       self.contest_validator.check(etree.fromstring(contest_string))
 
-    self.assertLen(warning.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        warning,
         "The date {} is in the past.".format(start_date),
-        warning.exception.log_entry[0].message,
     )
 
   def testContestWithStartDateInTheFuture(self):
@@ -9770,15 +9582,14 @@ class ContestContainsValidStartDateTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(etree.fromstring(contest_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "The StartDate text should be of the formats: yyyy-mm-dd, or yyyy, or"
         " yyyy-mm",
-        ee.exception.log_entry[0].message,
     )
 
 
-class ContestContainsValidEndDateTest(absltest.TestCase):
+class ContestContainsValidEndDateTest(_SingleErrorMixin, absltest.TestCase):
 
   def setUp(self):
     super(ContestContainsValidEndDateTest, self).setUp()
@@ -9813,10 +9624,9 @@ class ContestContainsValidEndDateTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionWarning) as warning:
       self.contest_validator.check(etree.fromstring(contest_string))
 
-    self.assertLen(warning.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        warning,
         "The date {} is in the past.".format(end_date),
-        warning.exception.log_entry[0].message,
     )
 
   def testContestWithEndDateInTheFuture(self):
@@ -9846,15 +9656,38 @@ class ContestContainsValidEndDateTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(etree.fromstring(contest_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "The EndDate text should be of the formats: yyyy-mm-dd, or yyyy, or"
         " yyyy-mm",
-        ee.exception.log_entry[0].message,
     )
 
 
-class ContestEndDateOccursAfterStartDateTest(absltest.TestCase):
+class ContestEndDateOccursAfterStartDateTest(
+    _SingleErrorMixin, absltest.TestCase
+):
+
+  # Parsed once and shared by the passing tests; the rule must not mutate them.
+  _OK_CONTEST_DATES = (
+      ("same_start_and_end_date", "2023-05-19", "2023-05-19"),
+      ("end_date_after_start_date", "2023-05-19", "2023-05-20"),
+  )
+
+  @classmethod
+  def setUpClass(cls):
+    super(ContestEndDateOccursAfterStartDateTest, cls).setUpClass()
+    contest_string = """
+      <Contest objectId="con1" type="CandidateContest">
+        <OfficeIds>office1</OfficeIds>
+        <PrimaryPartyIds>party1</PrimaryPartyIds>
+        <StartDate>{}</StartDate>
+        <EndDate>{}</EndDate>
+      </Contest>
+      """
+    cls._ok_contests = {
+        name: etree.fromstring(contest_string.format(start_date, end_date))
+        for name, start_date, end_date in cls._OK_CONTEST_DATES
+    }
 
   def setUp(self):
     super(ContestEndDateOccursAfterStartDateTest, self).setUp()
@@ -9893,51 +9726,39 @@ class ContestEndDateOccursAfterStartDateTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(etree.fromstring(contest_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         """The dates (start: {}, end: {}) are invalid.
       The end date must be the same or after the start date.""".format(
             start_date, end_date
         ),
-        ee.exception.log_entry[0].message,
     )
 
   def testContestWithSameStartAndEndDate(self):
-    start_date = self.today_date.strftime("%Y-%m-%d")
-    end_date = self.today_date.strftime("%Y-%m-%d")
-    contest_string = """
-      <Contest objectId="con1" type="CandidateContest">
-        <OfficeIds>office1</OfficeIds>
-        <PrimaryPartyIds>party1</PrimaryPartyIds>
-        <StartDate>{}</StartDate>
-        <EndDate>{}</EndDate>
-      </Contest>
-      """.format(start_date, end_date)
-
-    self.contest_validator.check(etree.fromstring(contest_string))
+    self.contest_validator.check(self._ok_contests["same_start_and_end_date"])
 
     self.assertEmpty(self.contest_validator.error_log)
 
   def testContestWithEndDateAfterStartDate(self):
-    tomorrow_date = self.today_date + datetime.timedelta(days=1)
-    start_date = self.today_date.strftime("%Y-%m-%d")
-    end_date = tomorrow_date.strftime("%Y-%m-%d")
-    contest_string = """
-      <Contest objectId="con1" type="CandidateContest">
-        <OfficeIds>office1</OfficeIds>
-        <PrimaryPartyIds>party1</PrimaryPartyIds>
-        <StartDate>{}</StartDate>
-        <EndDate>{}</EndDate>
-      </Contest>
-      """.format(start_date, end_date)
-
-    self.contest_validator.check(etree.fromstring(contest_string))
+    self.contest_validator.check(
+        self._ok_contests["end_date_after_start_date"]
+    )
 
     self.assertEmpty(self.contest_validator.error_log)
 
+  def testCheckDoesNotMutateSharedContests(self):
+    for contest in self._ok_contests.values():
+      contest_bytes = etree.tostring(contest)
+
+      self.contest_validator.check(contest)
+      self.contest_validator.check(contest)
+
+      self.assertEmpty(self.contest_validator.error_log)
+      self.assertEqual(contest_bytes, etree.tostring(contest))
+
 
 class ContestEndDateOccursBeforeSubsequentContestStartDateTest(
-    absltest.TestCase
+    _SingleErrorMixin, absltest.TestCase
 ):
 
   def setUp(self):
@@ -10093,15 +9914,16 @@ class ContestEndDateOccursBeforeSubsequentContestStartDateTest(
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(etree.fromstring(election_report_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Contest con1 with end date 2023-05-20 does not occur before subsequent"
         " contest con2 with start date 2023-05-19",
-        ee.exception.log_entry[0].message,
     )
 
 
-class ContestStartDateContainsCorrespondingEndDateTest(absltest.TestCase):
+class ContestStartDateContainsCorrespondingEndDateTest(
+    _SingleErrorMixin, absltest.TestCase
+):
 
   def setUp(self):
     super(ContestStartDateContainsCorrespondingEndDateTest, self).setUp()
@@ -10133,11 +9955,10 @@ class ContestStartDateContainsCorrespondingEndDateTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(etree.fromstring(contest_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Contest has a StartDate but is missing an EndDate. Every StartDate"
         " must have a corresponding EndDate.",
-        ee.exception.log_entry[0].message,
     )
 
   def testContestWithOnlyEndDate(self):
@@ -10152,11 +9973,10 @@ class ContestStartDateContainsCorrespondingEndDateTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(etree.fromstring(contest_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "Contest has an EndDate but is missing a StartDate. Every EndDate"
         " must have a corresponding StartDate.",
-        ee.exception.log_entry[0].message,
     )
 
   def testContestWithStartAndEndDate(self):
@@ -10174,7 +9994,9 @@ class ContestStartDateContainsCorrespondingEndDateTest(absltest.TestCase):
     self.assertEmpty(self.contest_validator.error_log)
 
 
-class CandidateContestTypesAreCompatibleTest(absltest.TestCase):
+class CandidateContestTypesAreCompatibleTest(
+    _SingleErrorMixin, absltest.TestCase
+):
 
   def setUp(self):
     super(CandidateContestTypesAreCompatibleTest, self).setUp()
@@ -10203,11 +10025,10 @@ class CandidateContestTypesAreCompatibleTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(contest_element)
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "CandidateContest contest-1 has incompatible type values. A contest"
         " cannot have both a general and primary type.",
-        ee.exception.log_entry[0].message,
     )
 
   def testContestWithGeneralAndPartisanPrimaryOpenTypes(self):
@@ -10231,11 +10052,10 @@ class CandidateContestTypesAreCompatibleTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(contest_element)
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "CandidateContest contest-1 has incompatible type values. A contest"
         " cannot have both a general and primary type.",
-        ee.exception.log_entry[0].message,
     )
 
   def testContestWithGeneralAndPartisanPrimaryClosedTypes(self):
@@ -10259,11 +10079,10 @@ class CandidateContestTypesAreCompatibleTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.contest_validator.check(contest_element)
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         "CandidateContest contest-1 has incompatible type values. A contest"
         " cannot have both a general and primary type.",
-        ee.exception.log_entry[0].message,
     )
 
   def testContestWithCompatibleTypes(self):
@@ -10288,7 +10107,9 @@ class CandidateContestTypesAreCompatibleTest(absltest.TestCase):
     self.contest_validator.check(contest_element)
 
 
-class CommitteeClassificationEndDateOccursAfterStartDateTest(absltest.TestCase):
+class CommitteeClassificationEndDateOccursAfterStartDateTest(
+    _SingleErrorMixin, absltest.TestCase
+):
 
   def setUp(self):
     super(CommitteeClassificationEndDateOccursAfterStartDateTest, self).setUp()
@@ -10325,13 +10146,12 @@ class CommitteeClassificationEndDateOccursAfterStartDateTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as ee:
       self.validator.check(etree.fromstring(committee_string))
 
-    self.assertLen(ee.exception.log_entry, 1)
-    self.assertEqual(
+    self._assert_single_error(
+        ee,
         """The dates (start: {}, end: {}) are invalid.
       The end date must be the same or after the start date.""".format(
             start_date, end_date
         ),
-        ee.exception.log_entry[0].message,
     )
 
   def testCommitteeClassificationWithSameStartAndEndDate(self):
@@ -10368,6 +10188,22 @@ class CommitteeClassificationEndDateOccursAfterStartDateTest(absltest.TestCase):
 
 class EinMatchesFormatTest(absltest.TestCase):
 
+  @classmethod
+  def setUpClass(cls):
+    super(EinMatchesFormatTest, cls).setUpClass()
+    # Shared across tests; the rule must not mutate it.
+    cls._valid_ein_committee = etree.fromstring("""
+      <Committee>
+        <ExternalIdentifiers>
+          <ExternalIdentifier>
+            <Type>other</Type>
+            <OtherType>ein</OtherType>
+            <Value>12-3456789</Value>
+          </ExternalIdentifier>
+        </ExternalIdentifiers>
+      </Committee>
+    """)
+
   def setUp(self):
     super(EinMatchesFormatTest, self).setUp()
     self.root_string = """
@@ -10385,10 +10221,7 @@ class EinMatchesFormatTest(absltest.TestCase):
     self.ein_id_validator = rules.EinMatchesFormat(None, None)
 
   def testValidEinID(self):
-    test_string = self.root_string.format(
-        "other", self.ein_string, "12-3456789"
-    )
-    self.ein_id_validator.check(etree.fromstring(test_string))
+    self.ein_id_validator.check(self._valid_ein_committee)
 
   def testInvalidEinID(self):
     test_string = self.root_string.format(
@@ -10397,10 +10230,10 @@ class EinMatchesFormatTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.ein_id_validator.check(etree.fromstring(test_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "EIN id 'cand-2013-va-obama!' is not in the correct format.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Committee")
+    self.assertEqual(_first_tag(cm), "Committee")
 
   def testEmptyEinIDFails(self):
     test_string = self.root_string.format("other", self.ein_string, "   ")
@@ -10408,10 +10241,10 @@ class EinMatchesFormatTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.ein_id_validator.check(etree.fromstring(test_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "EIN id '   ' is not in the correct format.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Committee")
+    self.assertEqual(_first_tag(cm), "Committee")
 
 
 class AffiliationHasEitherPartyOrPersonTest(absltest.TestCase):
@@ -10444,10 +10277,10 @@ class AffiliationHasEitherPartyOrPersonTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.affiliation_validator.check(etree.fromstring(test_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Affiliation must have one of: PartyId, PersonId. Cannot include both.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Affiliation")
+    self.assertEqual(_first_tag(cm), "Affiliation")
 
   def testEmptyAffiliation(self):
     test_string = """
@@ -10460,10 +10293,10 @@ class AffiliationHasEitherPartyOrPersonTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.affiliation_validator.check(etree.fromstring(test_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Affiliation must have one of: PartyId, PersonId. Cannot include both.",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Affiliation")
+    self.assertEqual(_first_tag(cm), "Affiliation")
 
 
 class EmptyAbbreviationTest(absltest.TestCase):
@@ -10484,7 +10317,7 @@ class EmptyAbbreviationTest(absltest.TestCase):
       self.validator.check(etree.fromstring(test_string))
 
     self.assertEqual(
-        cm.exception.log_entry[0].message, "Empty party abbreviation found"
+        _first_msg(cm), "Empty party abbreviation found"
     )
 
   def testEmptyStringPartyAbbreviation(self):
@@ -10499,7 +10332,7 @@ class EmptyAbbreviationTest(absltest.TestCase):
       self.validator.check(etree.fromstring(test_string))
 
     self.assertEqual(
-        cm.exception.log_entry[0].message, "Empty party abbreviation found"
+        _first_msg(cm), "Empty party abbreviation found"
     )
 
   def testGoodAbbreviation(self):
@@ -10522,6 +10355,19 @@ class EmptyAbbreviationTest(absltest.TestCase):
     self.validator.check(etree.fromstring(test_string))
 
 
+def _wrap_in_election_report(fragments):
+  """Parses the given XML fragments as children of a single ElectionReport."""
+  return etree.fromstring(
+      '<ElectionReport xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+      "{}</ElectionReport>".format("".join(fragments))
+  )
+
+
+def _check_ok_cases(rule_cls, cases, schema):
+  """Wraps passing fragments in a single ElectionReport and checks it once."""
+  rule_cls(_wrap_in_election_report(cases), schema).check()
+
+
 class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
   _base_schema = etree.fromstring(b"""<?xml version="1.0" encoding="UTF-8"?>
     <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
@@ -10547,7 +10393,7 @@ class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
       ).check()
 
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "GpUnit with object id gpunit-id is not referenced by anything"
         " else in the feed. This is ok for top-level GpUnits that"
         " contain others; please ensure this GpUnit is still required in"
@@ -10565,7 +10411,7 @@ class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
       ).check()
 
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Element of type GpUnit with object id gpunit-id is not referenced by"
         " anything else in the feed.",
     )
@@ -10581,7 +10427,7 @@ class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
       ).check()
 
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Element of type Office with object id office-id is not referenced by"
         " anything else in the feed.",
     )
@@ -10600,9 +10446,8 @@ class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
         etree.fromstring(test_string), self._base_schema
     ).check()
 
-  def testReferencedOfficeOk(self):
-    test_string = """
-    <ElectionReport xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+  def testReferencedEntitiesOk(self):
+    referenced_office = """
       <Election objectId="election-id">
         <ContestCollection>
           <Contest objectId="ballot-measure-contest-id" xsi:type="BallotMeasureContest">
@@ -10614,26 +10459,12 @@ class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
         <Office objectId="office-id">
         </Office>
       </OfficeCollection>
-    </ElectionReport>
     """
-
-    schema_string = """
-    <xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
-      <xs:element minOccurs="0" name="OfficeIds" type="xs:IDREFS" />
-    </xs:schema>
-  """
-
-    rules.UnreferencedEntitiesElectionDates(
-        etree.fromstring(test_string), etree.fromstring(schema_string)
-    ).check()
-
-  def testExternalIdReferencedGpUnitOk(self):
-    test_string = """
-    <ElectionReport xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
-      <Election objectId="election-id">
+    external_id_referenced_gpunit = """
+      <Election objectId="election-id-2">
         <ContestCollection>
-          <Contest objectId="ballot-measure-contest-id" xsi:type="BallotMeasureContest">
-            <OfficeIds>office-id</OfficeIds>
+          <Contest objectId="ballot-measure-contest-id-2" xsi:type="BallotMeasureContest">
+            <OfficeIds>office-id-2</OfficeIds>
           </Contest>
         </ContestCollection>
       </Election>
@@ -10642,7 +10473,7 @@ class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
         </GpUnit>
       </GpUnitCollection>
       <OfficeCollection>
-        <Office objectId="office-id">
+        <Office objectId="office-id-2">
           <ExternalIdentifiers>
             <ExternalIdentifier>
               <Type>other</Type>
@@ -10652,7 +10483,6 @@ class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
           </ExternalIdentifiers>
         </Office>
       </OfficeCollection>
-    </ElectionReport>
     """
 
     schema_string = """
@@ -10661,9 +10491,11 @@ class UnreferencedEntitiesElectionDatesTest(absltest.TestCase):
     </xs:schema>
   """
 
-    rules.UnreferencedEntitiesElectionDates(
-        etree.fromstring(test_string), etree.fromstring(schema_string)
-    ).check()
+    _check_ok_cases(
+        rules.UnreferencedEntitiesElectionDates,
+        [referenced_office, external_id_referenced_gpunit],
+        etree.fromstring(schema_string),
+    )
 
 
 class UnreferencedEntitiesOfficeholdersTest(absltest.TestCase):
@@ -10691,7 +10523,7 @@ class UnreferencedEntitiesOfficeholdersTest(absltest.TestCase):
       ).check()
 
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "GpUnit with object id gpunit-id is not referenced by anything"
         " else in the feed. This is ok for top-level GpUnits that"
         " contain others; please ensure this GpUnit is still required in"
@@ -10709,7 +10541,7 @@ class UnreferencedEntitiesOfficeholdersTest(absltest.TestCase):
       ).check()
 
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Element of type GpUnit with object id gpunit-id is not referenced by"
         " anything else in the feed.",
     )
@@ -10725,7 +10557,7 @@ class UnreferencedEntitiesOfficeholdersTest(absltest.TestCase):
       ).check()
 
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Element of type Person with object id person-id is not referenced by"
         " anything else in the feed.",
     )
@@ -10741,26 +10573,32 @@ class UnreferencedEntitiesOfficeholdersTest(absltest.TestCase):
       ).check()
 
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Element of type Party with object id party-id is not"
         " referenced by anything else in the feed. This is only ok if"
         " there are explicit instructions to include this entity anyways.",
     )
 
-  def testUnreferencedTopLevelOfficeOk(self):
-    test_string = """
+  def testUnreferencedTopLevelEntitiesOk(self):
+    unreferenced_office = """
     <Office objectId="office-id">
     </Office>
     """
+    unreferenced_party_leadership = """
+    <Leadership objectId="leadership-id">
+    </Leadership>
+    """
 
-    rules.UnreferencedEntitiesOfficeholders(
-        etree.fromstring(test_string), self._base_schema
-    ).check()
+    _check_ok_cases(
+        rules.UnreferencedEntitiesOfficeholders,
+        [unreferenced_office, unreferenced_party_leadership],
+        self._base_schema,
+    )
 
-  def testUnreferencedPartyLeadershipOk(self):
+  def testUnreferencedRootLevelOfficeOk(self):
     test_string = """
-    <Leadership objectId="leadership-id">
-    </Leadership>
+    <Office objectId="office-id">
+    </Office>
     """
 
     rules.UnreferencedEntitiesOfficeholders(
@@ -10834,348 +10672,373 @@ class FeedTypeHasValidFeedLongevityTest(absltest.TestCase):
     with self.assertRaises(loggers.ElectionError) as cm:
       self.validator.check(etree.fromstring(feed_string))
     self.assertEqual(
-        cm.exception.log_entry[0].message,
+        _first_msg(cm),
         "Feed type pre-election has invalid feed longevity evergreen. Valid"
         " feed longevities for this type are ['limited', 'yearly']",
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Feed")
+    self.assertEqual(_first_tag(cm), "Feed")
 
 
-class FeedIdsAreUniqueTest(absltest.TestCase):
-
-  def setUp(self):
-    super(FeedIdsAreUniqueTest, self).setUp()
-    self.validator = rules.FeedIdsAreUnique(None, None)
+# Feeds whose FeedIds and SourceDirPaths are all distinct. Shared by the
+# positive cases of both uniqueness rules, including Feeds missing either
+# value, which must be skipped.
+_UNIQUE_FEEDS = b"""
+    <FeedCollection>
+      <Feed>
+        <FeedId>111</FeedId>
+        <SourceDirPath>test_path_1</SourceDirPath>
+      </Feed>
+      <Feed>
+        <FeedId>222</FeedId>
+        <SourceDirPath>test_path_2</SourceDirPath>
+      </Feed>
+      <Feed>
+        <FeedId>333</FeedId>
+        <SourceDirPath>test_path_3</SourceDirPath>
+      </Feed>
+      <Feed>
+        <FeedId></FeedId>
+      </Feed>
+      <Feed>
+        <SourceDirPath></SourceDirPath>
+      </Feed>
+      <Feed/>
+    </FeedCollection>
+    """
+
+
+class FeedIdsAreUniqueTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "unique_feeds": _UNIQUE_FEEDS,
+      "duplicate_feed_ids": b"""
+        <FeedCollection>
+          <Feed>
+            <FeedId>111</FeedId>
+          </Feed>
+          <Feed>
+            <FeedId>222</FeedId>
+          </Feed>
+          <Feed>
+            <FeedId>111</FeedId>
+          </Feed>
+        </FeedCollection>
+        """,
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(FeedIdsAreUniqueTest, cls).setUpClass()
+    cls.validator = rules.FeedIdsAreUnique(None, None)
 
   def testUniqueFeedIds(self):
-    feed_collection_string = """
-      <FeedCollection>
-        <Feed>
-          <FeedId>111</FeedId>
-        </Feed>
-        <Feed>
-          <FeedId>222</FeedId>
-        </Feed>
-        <Feed>
-          <FeedId>333</FeedId>
-        </Feed>
-      </FeedCollection>
-      """
-
-    self.validator.check(etree.fromstring(feed_collection_string))
+    self.validator.check(self._trees["unique_feeds"])
 
   def testDuplicateFeedIds(self):
-    feed_collection_string = """
-      <FeedCollection>
-        <Feed>
-          <FeedId>111</FeedId>
-        </Feed>
-        <Feed>
-          <FeedId>222</FeedId>
-        </Feed>
-        <Feed>
-          <FeedId>111</FeedId>
-        </Feed>
-      </FeedCollection>
-      """
-    with self.assertRaises(loggers.ElectionError) as cm:
-      self.validator.check(etree.fromstring(feed_collection_string))
-    self.assertEqual(
-        "FeedId 111 appears multiple times in the metadata feed. Feed ids must"
-        " be unique.",
-        cm.exception.log_entry[0].message,
-    )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Feed")
-
-
-class SourceDirPathsAreUniqueTest(absltest.TestCase):
-
-  def setUp(self):
-    super(SourceDirPathsAreUniqueTest, self).setUp()
-    self.validator = rules.SourceDirPathsAreUnique(None, None)
+    with self.assertRaisesRegex(
+        loggers.ElectionError,
+        r"^FeedId 111 appears multiple times in the metadata feed\. Feed ids"
+        r" must be unique\.$",
+    ) as cm:
+      self.validator.check(self._trees["duplicate_feed_ids"])
+    self.assertEqual(_first_tag(cm), "Feed")
+    # The first Feed declaring the duplicated value is reported as well.
+    feeds = self._trees["duplicate_feed_ids"]
+    self.assertEqual([feeds[2], feeds[0]], cm.exception.log_entry[0].elements)
+
+
+class SourceDirPathsAreUniqueTest(_ParsedFixturesMixin, absltest.TestCase):
+
+  _FIXTURES = {
+      "unique_feeds": _UNIQUE_FEEDS,
+      "duplicate_source_dir_paths": b"""
+        <FeedCollection>
+          <Feed>
+            <SourceDirPath>test_path_1</SourceDirPath>
+          </Feed>
+          <Feed>
+            <SourceDirPath>test_path_2</SourceDirPath>
+          </Feed>
+          <Feed>
+            <SourceDirPath>test_path_1</SourceDirPath>
+          </Feed>
+        </FeedCollection>
+        """,
+  }
+
+  @classmethod
+  def setUpClass(cls):
+    super(SourceDirPathsAreUniqueTest, cls).setUpClass()
+    cls.validator = rules.SourceDirPathsAreUnique(None, None)
 
   def testUniqueSourceDirPaths(self):
-    feed_collection_string = """
-      <FeedCollection>
-        <Feed>
-          <SourceDirPath>test_path_1</SourceDirPath>
-        </Feed>
-        <Feed>
-          <SourceDirPath>test_path_2</SourceDirPath>
-        </Feed>
-        <Feed>
-          <SourceDirPath>test_path_3</SourceDirPath>
-        </Feed>
-      </FeedCollection>
-      """
-
-    self.validator.check(etree.fromstring(feed_collection_string))
+    self.validator.check(self._trees["unique_feeds"])
 
   def testDuplicateSourceDirPaths(self):
-    feed_collection_string = """
-      <FeedCollection>
-        <Feed>
-          <SourceDirPath>test_path_1</SourceDirPath>
-        </Feed>
-        <Feed>
-          <SourceDirPath>test_path_2</SourceDirPath>
-        </Feed>
-        <Feed>
-          <SourceDirPath>test_path_1</SourceDirPath>
-        </Feed>
-      </FeedCollection>
-      """
-    with self.assertRaises(loggers.ElectionError) as cm:
-      self.validator.check(etree.fromstring(feed_collection_string))
-    self.assertEqual(
-        "SourceDirPath test_path_1 appears multiple times in the metadata feed."
-        " SourceDirPaths must be unique.",
-        cm.exception.log_entry[0].message,
-    )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Feed")
-
-
-class ElectionEventDatesAreSequentialTest(absltest.TestCase):
-
-  def setUp(self):
-    super(ElectionEventDatesAreSequentialTest, self).setUp()
-    self.validator = rules.ElectionEventDatesAreSequential(None, None)
+    with self.assertRaisesRegex(
+        loggers.ElectionError,
+        r"^SourceDirPath test_path_1 appears multiple times in the metadata"
+        r" feed\. SourceDirPaths must be unique\.$",
+    ) as cm:
+      self.validator.check(self._trees["duplicate_source_dir_paths"])
+    self.assertEqual(_first_tag(cm), "Feed")
+    # The first Feed declaring the duplicated value is reported as well.
+    feeds = self._trees["duplicate_source_dir_paths"]
+    self.assertEqual([feeds[2], feeds[0]], cm.exception.log_entry[0].elements)
+
+
+class ElectionEventDatesAreSequentialTest(
+    _ParsedFixturesMixin, parameterized.TestCase
+):
 
-  def testSequentialStartAndEndDates(self):
-    election_event_string = """
+  _FIXTURES = {
+      "sequential_start_and_end_dates": b"""
+        <ElectionEvent>
+          <StartDate>2024-01-01</StartDate>
+          <EndDate>2024-01-02</EndDate>
+        </ElectionEvent>
+        """,
+      "invalid_start_and_end_dates": b"""
+        <ElectionEvent>
+          <StartDate>2024-01-02</StartDate>
+          <EndDate>2024-01-01</EndDate>
+        </ElectionEvent>
+        """,
+  }
+
+  # An ElectionEvent with an earlier date followed by FullDeliveryDate.
+  _FULL_DELIVERY_TEMPLATE = """
       <ElectionEvent>
-        <StartDate>2024-01-01</StartDate>
-        <EndDate>2024-01-02</EndDate>
+        <{0}>{1}</{0}>
+        <FullDeliveryDate>{2}</FullDeliveryDate>
       </ElectionEvent>
       """
 
-    self.validator.check(etree.fromstring(election_event_string))
+  @classmethod
+  def setUpClass(cls):
+    super(ElectionEventDatesAreSequentialTest, cls).setUpClass()
+    cls.validator = rules.ElectionEventDatesAreSequential(None, None)
 
-  def testInvalidStartAndEndDates(self):
-    election_event_string = """
-      <ElectionEvent>
-        <StartDate>2024-01-02</StartDate>
-        <EndDate>2024-01-01</EndDate>
-      </ElectionEvent>
-      """
+  def testSequentialStartAndEndDates(self):
+    self.validator.check(self._trees["sequential_start_and_end_dates"])
 
+  def testInvalidStartAndEndDates(self):
     with self.assertRaises(loggers.ElectionError):
-      self.validator.check(etree.fromstring(election_event_string))
-
-  def testInvalidStartAndFullDeliveryDates(self):
-    election_event_string = """
-      <ElectionEvent>
-        <StartDate>2024-01-01</StartDate>
-        <FullDeliveryDate>2024-01-02</FullDeliveryDate>
-      </ElectionEvent>
-      """
-
-    with self.assertRaises(loggers.ElectionError) as cm:
-      self.validator.check(etree.fromstring(election_event_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "StartDate is older than FullDeliveryDate",
+      self.validator.check(self._trees["invalid_start_and_end_dates"])
+
+  @parameterized.named_parameters(
+      (
+          "StartDate",
+          "StartDate",
+          "2024-01-01",
+          "2024-01-02",
+          r"^StartDate is older than FullDeliveryDate$",
+      ),
+      (
+          "InitialDeliveryDate",
+          "InitialDeliveryDate",
+          "2024-01-02",
+          "2024-01-01",
+          r"^FullDeliveryDate is older than InitialDeliveryDate$",
+      ),
+  )
+  def testInvalidFullDeliveryDate(
+      self, other_tag, other_date, full_delivery_date, expected_regex
+  ):
+    election_event = etree.fromstring(
+        self._FULL_DELIVERY_TEMPLATE.format(
+            other_tag, other_date, full_delivery_date
+        ),
+        _FIXTURE_PARSER,
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "ElectionEvent")
+    with self.assertRaisesRegex(loggers.ElectionError, expected_regex) as cm:
+      self.validator.check(election_event)
+    self.assertEqual(_first_tag(cm), "ElectionEvent")
 
-  def testInvalidInitialAndFullDeliveryDates(self):
-    election_event_string = """
-      <ElectionEvent>
-        <InitialDeliveryDate>2024-01-02</InitialDeliveryDate>
-        <FullDeliveryDate>2024-01-01</FullDeliveryDate>
-      </ElectionEvent>
-      """
 
-    with self.assertRaises(loggers.ElectionError) as cm:
-      self.validator.check(etree.fromstring(election_event_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "FullDeliveryDate is older than InitialDeliveryDate",
-    )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "ElectionEvent")
+class NoSourceDirPathBeforeInitialDeliveryDateTest(
+    _ParsedFixturesMixin, absltest.TestCase
+):
 
+  _FIXTURES = {
+      "initial_delivery_date_in_past": b"""
+        <Feed>
+          <SourceDirPath>test_path_1</SourceDirPath>
+          <ElectionEventCollection>
+            <ElectionEvent>
+              <InitialDeliveryDate>2023-12-01</InitialDeliveryDate>
+            </ElectionEvent>
+          </ElectionEventCollection>
+          <OfficeHolderSubFeed>
+            <InitialDeliveryDate>2027-01-02</InitialDeliveryDate>
+          </OfficeHolderSubFeed>
+        </Feed>
+        """,
+      "no_initial_delivery_date": b"""
+        <Feed>
+          <SourceDirPath>test_path_1</SourceDirPath>
+        </Feed>
+        """,
+      "all_initial_delivery_dates_in_future": b"""
+        <Feed>
+          <SourceDirPath>test_path_1</SourceDirPath>
+          <ElectionEventCollection>
+            <ElectionEvent>
+              <InitialDeliveryDate>2027-12-01</InitialDeliveryDate>
+            </ElectionEvent>
+          </ElectionEventCollection>
+          <OfficeHolderSubFeed>
+            <InitialDeliveryDate>2027-01</InitialDeliveryDate>
+          </OfficeHolderSubFeed>
+        </Feed>
+        """,
+  }
 
-class NoSourceDirPathBeforeInitialDeliveryDateTest(absltest.TestCase):
+  @classmethod
+  def setUpClass(cls):
+    super(NoSourceDirPathBeforeInitialDeliveryDateTest, cls).setUpClass()
+    cls.validator = rules.NoSourceDirPathBeforeInitialDeliveryDate(None, None)
 
   def setUp(self):
     super(NoSourceDirPathBeforeInitialDeliveryDateTest, self).setUp()
-    self.validator = rules.NoSourceDirPathBeforeInitialDeliveryDate(None, None)
+    # Only the rule reads today's date, so pin it there rather than freezing
+    # time process-wide.
+    patcher = patch.object(rules, "datetime")
+    mock_datetime = patcher.start()
+    self.addCleanup(patcher.stop)
+    mock_datetime.date.today.return_value = datetime.date(2024, 8, 26)
 
-  @freezegun.freeze_time("2024-08-26")
   def testInitialDeliveryDateInPast(self):
-    feed_string = """
-      <Feed>
-        <SourceDirPath>test_path_1</SourceDirPath>
-        <ElectionEventCollection>
-          <ElectionEvent>
-            <InitialDeliveryDate>2023-12-01</InitialDeliveryDate>
-          </ElectionEvent>
-        </ElectionEventCollection>
-        <OfficeHolderSubFeed>
-          <InitialDeliveryDate>2027-01-02</InitialDeliveryDate>
-        </OfficeHolderSubFeed>
-      </Feed>
-      """
-
-    self.validator.check(etree.fromstring(feed_string))
+    self.validator.check(self._trees["initial_delivery_date_in_past"])
 
-  @freezegun.freeze_time("2024-08-26")
   def testNoInitialDeliveryDate(self):
-    feed_string = """
-      <Feed>
-        <SourceDirPath>test_path_1</SourceDirPath>
-      </Feed>
-      """
+    self.validator.check(self._trees["no_initial_delivery_date"])
 
-    self.validator.check(etree.fromstring(feed_string))
-
-  @freezegun.freeze_time("2024-08-26")
   def testAllInitialDeliveryDateInFutureReturnsError(self):
-    feed_string = """
-      <Feed>
-        <SourceDirPath>test_path_1</SourceDirPath>
-        <ElectionEventCollection>
-          <ElectionEvent>
-            <InitialDeliveryDate>2027-12-01</InitialDeliveryDate>
-          </ElectionEvent>
-        </ElectionEventCollection>
-        <OfficeHolderSubFeed>
-          <InitialDeliveryDate>2027-01</InitialDeliveryDate>
-        </OfficeHolderSubFeed>
-      </Feed>
-      """
+    with self.assertRaisesRegex(
+        loggers.ElectionWarning,
+        r"^SourceDirPath is defined but all initialDeliveryDate are in the"
+        r" future\.$",
+    ) as cm:
+      self.validator.check(self._trees["all_initial_delivery_dates_in_future"])
+    self.assertEqual(_first_tag(cm), "Feed")
 
-    with self.assertRaises(loggers.ElectionWarning) as cm:
-      self.validator.check(etree.fromstring(feed_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "SourceDirPath is defined but all initialDeliveryDate are in the"
-        " future.",
-    )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Feed")
 
+class OfficeHolderSubFeedDatesAreSequentialTest(
+    _ParsedFixturesMixin, absltest.TestCase
+):
 
-class OfficeHolderSubFeedDatesAreSequentialTest(absltest.TestCase):
+  _FIXTURES = {
+      "sequential_initial_and_full_delivery_dates": b"""
+        <OfficeHolderSubFeed>
+          <InitialDeliveryDate>2024-01-01</InitialDeliveryDate>
+          <FullDeliveryDate>2024-01-02</FullDeliveryDate>
+        </OfficeHolderSubFeed>
+        """,
+      "invalid_initial_and_full_delivery_dates": b"""
+        <OfficeHolderSubFeed>
+          <InitialDeliveryDate>2024-01-02</InitialDeliveryDate>
+          <FullDeliveryDate>2024-01-01</FullDeliveryDate>
+        </OfficeHolderSubFeed>
+        """,
+  }
 
-  def setUp(self):
-    super(OfficeHolderSubFeedDatesAreSequentialTest, self).setUp()
-    self.validator = rules.OfficeHolderSubFeedDatesAreSequential(None, None)
+  @classmethod
+  def setUpClass(cls):
+    super(OfficeHolderSubFeedDatesAreSequentialTest, cls).setUpClass()
+    cls.validator = rules.OfficeHolderSubFeedDatesAreSequential(None, None)
 
   def testSequentialInitialAndFullDeliveryDates(self):
-    office_holder_sub_feed_string = """
-      <OfficeHolderSubFeed>
-        <InitialDeliveryDate>2024-01-01</InitialDeliveryDate>
-        <FullDeliveryDate>2024-01-02</FullDeliveryDate>
-      </OfficeHolderSubFeed>
-      """
-
-    self.validator.check(etree.fromstring(office_holder_sub_feed_string))
-
-  def testInvalidInitialAndFullDeliveryDates(self):
-    office_holder_sub_feed_string = """
-      <OfficeHolderSubFeed>
-        <InitialDeliveryDate>2024-01-02</InitialDeliveryDate>
-        <FullDeliveryDate>2024-01-01</FullDeliveryDate>
-      </OfficeHolderSubFeed>
-      """
-
-    with self.assertRaises(loggers.ElectionError) as cm:
-      self.validator.check(etree.fromstring(office_holder_sub_feed_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "FullDeliveryDate is older than InitialDeliveryDate",
+    self.validator.check(
+        self._trees["sequential_initial_and_full_delivery_dates"]
     )
-    self.assertEqual(
-        cm.exception.log_entry[0].elements[0].tag, "OfficeHolderSubFeed"
-    )
-
-
-class FeedHasValidCountryCodeTest(absltest.TestCase):
-
-  def setUp(self):
-    super(FeedHasValidCountryCodeTest, self).setUp()
-    self.validator = rules.FeedHasValidCountryCode(None, None)
 
-  def testValidCountryCode(self):
-    feed_string = """
-      <Feed>
-        <CountryCode>US</CountryCode>
-      </Feed>
-      """
+  def testInvalidInitialAndFullDeliveryDates(self):
+    with self.assertRaisesRegex(
+        loggers.ElectionError,
+        r"^FullDeliveryDate is older than InitialDeliveryDate$",
+    ) as cm:
+      self.validator.check(
+          self._trees["invalid_initial_and_full_delivery_dates"]
+      )
+    self.assertEqual(_first_tag(cm), "OfficeHolderSubFeed")
 
-    self.validator.check(etree.fromstring(feed_string))
 
-  def testValidElectionDates(self):
-    feed_string = """
-      <Feed>
-        <FeedType>election-dates</FeedType>
-      </Feed>
-      """
+class FeedHasValidCountryCodeTest(parameterized.TestCase):
 
-    self.validator.check(etree.fromstring(feed_string))
+  _FEED_TEMPLATE = "<Feed>{}</Feed>"
 
-  def testInvalidCountryCode(self):
-    feed_string = """
-      <Feed>
-        <CountryCode>XX</CountryCode>
-      </Feed>
-      """
+  @classmethod
+  def setUpClass(cls):
+    super(FeedHasValidCountryCodeTest, cls).setUpClass()
+    cls.validator = rules.FeedHasValidCountryCode(None, None)
 
-    with self.assertRaises(loggers.ElectionError) as cm:
-      self.validator.check(etree.fromstring(feed_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "Invalid country code XX.",
+  @parameterized.named_parameters(
+      ("ValidCountryCode", "<CountryCode>US</CountryCode>"),
+      ("ValidElectionDates", "<FeedType>election-dates</FeedType>"),
+  )
+  def testValidFeed(self, feed_children):
+    self.validator.check(
+        etree.fromstring(self._FEED_TEMPLATE.format(feed_children))
     )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Feed")
-
-  def testMissingCountryCode(self):
-    feed_string = """
-      <Feed>
-        <FeedId>test-feed</FeedId>
-        <FeedType>pre-election</FeedType>
-      </Feed>
-      """
 
+  @parameterized.named_parameters(
+      (
+          "InvalidCountryCode",
+          "<CountryCode>XX</CountryCode>",
+          "Invalid country code XX.",
+      ),
+      (
+          "MissingCountryCode",
+          "<FeedId>test-feed</FeedId><FeedType>pre-election</FeedType>",
+          "Feed test-feed is missing CountryCode.",
+      ),
+  )
+  def testInvalidFeed(self, feed_children, expected_message):
     with self.assertRaises(loggers.ElectionError) as cm:
-      self.validator.check(etree.fromstring(feed_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "Feed test-feed is missing CountryCode.",
-    )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Feed")
+      self.validator.check(
+          etree.fromstring(self._FEED_TEMPLATE.format(feed_children))
+      )
+    self.assertEqual(_first_msg(cm), expected_message)
+    self.assertEqual(_first_tag(cm), "Feed")
 
 
-class FeedInactiveDateSetForNonEvergreenFeedTest(absltest.TestCase):
+class FeedInactiveDateSetForNonEvergreenFeedTest(
+    _ParsedFixturesMixin, absltest.TestCase
+):
 
-  def setUp(self):
-    super(FeedInactiveDateSetForNonEvergreenFeedTest, self).setUp()
-    self.validator = rules.FeedInactiveDateSetForNonEvergreenFeed(None, None)
+  _FIXTURES = {
+      "evergreen_feed_without_inactive_date": b"""
+        <Feed>
+          <FeedLongevity>evergreen</FeedLongevity>
+        </Feed>
+        """,
+      "non_evergreen_feed_without_inactive_date": b"""
+        <Feed>
+          <FeedId>test-feed</FeedId>
+          <FeedLongevity>pre-election</FeedLongevity>
+        </Feed>
+        """,
+  }
 
-  def testEvergreenFeedWithoutInactiveDate(self):
-    feed_string = """
-      <Feed>
-        <FeedLongevity>evergreen</FeedLongevity>
-      </Feed>
-      """
+  @classmethod
+  def setUpClass(cls):
+    super(FeedInactiveDateSetForNonEvergreenFeedTest, cls).setUpClass()
+    cls.validator = rules.FeedInactiveDateSetForNonEvergreenFeed(None, None)
 
-    self.validator.check(etree.fromstring(feed_string))
+  def testEvergreenFeedWithoutInactiveDate(self):
+    self.validator.check(self._trees["evergreen_feed_without_inactive_date"])
 
   def testEvergreenFeedWithInactiveDate(self):
-    feed_string = """
-      <Feed>
-        <FeedId>test-feed</FeedId>
-        <FeedLongevity>pre-election</FeedLongevity>
-      </Feed>
-      """
-    with self.assertRaises(loggers.ElectionError) as cm:
-      self.validator.check(etree.fromstring(feed_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "FeedInactiveDate is not set for non-evergreen feed with FeedId"
-        " test-feed.",
-    )
-    self.assertEqual(cm.exception.log_entry[0].elements[0].tag, "Feed")
+    with self.assertRaisesRegex(
+        loggers.ElectionError,
+        r"^FeedInactiveDate is not set for non-evergreen feed with FeedId"
+        r" test-feed\.$",
+    ) as cm:
+      self.validator.check(
+          self._trees["non_evergreen_feed_without_inactive_date"]
+      )
+    self.assertEqual(_first_tag(cm), "Feed")
 
 
 class DeprecatedPartyLeadershipSchemaTest(absltest.TestCase):
@@ -11209,13 +11072,12 @@ class DeprecatedPartyLeadershipSchemaTest(absltest.TestCase):
       </Party>
       """
 
-    with self.assertRaises(loggers.ElectionWarning) as cm:
+    with self.assertRaisesRegex(
+        loggers.ElectionWarning,
+        r"^Specifying party leadership via external identifiers is deprecated\."
+        r" Please use the PartyLeadership element instead\.$",
+    ):
       self.validator.check(etree.fromstring(party_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "Specifying party leadership via external identifiers is deprecated."
-        " Please use the PartyLeadership element instead.",
-    )
 
   def testDeprecatedPartyChairSchema(self):
     party_string = """
@@ -11230,33 +11092,29 @@ class DeprecatedPartyLeadershipSchemaTest(absltest.TestCase):
       </Party>
       """
 
-    with self.assertRaises(loggers.ElectionWarning) as cm:
+    with self.assertRaisesRegex(
+        loggers.ElectionWarning,
+        r"^Specifying party leadership via external identifiers is deprecated\."
+        r" Please use the PartyLeadership element instead\.$",
+    ):
       self.validator.check(etree.fromstring(party_string))
-    self.assertEqual(
-        cm.exception.log_entry[0].message,
-        "Specifying party leadership via external identifiers is deprecated."
-        " Please use the PartyLeadership element instead.",
-    )
 
 
 class RulesTest(absltest.TestCase):
 
   def testAllRulesIncluded(self):
-    all_rules = rules.ALL_RULES
     possible_rules = self._subclasses(base.BaseRule)
-    possible_rules.remove(base.TreeRule)
-    possible_rules.remove(base.ValidReferenceRule)
-    possible_rules.remove(rules.ValidatePartyCollection)
-    possible_rules.remove(base.DateRule)
-    possible_rules.remove(base.MissingFieldRule)
-    possible_rules.remove(rules.UnreferencedEntitiesBase)
-    self.assertSetEqual(all_rules, possible_rules)
+    self.assertTrue(_ABSTRACT_RULES <= possible_rules)
+    self.assertSetEqual(rules.ALL_RULES, possible_rules - _ABSTRACT_RULES)
 
   def _subclasses(self, cls):
-    children = cls.__subclasses__()
-    subclasses = set(children)
-    for c in children:
-      subclasses.update(self._subclasses(c))
+    subclasses = set()
+    stack = [cls]
+    while stack:
+      for child in stack.pop().__subclasses__():
+        if child not in subclasses:
+          subclasses.add(child)
+          stack.append(child)
     return subclasses
 
 